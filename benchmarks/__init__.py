@@ -0,0 +1 @@
+"""Benchmarks for Stateful Scenes."""
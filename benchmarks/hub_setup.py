@@ -0,0 +1,94 @@
+"""Benchmark for hub construction with large scene files.
+
+Builds a hub for an increasing number of scenes, each backed by a scene
+entity without an explicit entity_id in its configuration, and reports the
+construction time, the memory allocated by the hub and the time to look every
+scene up by entity_id. All should grow linearly with the number of scenes.
+
+Run from the repository root with:
+
+    python -m benchmarks.hub_setup
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import time
+import tracemalloc
+
+from pytest_homeassistant_custom_component.common import async_test_home_assistant
+
+from custom_components.stateful_scenes.StatefulScenes import Hub
+
+SIZES = (1000, 2000, 5000)
+LIGHTS = 300
+
+
+def scene_confs(count: int) -> list[dict]:
+    """Return normalized scene configurations as loaded from the cache."""
+    return [
+        {
+            "id": str(i),
+            "name": f"Scene {i}",
+            "learn": False,
+            "entities": {
+                f"light.light_{i % LIGHTS}": {"state": "on", "brightness": i % 256},
+                f"light.light_{(i + 1) % LIGHTS}": {"state": "off"},
+            },
+        }
+        for i in range(count)
+    ]
+
+
+async def run(count: int) -> tuple[float, float, int, int]:
+    """Return the hub construction and lookup times and its memory use.
+
+    Times are in seconds, memory is the retained and peak allocation in bytes.
+    Memory is traced in a second construction so it does not skew the times.
+    """
+    async with async_test_home_assistant() as hass:
+        for i in range(count):
+            hass.states.async_set(
+                f"scene.scene_{i}", "scening", {"id": str(i), "friendly_name": f"S{i}"}
+            )
+        confs = scene_confs(count)
+
+        start = time.perf_counter()
+        hub = Hub(hass, confs, number_tolerance=1, validated=True)
+        setup = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for scene in hub.scenes:
+            assert hub.get_scene(scene.entity_id) is scene
+        lookups = time.perf_counter() - start
+        del hub
+
+        gc.collect()
+        tracemalloc.start()
+        hub = Hub(hass, confs, number_tolerance=1, validated=True)
+        retained, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert len(hub.scenes) == count
+
+        await hass.async_stop(force=True)
+    return setup, lookups, retained, peak
+
+
+def main() -> None:
+    """Run the benchmark and print the timings."""
+    print(
+        f"{'scenes':>7} {'setup ms':>10} {'µs/scene':>9} "
+        f"{'lookups ms':>11} {'µs/lookup':>10} {'MiB':>7} {'peak MiB':>9}"
+    )
+    for count in SIZES:
+        setup, lookups, retained, peak = asyncio.run(run(count))
+        print(
+            f"{count:7} {setup * 1000:10.1f} {setup / count * 1e6:9.1f} "
+            f"{lookups * 1000:11.2f} {lookups / count * 1e6:10.3f} "
+            f"{retained / 2**20:7.2f} {peak / 2**20:9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Microbenchmark for compiled entity matchers.
+
+Compares the per-event cost of checking an entity against its scene spec
+using the compiled EntityMatcher with the Scene.compare_values based check
+the matchers replaced.
+
+Run from the repository root with:
+
+    python -m benchmarks.matchers
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from homeassistant.core import State
+
+from custom_components.stateful_scenes.const import ATTRIBUTES_TO_CHECK
+from custom_components.stateful_scenes.matchers import EntityMatcher
+from custom_components.stateful_scenes.StatefulScenes import Scene
+
+ITERATIONS = 200_000
+TOLERANCE = 1
+
+CASES = {
+    "light on, matching": (
+        "light.living_room",
+        {"state": "on", "brightness": 255, "rgb_color": [255, 120, 0]},
+        State(
+            "light.living_room",
+            "on",
+            {
+                "brightness": 254,
+                "rgb_color": (255, 120, 1),
+                "effect": None,
+                "supported_color_modes": ["rgb"],
+                "friendly_name": "Living Room",
+            },
+        ),
+    ),
+    "light on, brightness mismatch": (
+        "light.living_room",
+        {"state": "on", "brightness": 255, "rgb_color": [255, 120, 0]},
+        State("light.living_room", "on", {"brightness": 10, "rgb_color": (0, 0, 0)}),
+    ),
+    "light off": (
+        "light.bedroom",
+        {"state": "off"},
+        State("light.bedroom", "off", {"friendly_name": "Bedroom"}),
+    ),
+    "media player": (
+        "media_player.tv",
+        {"state": "playing", "volume_level": 0.4, "source": "HDMI 1"},
+        State(
+            "media_player.tv",
+            "playing",
+            {"volume_level": 0.4, "source": "hdmi 1", "media_position": 12},
+        ),
+    ),
+}
+
+
+def legacy_check(scene: Scene, spec: dict, state: State) -> bool | None:
+    """Check a state the way Scene.async_check_state did before matchers."""
+    desired_state = spec["state"]
+    if desired_state is None:
+        return None
+    if not scene.compare_values(desired_state, state.state):
+        return False
+    if state.state == "off" and desired_state == "off":
+        return True
+    if state.domain in ATTRIBUTES_TO_CHECK:
+        entity_attrs = state.attributes
+        for attribute in ATTRIBUTES_TO_CHECK[state.domain]:
+            if attribute not in spec or attribute not in entity_attrs:
+                continue
+            if spec[attribute] is None:
+                continue
+            if not scene.compare_values(spec[attribute], entity_attrs[attribute]):
+                return False
+    return True
+
+
+def main() -> None:
+    """Run the benchmark and print the per-event timings."""
+    # compare_values only needs the tolerance, so skip the hass-bound __init__
+    scene = object.__new__(Scene)
+    scene._number_tolerance = TOLERANCE
+
+    print(f"{'case':32} {'legacy µs':>10} {'matcher µs':>11} {'speedup':>8}")
+    for name, (entity_id, spec, state) in CASES.items():
+        matcher = EntityMatcher(entity_id, spec, TOLERANCE)
+        assert matcher.match(state) == legacy_check(scene, spec, state)
+
+        legacy = timeit.timeit(
+            lambda: legacy_check(scene, spec, state), number=ITERATIONS
+        )
+        compiled = timeit.timeit(lambda: matcher.match(state), number=ITERATIONS)
+        print(
+            f"{name:32} {legacy / ITERATIONS * 1e6:10.3f} "
+            f"{compiled / ITERATIONS * 1e6:11.3f} {legacy / compiled:7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
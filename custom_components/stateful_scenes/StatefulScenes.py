@@ -1,14 +1,44 @@
 """Stateful Scenes for Home Assistant."""
 
+import asyncio
+import heapq
+import itertools
 import logging
+import time
+from collections import ChainMap, Counter, deque
+from collections.abc import Callable, Coroutine, MutableMapping
+from datetime import datetime
 from typing import Any
 
-from homeassistant.core import Event, EventStateChangedData, HomeAssistant
-from homeassistant.helpers import area_registry as ar, entity_registry as er
-from homeassistant.helpers.event import async_call_later
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Context,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.helpers import (
+    area_registry as ar,
+    device_registry as dr,
+    entity_registry as er,
+)
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_state_change_event,
+)
 from homeassistant.helpers.template.helpers import resolve_area_id
+from homeassistant.util import dt as dt_util
 from .const import (
     ATTRIBUTES_TO_CHECK,
+    COALESCE_MAX_WAIT_FACTOR,
+    DEFAULT_COALESCE_WINDOW,
+    DEFAULT_COMMAND_CONCURRENCY,
+    DEFAULT_COMMAND_RATE,
     CONF_SCENE_AREA,
     CONF_SCENE_ENTITIES,
     CONF_SCENE_ENTITY_ID,
@@ -17,14 +47,20 @@ from .const import (
     CONF_SCENE_LEARN,
     CONF_SCENE_NAME,
     CONF_SCENE_NUMBER_TOLERANCE,
+    ISSUED_CONTEXT_HISTORY,
     SceneStateAttributes,
     StatefulScenesYamlInvalid,
 )
+from .command_planner import PlannedCall, plan_apply, plan_turn_off
+from .command_scheduler import PRIORITY_RESTORE, PRIORITY_USER, CommandScheduler
 from .helpers import (
     get_icon_from_entity_id,
     get_id_from_entity_id,
     get_name_from_entity_id,
 )
+from .matchers import EntityMatcher
+from .snapshot import EntitySnapshot
+from .state_store import HubStateStore
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -39,6 +75,59 @@ def area_name(hass: HomeAssistant, entity_id: str | None) -> str | None:
     return None
 
 
+class SceneLookupContext:
+    """Memoized Home Assistant lookups for resolving scene configurations.
+
+    The registries are fetched once, and area lookups are cached for the
+    lifetime of the context, which covers a single hub construction or reload.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._area_reg = ar.async_get(hass)
+        self._entity_reg = er.async_get(hass)
+        self._device_reg = dr.async_get(hass)
+        self._device_area_ids: dict[str, str | None] = {}
+        self._area_names: dict[str, str | None] = {}
+
+    def icon(self, entity_id: str | None) -> str | None:
+        """Get the icon of an entity, like get_icon_from_entity_id."""
+        if entity_id is None:
+            return None
+        if (state := self._hass.states.get(entity_id)) is not None:
+            return state.attributes.get("icon")
+        return None
+
+    def area_name(self, entity_id: str | None) -> str | None:
+        """Get the area name of an entity, like area_name."""
+        if entity_id is None:
+            return None
+        if area := self._area_reg.async_get_area_by_name(entity_id):
+            return area.name
+
+        entry = self._entity_reg.async_get(entity_id)
+        if entry is None:
+            return None
+        area_id = entry.area_id
+        if not area_id and entry.device_id:
+            area_id = self._device_area_id(entry.device_id)
+        if area_id is None:
+            return None
+
+        if area_id not in self._area_names:
+            area = self._area_reg.async_get_area(area_id)
+            self._area_names[area_id] = area.name if area else None
+        return self._area_names[area_id]
+
+    def _device_area_id(self, device_id: str) -> str | None:
+        """Get the area_id of a device."""
+        if device_id not in self._device_area_ids:
+            device = self._device_reg.async_get(device_id)
+            self._device_area_ids[device_id] = device.area_id if device else None
+        return self._device_area_ids[device_id]
+
+
 def get_entity_id_from_id(hass: HomeAssistant, id: str) -> str:
     """Get entity_id from scene id."""
     entity_ids = hass.states.async_entity_ids("scene")
@@ -49,6 +138,133 @@ def get_entity_id_from_id(hass: HomeAssistant, id: str) -> str:
     return None
 
 
+TimerAction = Callable[[datetime], Coroutine[Any, Any, None]]
+
+
+class _TimerHandle:
+    """A timer scheduled on a SceneTimerWheel."""
+
+    __slots__ = ("action", "cancelled")
+
+    def __init__(self, action: TimerAction) -> None:
+        """Initialize."""
+        self.action = action
+        self.cancelled = False
+
+
+class SceneTimerWheel:
+    """Deadline heap shared by the scene evaluation timers of a hub.
+
+    Only a single loop timer is armed, for the earliest deadline. When it fires,
+    all expired timers are dispatched in one batch and the loop timer is armed
+    for the next deadline. Cancelled timers stay in the heap until they reach
+    the top or the heap is compacted.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, time_func: Callable[[], float] = time.monotonic
+    ) -> None:
+        """Initialize an empty wheel.
+
+        Args:
+            hass (HomeAssistant): Home Assistant instance
+            time_func (Callable[[], float]): Monotonic clock in seconds, which
+                tests can replace with a fake clock
+
+        """
+        self._hass = hass
+        self._time = time_func
+        self._heap: list[tuple[float, int, _TimerHandle]] = []
+        self._sequence = itertools.count()
+        self._cancelled = 0
+        self._cancel_loop_timer: CALLBACK_TYPE | None = None
+        self._armed_deadline: float | None = None
+
+    def monotonic(self) -> float:
+        """Return the current time of the wheel's clock."""
+        return self._time()
+
+    @property
+    def pending(self) -> int:
+        """Return the number of timers that have not fired or been cancelled."""
+        return len(self._heap) - self._cancelled
+
+    @callback
+    def async_schedule(self, delay: float, action: TimerAction) -> CALLBACK_TYPE:
+        """Run action after delay seconds and return a function to cancel it."""
+        handle = _TimerHandle(action)
+        heapq.heappush(self._heap, (self._time() + delay, next(self._sequence), handle))
+        self._async_arm()
+
+        @callback
+        def _async_cancel() -> None:
+            if handle.cancelled:
+                return
+            handle.cancelled = True
+            self._cancelled += 1
+            self._async_arm()
+
+        return _async_cancel
+
+    @callback
+    def _async_arm(self) -> None:
+        """Arm the loop timer for the earliest pending deadline."""
+        while self._heap and self._heap[0][2].cancelled:
+            heapq.heappop(self._heap)
+            self._cancelled -= 1
+        if self._cancelled > len(self._heap) // 2:
+            self._heap = [entry for entry in self._heap if not entry[2].cancelled]
+            heapq.heapify(self._heap)
+            self._cancelled = 0
+
+        deadline = self._heap[0][0] if self._heap else None
+        if deadline == self._armed_deadline:
+            return
+        if self._cancel_loop_timer is not None:
+            self._cancel_loop_timer()
+            self._cancel_loop_timer = None
+        self._armed_deadline = deadline
+        if deadline is not None:
+            self._cancel_loop_timer = async_call_later(
+                self._hass,
+                max(deadline - self._time(), 0),
+                self._async_handle_loop_timer,
+            )
+
+    async def _async_handle_loop_timer(self, _now: datetime) -> None:
+        """Handle the loop timer."""
+        self._cancel_loop_timer = None
+        self._armed_deadline = None
+        await self.async_fire_expired()
+
+    async def async_fire_expired(self) -> None:
+        """Run all timers whose deadline has passed in one batch.
+
+        An action that raises is logged and does not keep the other actions of
+        the batch from running.
+        """
+        now = self._time()
+        expired: list[_TimerHandle] = []
+        while self._heap and self._heap[0][0] <= now:
+            handle = heapq.heappop(self._heap)[2]
+            if handle.cancelled:
+                self._cancelled -= 1
+                continue
+            # Fired timers can no longer be cancelled
+            handle.cancelled = True
+            expired.append(handle)
+        self._async_arm()
+
+        if expired:
+            _LOGGER.debug("Firing %s scene evaluation timers", len(expired))
+        utc_now = dt_util.utcnow()
+        for handle in expired:
+            try:
+                await handle.action(utc_now)
+            except Exception:
+                _LOGGER.exception("Error running a scene evaluation timer")
+
+
 class SceneEvaluationTimer:
     """Manages an HA scheduled cancellable timer for transition followed by debounce."""
 
@@ -57,12 +273,18 @@ class SceneEvaluationTimer:
         hass: HomeAssistant,
         transition_time: float = 0.0,
         debounce_time: float = 0.0,
+        wheel: SceneTimerWheel | None = None,
     ) -> None:
-        """Initialize with no active timer."""
+        """Initialize with no active timer.
+
+        Timers are scheduled on the given wheel, usually the one of the hub, or
+        on a private wheel otherwise.
+        """
         self._cancel_callback = None
         self._transition_time = transition_time
         self._debounce_time = debounce_time
         self._hass = hass
+        self._wheel = wheel
 
     async def async_start(self, callback) -> None:
         """Start a new timer if we have a duration."""
@@ -74,11 +296,9 @@ class SceneEvaluationTimer:
                 total_time,
             )
 
-            self._cancel_callback = async_call_later(
-                self._hass,
-                total_time,
-                callback,
-            )
+            if self._wheel is None:
+                self._wheel = SceneTimerWheel(self._hass)
+            self._cancel_callback = self._wheel.async_schedule(total_time, callback)
 
     @property
     def transition_time(self) -> float:
@@ -118,9 +338,12 @@ class SceneEvaluationTimer:
 class Scene:
     """State scene class."""
 
-    def __init__(self, hass: HomeAssistant, scene_conf: dict) -> None:
+    def __init__(
+        self, hass: HomeAssistant, scene_conf: dict, hub: "Hub | None" = None
+    ) -> None:
         """Initialize."""
         self.hass = hass
+        self.hub = hub
         self.name: str = scene_conf[CONF_SCENE_NAME]
         self._entity_id: str = scene_conf[CONF_SCENE_ENTITY_ID]
         self._number_tolerance = scene_conf[CONF_SCENE_NUMBER_TOLERANCE]
@@ -128,6 +351,10 @@ class Scene:
         self._area_id: str = scene_conf[CONF_SCENE_AREA]
         self.learn = scene_conf[CONF_SCENE_LEARN]
         self.entities = scene_conf[CONF_SCENE_ENTITIES]
+        # Entities with all their configured attributes, for scene.apply
+        self._apply_entities: dict[str, dict[str, Any]] = scene_conf.get(
+            "apply_entities", {}
+        )
         self.icon = scene_conf[CONF_SCENE_ICON]
         self._is_on = False
         self._transition_time: float = 0.0
@@ -135,23 +362,51 @@ class Scene:
         self._debounce_time: float = 0.0
         self._ignore_unavailable = False
         self._ignore_attributes = False
+        self._minimal_activation = False
         self._off_scene_entity_id = None
+        self._timer_wheel = (
+            hub.timer_wheel if hub is not None else SceneTimerWheel(hass)
+        )
         self._scene_evaluation_timer = SceneEvaluationTimer(
-            hass, self._transition_time, self._debounce_time
+            hass,
+            self._transition_time,
+            self._debounce_time,
+            self._timer_wheel,
         )
+
+        # Trailing-edge coalescing of bursts of member updates
+        self._coalesce_window: float = DEFAULT_COALESCE_WINDOW
+        self._cancel_coalesce: CALLBACK_TYPE | None = None
+        self._coalesce_first_event = 0.0
+        self._coalesce_last_event = 0.0
+
+        # Contexts of the commands issued by the scene
+        self._issued_contexts: deque[str] = deque(maxlen=ISSUED_CONTEXT_HISTORY)
         self.callback = None
         self.callback_funcs = {}
         self.schedule_update = None
+        self._setting_listeners: dict[str, list[CALLBACK_TYPE]] = {}
         self.states = dict.fromkeys(self.entities, False)
-        self.restore_states = dict.fromkeys(self.entities)
+        self.restore_states: MutableMapping[str, EntitySnapshot | None] = dict.fromkeys(
+            self.entities
+        )
+        # Persisted snapshots, decoded when the scene first needs them
+        self._persisted_snapshots: dict[str, dict[str, Any]] | None = None
+
+        # Incremental evaluation bookkeeping over self.states
+        self._mismatched: set[str] = set(self.entities)
+        self._ignored: set[str] = set()
+        self._dirty_entities: set[str] = set()
+        self._needs_full_evaluation = True
+        self._matchers: dict[str, EntityMatcher] = {}
+        self._compile_matchers()
+        self.stats: Counter[str] = Counter()
 
         if self.learn:
             self.learned = False
 
         if self._entity_id is None:
-            self._entity_id = get_entity_id_from_id(self.hass, self._id)
-
-        hass.async_create_task(self.async_initialize())
+            self._entity_id = self._lookup_entity_id()
 
     @property
     def attributes(self) -> SceneStateAttributes:
@@ -188,28 +443,145 @@ class Scene:
         return self._area_id
 
     async def async_turn_on(self):
-        """Turn on the scene."""
+        """Turn on the scene.
+
+        Scenes owned by a hub are turned on through the hub, which merges the
+        scenes turned on in the same loop iteration into a single activation.
+        """
         if self._entity_id is None:
             raise StatefulScenesYamlInvalid(
                 "Cannot find entity_id for: " + self.name + self._entity_id
             )
 
+        if self.hub is not None:
+            await self.hub.async_request_activation(self)
+            return
+        await self.async_activate()
+
+    async def async_activate(self) -> None:
+        """Activate the scene on its own."""
+        if self._minimal_activation:
+            await self.async_turn_on_minimal()
+            return
+
         # Store the current state of the entities
-        for entity_id in self.entities:
-            await self.async_store_entity_state(entity_id)
+        await self.async_snapshot_entities()
 
         await self._scene_evaluation_timer.async_start(
             self.async_timer_evaluate_scene_state
         )
 
-        await self.hass.services.async_call(
-            domain="scene",
-            service="turn_on",
+        await self.async_call_service(
+            "scene",
+            "turn_on",
+            {"transition": self._transition_time},
             target={"entity_id": self._entity_id},
-            service_data={"transition": self._transition_time},
         )
         self._is_on = True
 
+    async def async_turn_on_minimal(self) -> None:
+        """Turn on the scene by only commanding the entities that differ.
+
+        The match results of the last evaluation decide which entities differ
+        from the scene. Those are applied with scene.apply with their full
+        activation payload, so they end up as scene.turn_on would leave them,
+        and entities that already match are not sent a command.
+        """
+        if self._needs_full_evaluation:
+            await self.async_check_all_states()
+        else:
+            await self.async_check_dirty_states()
+
+        entities = {
+            entity_id: payload
+            for entity_id in self.entities
+            if entity_id in self._mismatched
+            and (payload := self.activation_payload(entity_id)) is not None
+        }
+        saved = len(self.entities) - len(entities)
+        self.stats["minimal_activations"] += 1
+        self.stats["commands_saved"] += saved
+        _LOGGER.debug(
+            "[Scene: %s] Commanding %s entities, %s already match",
+            self.name,
+            len(entities),
+            saved,
+        )
+
+        await self.async_snapshot_entities()
+
+        await self._scene_evaluation_timer.async_start(
+            self.async_timer_evaluate_scene_state
+        )
+
+        if entities:
+            service_data: dict[str, Any] = {"entities": entities}
+            if self._transition_time is not None:
+                service_data["transition"] = self._transition_time
+            await self.async_call_service("scene", "apply", service_data)
+        self._is_on = True
+
+    def _desired_payload(self, entity_id: str) -> dict[str, Any]:
+        """Return the scene.apply payload for the desired state of an entity.
+
+        Only the state and the attributes that are checked are applied, and the
+        attributes are left out for entities that should be off.
+        """
+        spec = self.entities[entity_id]
+        payload = {"state": spec["state"]}
+        if spec["state"] == "off":
+            return payload
+        for attribute in ATTRIBUTES_TO_CHECK.get(entity_id.split(".")[0], ()):
+            if spec.get(attribute) is not None:
+                payload[attribute] = spec[attribute]
+        return payload
+
+    def activation_payload(self, entity_id: str) -> dict[str, Any] | None:
+        """Return the scene.apply payload that activates an entity.
+
+        The payload holds the entity as configured in the scenes file, with
+        all its attributes, so applying it has the same result as scene.turn_on.
+        Scenes without the full configuration, such as external scenes, fall
+        back to the checked attributes. Entities whose state is None are not
+        changed by the scene, so None is returned for them.
+        """
+        if self.entities[entity_id]["state"] is None:
+            return None
+        if (payload := self._apply_entities.get(entity_id)) is not None:
+            return dict(payload)
+        return self._desired_payload(entity_id)
+
+    async def async_prepare_merged_activation(
+        self,
+        context: Context,
+        snapshot: dict[str, EntitySnapshot | None] | None,
+    ) -> None:
+        """Prepare the scene for an activation merged with other scenes.
+
+        The merged call is issued by the hub with a context shared by the
+        scenes. The restore snapshot is taken from the snapshot shared by the
+        scenes, or from the states kept by the hub if snapshot is None.
+        """
+        self._issued_contexts.append(context.id)
+        self._persisted_snapshots = None
+        if snapshot is None and self.hub is not None:
+            self.restore_states = self.hub.async_snapshot_states(self)
+        else:
+            snapshot = snapshot or {}
+            self.restore_states = {
+                entity_id: snapshot.get(entity_id) for entity_id in self.entities
+            }
+        self._async_schedule_save()
+        await self._scene_evaluation_timer.async_start(
+            self.async_timer_evaluate_scene_state
+        )
+
+    @callback
+    def async_set_activated(self) -> None:
+        """Mark the scene on after a merged activation."""
+        self._is_on = True
+        self.async_publish_state()
+
     @property
     def off_scene_entity_id(self) -> str | None:
         """Return the entity_id of the off scene."""
@@ -220,11 +592,68 @@ class Scene:
         self._off_scene_entity_id = entity_id
         if entity_id:
             self._restore_on_deactivate = False
+            self._notify_setting_listeners("restore_on_deactivate")
+        self._notify_setting_listeners("off_scene")
 
     async def async_set_off_scene(self, entity_id: str | None) -> None:
         """Set the off scene entity_id asynchronously."""
         self.set_off_scene(entity_id)
 
+    @callback
+    def _async_new_context(self) -> Context:
+        """Create and remember the context of a command issued by the scene."""
+        context = Context()
+        self._issued_contexts.append(context.id)
+        return context
+
+    def is_own_context(self, context: Context | None) -> bool:
+        """Return whether a change was caused by a command of the scene.
+
+        Services called by the scene, such as scene.turn_on, pass the context on
+        to the entities they change, either as is or as the parent context.
+        """
+        if context is None:
+            return False
+        return context.id in self._issued_contexts or (
+            context.parent_id is not None and context.parent_id in self._issued_contexts
+        )
+
+    async def async_handle_activation(
+        self, event: Event[EventStateChangedData]
+    ) -> None:
+        """Handle an activation of the Home Assistant scene entity.
+
+        Scene entities record the time of their last activation as their state,
+        also when they are activated by an automation, a dashboard or another
+        integration. The scene is marked on right away and the evaluation timer
+        suspends per-entity evaluation while the members settle.
+        """
+        old_state = event.data["old_state"]
+        new_state = event.data["new_state"]
+        if (
+            old_state is None
+            or new_state is None
+            or new_state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN)
+            or new_state.state == old_state.state
+        ):
+            return
+
+        # Activations by async_turn_on have been handled already
+        if self.is_own_context(event.context):
+            return
+
+        _LOGGER.debug("Scene entity %s was activated", self._entity_id)
+        self.stats["activations"] += 1
+
+        # The scene entity is updated before its members are changed
+        await self.async_snapshot_entities()
+
+        await self._scene_evaluation_timer.async_start(
+            self.async_timer_evaluate_scene_state
+        )
+        self._is_on = True
+        self.async_publish_state()
+
     async def async_turn_off(self):
         """Turn off all entities in the scene."""
         if not self._is_on:  # already off
@@ -232,11 +661,11 @@ class Scene:
 
         if self._off_scene_entity_id:
             await self._scene_evaluation_timer.async_cancel_if_active()
-            await self.hass.services.async_call(
-                domain="scene",
-                service="turn_on",
+            await self.async_call_service(
+                "scene",
+                "turn_on",
+                {"transition": self._transition_time},
                 target={"entity_id": self._off_scene_entity_id},
-                service_data={"transition": self._transition_time},
             )
         elif self.restore_on_deactivate:
             await self._scene_evaluation_timer.async_start(
@@ -244,14 +673,64 @@ class Scene:
             )
             await self.async_restore()
         else:
-            await self.hass.services.async_call(
-                domain="homeassistant",
-                service="turn_off",
-                target={"entity_id": list(self.entities.keys())},
-            )
+            await self.async_call_planned(plan_turn_off(self.entities))
 
         self._is_on = False
 
+    async def async_call_service(
+        self,
+        domain: str,
+        service: str,
+        service_data: dict[str, Any] | None = None,
+        *,
+        target: dict[str, Any] | None = None,
+        context: Context | None = None,
+        priority: int = PRIORITY_USER,
+    ) -> None:
+        """Issue a service call of the scene.
+
+        Scenes owned by a hub queue their calls on the command scheduler of the
+        hub, which limits how many calls all scenes send at once.
+        """
+        if context is None:
+            context = self._async_new_context()
+        if self.hub is not None:
+            await self.hub.command_scheduler.async_call(
+                domain,
+                service,
+                service_data,
+                target=target,
+                context=context,
+                priority=priority,
+            )
+            return
+        await self.hass.services.async_call(
+            domain=domain,
+            service=service,
+            service_data=service_data,
+            target=target,
+            context=context,
+        )
+
+    async def async_call_planned(
+        self, calls: list[PlannedCall], priority: int = PRIORITY_USER
+    ) -> None:
+        """Issue planned service calls under one context of the scene."""
+        context = self._async_new_context()
+        self.stats["service_calls"] += len(calls)
+        await asyncio.gather(
+            *(
+                self.async_call_service(
+                    call.domain,
+                    call.service,
+                    call.service_data,
+                    context=context,
+                    priority=priority,
+                )
+                for call in calls
+            )
+        )
+
     @property
     def number_tolerance(self) -> int:
         """Get the number tolerance."""
@@ -259,7 +738,11 @@ class Scene:
 
     def set_number_tolerance(self, number_tolerance):
         """Set the number tolerance."""
-        self._number_tolerance = number_tolerance
+        if number_tolerance != self._number_tolerance:
+            self._number_tolerance = number_tolerance
+            self._compile_matchers()
+            self._async_schedule_reevaluation()
+        self._notify_setting_listeners("number_tolerance")
 
     @property
     def transition_time(self) -> float:
@@ -270,6 +753,7 @@ class Scene:
         """Set the transition time."""
         self._transition_time = transition_time
         self._scene_evaluation_timer.set_transition_time(transition_time)
+        self._notify_setting_listeners("transition_time")
 
     @property
     def debounce_time(self) -> float:
@@ -280,6 +764,17 @@ class Scene:
         """Set the debounce time."""
         self._debounce_time = debounce_time or 0.0
         self._scene_evaluation_timer.set_debounce_time(debounce_time)
+        self._notify_setting_listeners("debounce_time")
+
+    @property
+    def coalesce_window(self) -> float:
+        """Get the coalesce window."""
+        return self._coalesce_window
+
+    def set_coalesce_window(self, coalesce_window: float):
+        """Set the coalesce window."""
+        self._coalesce_window = coalesce_window or 0.0
+        self._notify_setting_listeners("coalesce_window")
 
     @property
     def restore_on_deactivate(self) -> bool:
@@ -289,6 +784,7 @@ class Scene:
     def set_restore_on_deactivate(self, restore_on_deactivate):
         """Set the restore on deactivate flag."""
         self._restore_on_deactivate = restore_on_deactivate
+        self._notify_setting_listeners("restore_on_deactivate")
 
     @property
     def ignore_unavailable(self) -> bool:
@@ -297,7 +793,11 @@ class Scene:
 
     def set_ignore_unavailable(self, ignore_unavailable):
         """Set the ignore unavailable flag."""
-        self._ignore_unavailable = ignore_unavailable
+        if ignore_unavailable != self._ignore_unavailable:
+            self._ignore_unavailable = ignore_unavailable
+            self._compile_matchers()
+            self._async_schedule_reevaluation()
+        self._notify_setting_listeners("ignore_unavailable")
 
     @property
     def ignore_attributes(self) -> bool:
@@ -306,16 +806,104 @@ class Scene:
 
     def set_ignore_attributes(self, ignore_attributes):
         """Set the ignore attributes flag."""
-        self._ignore_attributes = ignore_attributes
+        if ignore_attributes != self._ignore_attributes:
+            self._ignore_attributes = ignore_attributes
+            self._compile_matchers()
+            self._async_schedule_reevaluation()
+        self._notify_setting_listeners("ignore_attributes")
+
+    @property
+    def minimal_activation(self) -> bool:
+        """Get the minimal activation setting."""
+        return self._minimal_activation
+
+    def set_minimal_activation(self, minimal_activation):
+        """Set the minimal activation setting."""
+        self._minimal_activation = minimal_activation
+        self._notify_setting_listeners("minimal_activation")
+
+    @callback
+    def async_add_setting_listener(
+        self, setting: str, listener: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Call listener whenever a setting of the scene is set.
+
+        Settings are named after their properties, e.g. "transition_time".
+        Entities use this to write their state instead of being polled.
+
+        Returns:
+            CALLBACK_TYPE: Function that removes the listener
+
+        """
+        listeners = self._setting_listeners.setdefault(setting, [])
+        listeners.append(listener)
+
+        @callback
+        def _async_remove() -> None:
+            listeners.remove(listener)
+
+        return _async_remove
+
+    def _notify_setting_listeners(self, setting: str) -> None:
+        """Call the listeners of a setting."""
+        for listener in list(self._setting_listeners.get(setting, ())):
+            listener()
 
     async def async_initialize(self) -> None:
-        """Initialize the scene and evaluate its initial state."""
+        """Initialize the scene and evaluate its initial state.
+
+        Scenes owned by a hub are initialized by Hub.async_bootstrap instead.
+        """
         _LOGGER.debug("Initializing scene: %s", self.name)
         await self.async_check_all_states()
         _LOGGER.debug(
             "Initial state for scene %s: %s", self.name, "on" if self._is_on else "off"
         )
 
+    def update_configuration(self, scene_conf: dict) -> None:
+        """Patch the configuration of the scene in place.
+
+        Listeners, timers and settings are kept, as are the restore snapshots
+        of entities that remain in the scene. The name and id are baked into
+        the entities of the scene, so they cannot be patched.
+        """
+        self._entity_id = scene_conf[CONF_SCENE_ENTITY_ID]
+        if self._entity_id is None:
+            self._entity_id = self._lookup_entity_id()
+        self._area_id = scene_conf[CONF_SCENE_AREA]
+        self.icon = scene_conf[CONF_SCENE_ICON]
+
+        self._apply_entities = scene_conf.get("apply_entities", {})
+        entities = scene_conf[CONF_SCENE_ENTITIES]
+        if entities == self.entities:
+            return
+
+        self.entities = entities
+        self.states = {
+            entity_id: self.states.get(entity_id, False) for entity_id in entities
+        }
+        self.restore_states = {
+            entity_id: self.restore_states.get(entity_id) for entity_id in entities
+        }
+        self._mismatched = set(entities)
+        self._ignored = set()
+        self._dirty_entities = set()
+        self._compile_matchers()
+
+    def _lookup_entity_id(self) -> str | None:
+        """Look up the entity_id of the scene by its id."""
+        if self.hub is not None:
+            return self.hub.get_scene_entity_id(self._id)
+        return get_entity_id_from_id(self.hass, self._id)
+
+    async def async_shutdown(self) -> None:
+        """Stop the scene when it is removed from its hub."""
+        await self._scene_evaluation_timer.async_cancel_if_active()
+        if self._cancel_coalesce is not None:
+            self._cancel_coalesce()
+            self._cancel_coalesce = None
+        await self.async_unregister_callback()
+
     async def async_register_callback(self):
         """Register callback."""
         schedule_update_func = self.callback_funcs.get("schedule_update_func", None)
@@ -333,6 +921,11 @@ class Scene:
             self.name,
         )
 
+        # Scenes owned by a hub share the hub's single state change subscription
+        if self.hub is not None:
+            self.callback = self.hub.async_subscribe_scene(self)
+            return
+
         # Set up state change tracking
         self.callback = state_change_func(
             self.hass, entity_ids, self.async_update_callback
@@ -349,6 +942,7 @@ class Scene:
         entity_id = event.data.get("entity_id")
         new_state = event.data.get("new_state")
         old_state = event.data.get("old_state")
+        self.stats["events"] += 1
 
         _LOGGER.debug(
             "State change callback for %s in scene %s: old=%s new=%s",
@@ -358,20 +952,103 @@ class Scene:
             new_state.state if new_state else None,
         )
 
-        # Check if this update is interesting
-        if self.is_interesting_update(old_state, new_state):
+        # Changes caused by the scene itself are expected convergence. They are
+        # re-checked once the activation settles instead of one by one, and do
+        # not replace the restore snapshot taken when the scene was activated.
+        if self.is_own_context(event.context):
+            self.stats["activation_progress"] += 1
+            self._dirty_entities.add(entity_id)
             if not self._scene_evaluation_timer.is_active():
-                await self.async_evaluate_scene_state()
+                self._async_coalesce_evaluation()
+            return
 
-                # Store the old state
-                await self.async_store_entity_state(entity_id, old_state)
+        # Changes during an active timer are re-checked when the timer expires
+        if self._scene_evaluation_timer.is_active():
+            self._dirty_entities.add(entity_id)
+            return
 
-    async def async_evaluate_scene_state(self):
-        """Evaluate scene state immediately."""
+        # Check if this update is interesting
+        if not self.is_interesting_update(old_state, new_state):
+            return
+
+        if self._coalesce_window > 0:
+            self._dirty_entities.add(entity_id)
+            await self.async_store_entity_state(entity_id, old_state)
+            self._async_coalesce_evaluation()
+            return
+
+        await self.async_evaluate_scene_state(entity_id)
+
+        # Store the old state
+        await self.async_store_entity_state(entity_id, old_state)
+
+    @callback
+    def _async_coalesce_evaluation(self) -> None:
+        """Evaluate at the trailing edge of a burst of member updates.
+
+        Each event moves the evaluation to one window after it, but a burst is
+        evaluated at the latest COALESCE_MAX_WAIT_FACTOR windows after its first
+        event. Evaluations of all scenes that expire together run in one batch
+        on the timer wheel.
+        """
+        now = self._timer_wheel.monotonic()
+        self._coalesce_last_event = now
+        if self._cancel_coalesce is None:
+            self._coalesce_first_event = now
+            self._cancel_coalesce = self._timer_wheel.async_schedule(
+                self._coalesce_window, self._async_evaluate_coalesced
+            )
+
+    async def _async_evaluate_coalesced(self, _now) -> None:
+        """Evaluate the entities that changed during a burst."""
+        self._cancel_coalesce = None
+        deadline = min(
+            self._coalesce_last_event + self._coalesce_window,
+            self._coalesce_first_event
+            + self._coalesce_window * COALESCE_MAX_WAIT_FACTOR,
+        )
+        now = self._timer_wheel.monotonic()
+        if now < deadline:
+            self._cancel_coalesce = self._timer_wheel.async_schedule(
+                deadline - now, self._async_evaluate_coalesced
+            )
+            return
+
+        # The evaluation timer re-checks the dirty entities when it expires
+        if self._scene_evaluation_timer.is_active():
+            return
+        self.stats["coalesced_evaluations"] += 1
+        await self.async_evaluate_scene_state()
+
+    async def async_evaluate_scene_state(self, entity_id: str | None = None):
+        """Evaluate scene state immediately.
+
+        Only the given entity and entities that changed while evaluation was
+        suspended are re-checked, unless a full recompute is pending. The switch
+        then writes the result without refreshing, so an event is evaluated
+        exactly once.
+        """
         _LOGGER.debug("[Scene: %s] Starting scene evaluation", self.name)
-        await self.async_check_all_states()
-        if self.schedule_update:
-            self.schedule_update(True)
+        self.stats["evaluations"] += 1
+        if entity_id is not None:
+            self._dirty_entities.add(entity_id)
+        if self._needs_full_evaluation:
+            await self.async_check_all_states()
+        else:
+            await self.async_check_dirty_states()
+        self.async_publish_state()
+
+    @callback
+    def async_publish_state(self) -> None:
+        """Write the state of the scene switch.
+
+        Scenes owned by a hub publish through the hub, which skips writes that
+        would not change the state and batches the others.
+        """
+        if self.hub is not None:
+            self.hub.async_publish_scene_state(self)
+        elif self.schedule_update:
+            self.schedule_update()
 
     async def async_timer_evaluate_scene_state(self, _now):
         """Handle Callback from HA after expiration of SceneEvaluationTimer."""
@@ -427,69 +1104,51 @@ class Scene:
                 )
                 return False
 
-        if self.ignore_unavailable and new_state.state == "unavailable":
-            return None
-
-        # Skip comparison if desired state is None (treat as "don't care")
-        desired_state = self.entities[entity_id]["state"]
-        if desired_state is None:
+        result = self._matchers[entity_id].match(new_state)
+        if result is False:
             _LOGGER.debug(
-                "[%s] Desired state is None for %s, treating as 'don't care'",
+                "[%s] not matching: %s: wanted=%s got=%s %s.",
                 self.name,
                 entity_id,
-            )
-            return None
-
-        # Check state
-        if not self.compare_values(desired_state, new_state.state):
-            _LOGGER.debug(
-                "[%s] state not matching: %s: wanted=%s got=%s.",
-                self.name,
-                entity_id,
-                desired_state,
+                self.entities[entity_id],
                 new_state.state,
+                new_state.attributes,
             )
-            return False
+        return result
 
-        # Check attributes
-        # If both desired and current states are "off", consider it a match regardless of attributes
-        if new_state.state == "off" and desired_state == "off":
-            return True
-
-        if self.ignore_attributes:
-            return True
+    def _compile_matchers(self) -> None:
+        """Compile the entity specs into matchers for the current settings.
 
-        # Only check attributes if entity isn't "off"
-        if new_state.domain in ATTRIBUTES_TO_CHECK:
-            entity_attrs = new_state.attributes
-            for attribute in ATTRIBUTES_TO_CHECK.get(new_state.domain):
-                if (
-                    attribute not in self.entities[entity_id]
-                    or attribute not in entity_attrs
-                ):
-                    continue
+        Matchers depend on the tolerance and the ignore flags, so every entity
+        is re-checked on the next evaluation.
+        """
+        self._matchers = {
+            entity_id: EntityMatcher(
+                entity_id,
+                attributes,
+                self._number_tolerance,
+                self._ignore_unavailable,
+                self._ignore_attributes,
+            )
+            for entity_id, attributes in self.entities.items()
+        }
+        self._needs_full_evaluation = True
 
-                if self.entities[entity_id][attribute] is None:
-                    continue
+    @callback
+    def _async_schedule_reevaluation(self) -> None:
+        """Recompute and publish the scene after its comparison settings changed.
 
-                if not self.compare_values(
-                    self.entities[entity_id][attribute], entity_attrs[attribute]
-                ):
-                    _LOGGER.debug(
-                        "[%s] attribute not matching: %s %s: wanted=%s got=%s.",
-                        self.name,
-                        entity_id,
-                        attribute,
-                        self.entities[entity_id][attribute],
-                        entity_attrs[attribute],
-                    )
-                    return False
-        _LOGGER.debug(
-            "[%s] Found match after %s updated",
-            self.name,
-            entity_id,
+        Only registered scenes are evaluated, and scenes of a hub only once the
+        hub has started. While the evaluation timer runs, its expiry does the
+        full recompute instead.
+        """
+        if self.callback is None or self._scene_evaluation_timer.is_active():
+            return
+        if self.hub is not None and not self.hub.bootstrapped:
+            return
+        self.hass.async_create_task(
+            self.async_evaluate_scene_state(), "stateful_scenes re-evaluation"
         )
-        return True
 
     async def async_check_all_states(self):
         """Check the state of the scene.
@@ -498,49 +1157,172 @@ class Scene:
         in the desired state, the scene is off. Unavaiblable entities are ignored, but
         if all entities are unavailable, the scene is off.
         """
+        self.stats["full_evaluations"] += 1
         for entity_id in self.entities:
             state = self.hass.states.get(entity_id)
-            self.states[entity_id] = await self.async_check_state(entity_id, state)
+            self._set_entity_result(
+                entity_id, await self.async_check_state(entity_id, state)
+            )
+
+        self._dirty_entities.clear()
+        self._needs_full_evaluation = False
+        self._update_is_on()
+
+    async def async_check_dirty_states(self):
+        """Re-check only the entities that changed since the last evaluation."""
+        while self._dirty_entities:
+            entity_id = self._dirty_entities.pop()
+            state = self.hass.states.get(entity_id)
+            self._set_entity_result(
+                entity_id, await self.async_check_state(entity_id, state)
+            )
+        self._update_is_on()
+
+    def _set_entity_result(self, entity_id: str, result: bool | None) -> None:
+        """Record the match result of an entity and update the counters."""
+        self.states[entity_id] = result
+        if result is False:
+            self._mismatched.add(entity_id)
+        else:
+            self._mismatched.discard(entity_id)
+        if result is None:
+            self._ignored.add(entity_id)
+        else:
+            self._ignored.discard(entity_id)
+
+    def _update_is_on(self) -> None:
+        """Derive the scene state from the mismatch counters.
+
+        The scene is on when no entity mismatches and at least one entity is
+        not ignored.
+        """
+        self._is_on = not self._mismatched and len(self._ignored) < len(self.states)
 
-        states = [state for state in self.states.values() if state is not None]
-        result = all(states) if states else False
-        self._is_on = result
+    async def async_snapshot_entities(self) -> None:
+        """Snapshot the current state of all entities for restoring.
+
+        Scenes owned by a started hub take a reference to the states the hub
+        keeps for all tracked entities instead of looking up every entity.
+        """
+        self._persisted_snapshots = None
+        if self.hub is not None and self.hub.bootstrapped:
+            self.restore_states = self.hub.async_snapshot_states(self)
+        else:
+            for entity_id in self.entities:
+                await self.async_store_entity_state(entity_id)
+        self._async_schedule_save()
 
     async def async_store_entity_state(self, entity_id, state=None):
-        """Store the state of an entity."""
+        """Store a snapshot of the state of an entity."""
+        if self._persisted_snapshots is not None:
+            self._load_persisted_snapshots()
         if state is None:
             state = self.hass.states.get(entity_id)
-        self.restore_states[entity_id] = state
+        self.restore_states[entity_id] = (
+            EntitySnapshot.from_state(state) if state is not None else None
+        )
+
+    def load_persisted_data(self, data: dict[str, Any]) -> None:
+        """Set the status and snapshots persisted before a restart.
+
+        The status is used until the scene is evaluated, so its switch starts
+        with its last known value. The snapshots are decoded on first use.
+        """
+        self._is_on = bool(data.get("is_on", False))
+        self._persisted_snapshots = data.get("snapshots") or None
+
+    def get_persisted_data(self) -> dict[str, Any]:
+        """Return the status and snapshots of the scene for persisting."""
+        if self._persisted_snapshots is not None:
+            snapshots = self._persisted_snapshots
+        else:
+            snapshots = {
+                entity_id: snapshot.as_dict()
+                for entity_id in self.entities
+                if (snapshot := self.restore_states.get(entity_id)) is not None
+            }
+        return {"is_on": self._is_on, "snapshots": snapshots}
+
+    def _load_persisted_snapshots(self) -> None:
+        """Decode the persisted snapshots of entities without a snapshot."""
+        persisted = self._persisted_snapshots or {}
+        self._persisted_snapshots = None
+        for entity_id, data in persisted.items():
+            if entity_id in self.restore_states and (
+                self.restore_states[entity_id] is None
+            ):
+                self.restore_states[entity_id] = EntitySnapshot.from_dict(data)
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Persist the snapshots of the scene with the next write of its hub."""
+        if self.hub is not None:
+            self.hub.async_schedule_save()
 
     async def async_restore(self):
-        """Restore the state entities."""
+        """Restore the state entities.
+
+        Only the entities and attributes whose current state differs from the
+        snapshot, according to the comparison rules of the scene, are applied.
+        """
+        if self._persisted_snapshots is not None:
+            self._load_persisted_snapshots()
         entities = {}
-        for entity_id, state in self.restore_states.items():
+        full_size = 0
+        for entity_id in self.entities:
+            state = self.restore_states.get(entity_id)
             if state is None:
                 continue
 
-            # restore state
-            entities[entity_id] = {"state": state.state}
+            # restore state, and the checked attributes unless the entity is off
+            snapshot = {"state": state.state}
+            if state.state != "off":
+                snapshot.update(state.attributes)
 
-            # do not restore attributes if the entity is off
-            if state.state == "off":
-                continue
+            full_size += len(snapshot)
+            if changes := self._restore_changes(
+                snapshot, self.hass.states.get(entity_id)
+            ):
+                entities[entity_id] = changes
 
-            # restore attributes
-            if state.domain in ATTRIBUTES_TO_CHECK:
-                entity_attrs = state.attributes
-                for attribute in ATTRIBUTES_TO_CHECK.get(state.domain):
-                    if attribute not in entity_attrs:
-                        continue
-                    entities[entity_id][attribute] = entity_attrs[attribute]
+        diff_size = sum(len(changes) for changes in entities.values())
+        self.stats["restore_payload_full"] += full_size
+        self.stats["restore_payload_diff"] += diff_size
+        _LOGGER.debug(
+            "[Scene: %s] Restoring %s of %s values",
+            self.name,
+            diff_size,
+            full_size,
+        )
+        if not entities:
+            return
 
-        service_data = {"entities": entities}
-        if self._transition_time is not None:
-            service_data["transition"] = self._transition_time
-        await self.hass.services.async_call(
-            domain="scene", service="apply", service_data=service_data
+        # Entities with identical payloads are restored with one domain call
+        await self.async_call_planned(
+            plan_apply(entities, self._transition_time), PRIORITY_RESTORE
         )
 
+    def _restore_changes(
+        self, snapshot: dict[str, Any], current: State | None
+    ) -> dict[str, Any] | None:
+        """Return the part of a snapshot that differs from the current state.
+
+        The state is always part of the result, as scene.apply needs it, and
+        None is returned if nothing needs to change.
+        """
+        if current is None or not self.compare_values(snapshot["state"], current.state):
+            return snapshot
+
+        changes = {
+            attribute: value
+            for attribute, value in snapshot.items()
+            if attribute != "state"
+            and not self.compare_values(value, current.attributes.get(attribute))
+        }
+        if not changes:
+            return None
+        return {"state": snapshot["state"], **changes}
+
     #    def store_entity_state(self, entity_id, state=None):
     #        """Store the state of an entity.
     #
@@ -553,7 +1335,8 @@ class Scene:
     def restore(self):
         """Restore the state entities."""
         entities = {}
-        for entity_id, state in self.restore_states.items():
+        for entity_id in self.entities:
+            state = self.restore_states.get(entity_id)
             if state is None:
                 continue
 
@@ -576,7 +1359,10 @@ class Scene:
         if self._transition_time is not None:
             service_data["transition"] = self._transition_time
         self.hass.services.call(
-            domain="scene", service="apply", service_data=service_data
+            domain="scene",
+            service="apply",
+            service_data=service_data,
+            context=self._async_new_context(),
         )
 
     def compare_values(self, value1, value2):
@@ -644,6 +1430,10 @@ class Hub:
         hass: HomeAssistant,
         scene_confs: dict[str, Any],
         number_tolerance: int = 1,
+        validated: bool = False,
+        command_concurrency: int = DEFAULT_COMMAND_CONCURRENCY,
+        command_rate: float = DEFAULT_COMMAND_RATE,
+        state_store: HubStateStore | None = None,
     ) -> None:
         """Initialize the Hub class.
 
@@ -651,6 +1441,14 @@ class Hub:
             hass (HomeAssistant): Home Assistant instance
             scene_confs (dict[str, Any]): Scene configurations from the scene file
             number_tolerance (int): Tolerance for comparing numbers
+            validated (bool): Whether scene_confs are already validated and
+                normalized, e.g. when they come from the scene cache
+            command_concurrency (int): Maximum number of service calls of the
+                scenes in flight at once
+            command_rate (float): Maximum number of service calls of the scenes
+                per second, or 0 for no limit
+            state_store (HubStateStore | None): Loaded store for the status and
+                restore snapshots of the scenes across restarts
 
         Raises:
             StatefulScenesYamlNotFound: If the yaml file is not found
@@ -660,20 +1458,75 @@ class Hub:
         self.number_tolerance = number_tolerance
         self.hass = hass
         self.scenes: list[Scene] = []
-        self.scene_confs: list[dict[str, Any]] = []
-
+        # Entry settings the hub was set up with, to detect reloads that need
+        # a full setup
+        self.settings: dict[str, Any] = {}
+        self.timer_wheel = SceneTimerWheel(hass)
+        self.command_scheduler = CommandScheduler(
+            hass, command_concurrency, command_rate
+        )
+        self._entity_index: dict[str, list[Scene]] = {}
+        self._subscribed_scenes: set[Scene] = set()
+        self._unsub_state_change: CALLBACK_TYPE | None = None
+
+        # Normalized configurations and scenes by scene id, for reloads
+        self._normalized_confs: dict[str, dict[str, Any]] = {}
+        self._scenes_by_id: dict[str, Scene] = {}
+        self._platforms: list[
+            tuple[Callable[[Scene], list[Entity]], AddEntitiesCallback]
+        ] = []
+        self._scene_entities: dict[Scene, list[Entity]] = {}
+
+        # Scene id -> scene entity_id and scene entity_id -> Scene lookups
+        self._scene_entity_ids: dict[str, str] = {}
+        self._scenes_by_entity_id: dict[str, Scene] = {}
+        self._build_scene_entity_id_index()
+
+        # State changes are not dispatched before the startup evaluation
+        self.bootstrapped = False
+        self.stats: Counter[str] = Counter()
+
+        # Snapshot of the last known state of every tracked entity, shared by
+        # the scenes until the next change copies it
+        self._stable_states: dict[str, EntitySnapshot] = {}
+        self._stable_states_shared = False
+        self._untracked_entities: dict[Scene, list[str]] = {}
+
+        # Last is_on written per scene and scenes waiting for the next flush
+        self._published_states: dict[Scene, bool] = {}
+        self._pending_publish: dict[Scene, None] = {}
+        self._publish_task: asyncio.Task[None] | None = None
+        self._state_store = state_store
+        self._save_pending = False
+
+        # Scenes turned on in the current loop iteration, activated together
+        self._pending_activations: list[tuple[Scene, asyncio.Future[None]]] = []
+        self._activation_handle: asyncio.Handle | None = None
+
+        lookups = SceneLookupContext(hass)
         for scene_conf in scene_confs:
-            if not self.validate_scene(scene_conf):
-                continue
-            self.scenes.append(
-                Scene(
-                    self.hass,
-                    self.extract_scene_configuration(scene_conf),
-                )
+            if not validated:
+                if not self.validate_scene(scene_conf):
+                    continue
+                scene_conf = self.normalize_scene_configuration(scene_conf)
+            scene = Scene(
+                self.hass,
+                self.resolve_scene_configuration(scene_conf, lookups),
+                hub=self,
             )
-            self.scene_confs.append(self.extract_scene_configuration(scene_conf))
+            if state_store is not None and (
+                persisted := state_store.get_scene_data(scene.id)
+            ):
+                scene.load_persisted_data(persisted)
+            self.scenes.append(scene)
+            self._normalized_confs[scene_conf["id"]] = scene_conf
+            self._scenes_by_id[scene_conf["id"]] = scene
+
+        self._build_scene_index()
+        self._build_entity_index()
 
-    def validate_scene(self, scene_conf: dict) -> None:
+    @staticmethod
+    def validate_scene(scene_conf: dict) -> bool:
         """Validate scene configuration.
 
         Args:
@@ -716,8 +1569,27 @@ class Hub:
         Returns:
             dict: Scene configuration
 
+        """
+        return self.resolve_scene_configuration(
+            self.normalize_scene_configuration(scene_conf)
+        )
+
+    @staticmethod
+    def normalize_scene_configuration(scene_conf: dict) -> dict:
+        """Normalize the part of a scene configuration that comes from the file.
+
+        The result only depends on the scenes file, so it can be cached, and it
+        can be passed to extract_scene_configuration in place of scene_conf.
+
+        Args:
+            scene_conf (dict): Scene configuration
+
+        Returns:
+            dict: Normalized scene configuration
+
         """
         entities = {}
+        apply_entities = {}
         for entity_id, scene_attributes in scene_conf["entities"].items():
             domain = entity_id.split(".")[0]
             # Convert boolean states to strings (YAML parses 'on'/'off' as bool)
@@ -726,6 +1598,15 @@ class Hub:
                 state = "on" if state else "off"
             attributes = {"state": state}
 
+            # All attributes, to activate the scene with scene.apply
+            if state is not None:
+                apply_entities[entity_id] = {
+                    attribute: value
+                    for attribute, value in scene_attributes.items()
+                    if value is not None
+                }
+                apply_entities[entity_id]["state"] = state
+
             if domain in ATTRIBUTES_TO_CHECK:
                 for attribute, value in scene_attributes.items():
                     if attribute in ATTRIBUTES_TO_CHECK.get(domain):
@@ -736,20 +1617,53 @@ class Hub:
 
             entities[entity_id] = attributes
 
+        normalized = {
+            "name": scene_conf["name"],
+            "learn": scene_conf.get("learn", False),
+            "entities": entities,
+            "apply_entities": apply_entities,
+        }
+        # Optional keys fall back to Home Assistant lookups or hub defaults
+        for key in ("id", "entity_id", "icon", "number_tolerance"):
+            if key in scene_conf:
+                normalized[key] = scene_conf[key]
+        return normalized
+
+    def resolve_scene_configuration(
+        self, scene_conf: dict, lookups: SceneLookupContext | None = None
+    ) -> dict:
+        """Resolve the Home Assistant lookups of a normalized scene configuration.
+
+        Args:
+            scene_conf (dict): Normalized scene configuration
+            lookups (SceneLookupContext | None): Lookup context to share between
+                the scenes of a construction or reload
+
+        Returns:
+            dict: Scene configuration
+
+        """
+        if lookups is None:
+            lookups = SceneLookupContext(self.hass)
+
         entity_id = scene_conf.get("entity_id", None)
         if entity_id is None:
-            entity_id = get_entity_id_from_id(self.hass, scene_conf.get("id"))
+            entity_id = self.get_scene_entity_id(scene_conf.get("id"))
+
+        if "icon" in scene_conf:
+            icon = scene_conf["icon"]
+        else:
+            icon = lookups.icon(entity_id)
 
         return {
             "name": scene_conf["name"],
             "id": scene_conf.get("id", entity_id),
-            "icon": scene_conf.get(
-                "icon", get_icon_from_entity_id(self.hass, entity_id)
-            ),
+            "icon": icon,
             "entity_id": entity_id,
-            "area": area_name(self.hass, entity_id),
-            "learn": scene_conf.get("learn", False),
-            "entities": entities,
+            "area": lookups.area_name(entity_id),
+            "learn": scene_conf["learn"],
+            "entities": scene_conf["entities"],
+            "apply_entities": scene_conf.get("apply_entities", {}),
             "number_tolerance": scene_conf.get(
                 "number_tolerance", self.number_tolerance
             ),
@@ -774,6 +1688,535 @@ class Hub:
 
     def get_scene(self, scene_id: str) -> Scene | None:
         """Get scene by entity ID."""
-        return next(
-            (scene for scene in self.scenes if scene.entity_id == scene_id), None
+        return self._scenes_by_entity_id.get(scene_id)
+
+    def get_scene_by_id(self, scene_id: str) -> Scene | None:
+        """Get scene by the id of the scene, including the learned suffix."""
+        for conf_id in (scene_id, scene_id.removesuffix("_learned")):
+            scene = self._scenes_by_id.get(conf_id)
+            if scene is not None and scene.id == scene_id:
+                return scene
+        return None
+
+    def get_scene_entity_id(self, scene_id: str | None) -> str | None:
+        """Get the entity_id of the Home Assistant scene with the given id."""
+        return self._scene_entity_ids.get(scene_id)
+
+    def _build_scene_entity_id_index(self) -> None:
+        """Map the id attribute of every scene entity to its entity_id.
+
+        This replaces a scan over all scene states per lookup. If several scene
+        entities share an id, the first one wins, as it did for the scan.
+        """
+        index: dict[str, str] = {}
+        for state in self.hass.states.async_all("scene"):
+            scene_id = state.attributes.get("id")
+            if scene_id is not None:
+                index.setdefault(scene_id, state.entity_id)
+        self._scene_entity_ids = index
+
+    def _build_scene_index(self) -> None:
+        """Map the entity_id of every scene of the hub to the scene."""
+        index: dict[str, Scene] = {}
+        for scene in self.scenes:
+            index.setdefault(scene.entity_id, scene)
+        self._scenes_by_entity_id = index
+
+    @callback
+    def async_add_platform(
+        self,
+        create_entities: Callable[[Scene], list[Entity]],
+        async_add_entities: AddEntitiesCallback,
+    ) -> None:
+        """Register a platform and add its entities for the scenes of the hub.
+
+        Scenes that are added on a reload get their entities from the
+        registered platforms as well.
+        """
+        platform = (create_entities, async_add_entities)
+        self._platforms.append(platform)
+        self._async_add_scene_entities([platform], self.scenes)
+
+    @callback
+    def _async_add_scene_entities(
+        self,
+        platforms: list[tuple[Callable[[Scene], list[Entity]], AddEntitiesCallback]],
+        scenes: list[Scene],
+    ) -> None:
+        """Create and add the entities of the given platforms for scenes."""
+        for create_entities, async_add_entities in platforms:
+            entities: list[Entity] = []
+            for scene in scenes:
+                scene_entities = create_entities(scene)
+                self._scene_entities.setdefault(scene, []).extend(scene_entities)
+                entities.extend(scene_entities)
+            async_add_entities(entities)
+
+    async def async_update_scenes(
+        self, scene_confs: list[dict[str, Any]]
+    ) -> dict[str, int]:
+        """Apply new validated and normalized scene configurations.
+
+        Scenes are matched by id. Added and removed scenes are created and torn
+        down with their entities, while scenes with changed entity specs are
+        patched in place. Unchanged scenes keep their listeners, timers,
+        restore snapshots and entities. A scene whose name or learn flag
+        changed is replaced, because both are baked into its entities.
+
+        Args:
+            scene_confs (list[dict[str, Any]]): Normalized scene configurations
+
+        Returns:
+            dict[str, int]: Number of added, removed, updated and unchanged scenes
+
+        """
+        new_confs = {scene_conf["id"]: scene_conf for scene_conf in scene_confs}
+        lookups = SceneLookupContext(self.hass)
+        self._build_scene_entity_id_index()
+
+        removed = [
+            scene
+            for scene_id, scene in self._scenes_by_id.items()
+            if scene_id not in new_confs
+        ]
+        added: list[Scene] = []
+        updated: list[Scene] = []
+        scenes_by_id: dict[str, Scene] = {}
+
+        for scene_id, scene_conf in new_confs.items():
+            scene = self._scenes_by_id.get(scene_id)
+            old_conf = self._normalized_confs.get(scene_id)
+            if scene is not None and old_conf == scene_conf:
+                scenes_by_id[scene_id] = scene
+                continue
+
+            resolved = self.resolve_scene_configuration(scene_conf, lookups)
+            if scene is not None and (
+                old_conf["name"] == scene_conf["name"]
+                and old_conf["learn"] == scene_conf["learn"]
+            ):
+                scene.update_configuration(resolved)
+                if old_conf.get("number_tolerance") != scene_conf.get(
+                    "number_tolerance"
+                ):
+                    scene.set_number_tolerance(resolved["number_tolerance"])
+                updated.append(scene)
+            else:
+                if scene is not None:
+                    removed.append(scene)
+                scene = Scene(self.hass, resolved, hub=self)
+                added.append(scene)
+            scenes_by_id[scene_id] = scene
+
+        for scene in removed:
+            self._published_states.pop(scene, None)
+            self._pending_publish.pop(scene, None)
+            for entity in self._scene_entities.pop(scene, []):
+                await entity.async_remove()
+            await scene.async_shutdown()
+
+        self._normalized_confs = new_confs
+        self._scenes_by_id = scenes_by_id
+        self.scenes = list(scenes_by_id.values())
+
+        self._build_scene_index()
+        self._build_entity_index()
+        self._async_track_index()
+        if self.bootstrapped:
+            self._async_seed_stable_states()
+        if removed:
+            self.async_schedule_save()
+        for scene in added:
+            await scene.async_check_all_states()
+        self._async_add_scene_entities(self._platforms, added)
+        for scene in updated:
+            await scene.async_evaluate_scene_state()
+
+        result = {
+            "added": len(added),
+            "removed": len(removed),
+            "updated": len(updated),
+            "unchanged": len(self.scenes) - len(added) - len(updated),
+        }
+        _LOGGER.debug("Updated hub scenes: %s", result)
+        return result
+
+    def _build_entity_index(self) -> None:
+        """Build the inverted entity_id -> scenes index.
+
+        Entities whose desired state is None are "don't care" entries that can
+        never change the outcome of an evaluation, so they are left out.
+        """
+        index: dict[str, list[Scene]] = {}
+        untracked: dict[Scene, list[str]] = {}
+        for scene in self.scenes:
+            for entity_id, attributes in scene.entities.items():
+                if attributes.get("state") is None:
+                    untracked.setdefault(scene, []).append(entity_id)
+                    continue
+                index.setdefault(entity_id, []).append(scene)
+        self._entity_index = index
+        self._untracked_entities = untracked
+
+    @property
+    def index_size(self) -> int:
+        """Return the number of entities in the inverted index."""
+        return len(self._entity_index)
+
+    def get_index_stats(self) -> dict[str, int | float]:
+        """Return size and fan-out statistics of the inverted index."""
+        fanouts = [len(scenes) for scenes in self._entity_index.values()]
+        return {
+            "entities": len(fanouts),
+            "slots": sum(fanouts),
+            "max_fanout": max(fanouts, default=0),
+            "mean_fanout": sum(fanouts) / len(fanouts) if fanouts else 0.0,
+        }
+
+    @callback
+    def async_subscribe_scene(self, scene: Scene) -> CALLBACK_TYPE:
+        """Route state changes of the scene's entities to the scene.
+
+        All scenes of the hub share a single state change subscription which is
+        set up for the first scene and torn down when the last one unsubscribes.
+        """
+        self._subscribed_scenes.add(scene)
+        if self._unsub_state_change is None:
+            self._async_track_index()
+
+        @callback
+        def _async_unsubscribe() -> None:
+            self._subscribed_scenes.discard(scene)
+            if not self._subscribed_scenes and self._unsub_state_change is not None:
+                self._unsub_state_change()
+                self._unsub_state_change = None
+
+        return _async_unsubscribe
+
+    @callback
+    def _async_track_index(self) -> None:
+        """Subscribe the shared state change listener to the tracked entities.
+
+        These are the indexed member entities and the scene entities of the
+        hub, whose state changes when they are activated.
+        """
+        if self._unsub_state_change is not None:
+            self._unsub_state_change()
+            self._unsub_state_change = None
+        entity_ids = set(self._entity_index)
+        entity_ids.update(
+            entity_id for entity_id in self._scenes_by_entity_id if entity_id
+        )
+        if not self._subscribed_scenes or not entity_ids:
+            return
+        _LOGGER.debug(
+            "Tracking %s entities for %s scenes",
+            len(entity_ids),
+            len(self.scenes),
+        )
+        self._unsub_state_change = async_track_state_change_event(
+            self.hass,
+            list(entity_ids),
+            self._async_filter_state_change,
+        )
+
+    async def async_bootstrap(self, _hass: HomeAssistant | None = None) -> None:
+        """Evaluate every scene once after startup.
+
+        This runs when the platforms have added their entities and Home
+        Assistant has started, so all member entities have their initial
+        state. State changes before that are covered by this single pass.
+        """
+        if self.bootstrapped:
+            return
+        self._async_seed_stable_states()
+        for scene in self.scenes:
+            await scene.async_check_all_states()
+            scene.async_publish_state()
+        self.stats["bootstrap_evaluations"] += len(self.scenes)
+        self.bootstrapped = True
+        _LOGGER.debug("Evaluated %s scenes at startup", len(self.scenes))
+
+    @callback
+    def _async_seed_stable_states(self) -> None:
+        """Snapshot the tracked entities that have no snapshot yet.
+
+        Snapshots of entities that are no longer tracked are dropped.
+        """
+        stable_states: dict[str, EntitySnapshot] = {}
+        for entity_id in self._entity_index:
+            if (snapshot := self._stable_states.get(entity_id)) is None:
+                state = self.hass.states.get(entity_id)
+                if state is None or state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+                    continue
+                snapshot = EntitySnapshot.from_state(state)
+            stable_states[entity_id] = snapshot
+        self._stable_states = stable_states
+        self._stable_states_shared = False
+
+    @callback
+    def _async_record_stable_state(self, event: Event[EventStateChangedData]) -> None:
+        """Update the snapshot of a tracked entity from a state change.
+
+        Unavailable and unknown states are not recorded, so the snapshot keeps
+        the last state the entity can be restored to. The snapshots are copied
+        first if a scene holds a reference to them.
+        """
+        new_state = event.data["new_state"]
+        if new_state is None or new_state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            return
+        if self._stable_states_shared:
+            self._stable_states = dict(self._stable_states)
+            self._stable_states_shared = False
+            self.stats["stable_state_copies"] += 1
+        self._stable_states[event.data["entity_id"]] = EntitySnapshot.from_state(
+            new_state
+        )
+
+    @callback
+    def async_snapshot_states(
+        self, scene: Scene
+    ) -> MutableMapping[str, EntitySnapshot | None]:
+        """Return the restore snapshot of a scene without looking up its entities.
+
+        The scene gets a reference to the snapshots of all tracked entities,
+        which stays unchanged because the next state change copies them. Only
+        entities the hub does not track, i.e. "don't care" entities, are
+        looked up. Snapshots the scene stores later go to its own layer.
+        """
+        self._stable_states_shared = True
+        self.stats["snapshots"] += 1
+        untracked: dict[str, EntitySnapshot | None] = {}
+        for entity_id in self._untracked_entities.get(scene, ()):
+            state = self.hass.states.get(entity_id)
+            untracked[entity_id] = (
+                EntitySnapshot.from_state(state) if state is not None else None
+            )
+        return ChainMap(untracked, self._stable_states)
+
+    @callback
+    def async_publish_scene_state(self, scene: Scene) -> None:
+        """Queue a state write for a scene if its is_on changed.
+
+        The writes of all scenes that flipped in the same loop iteration are
+        flushed together in the next iteration. The flush runs in a task that
+        Home Assistant tracks, so waiting for Home Assistant to be done also
+        waits for the writes.
+        """
+        if (
+            scene not in self._pending_publish
+            and self._published_states.get(scene) == scene.is_on
+        ):
+            self.stats["state_writes_skipped"] += 1
+            return
+        self._pending_publish[scene] = None
+        if self._publish_task is None:
+            self._publish_task = self.hass.async_create_task(
+                self._async_flush_scene_states_task(),
+                "stateful_scenes publish",
+                eager_start=False,
+            )
+
+    async def _async_flush_scene_states_task(self) -> None:
+        """Flush the queued state writes."""
+        self._async_flush_scene_states()
+
+    async def async_request_activation(self, scene: Scene) -> None:
+        """Turn on a scene together with the scenes turned on alongside it.
+
+        Scenes turned on in the same loop iteration, such as the switches that
+        HomeKit turns on for a HomeKit scene, are activated together with
+        async_activate_scenes. A scene turned on by itself is activated on its
+        own.
+        """
+        future: asyncio.Future[None] = self.hass.loop.create_future()
+        self._pending_activations.append((scene, future))
+        if self._activation_handle is None:
+            self._activation_handle = self.hass.loop.call_soon(
+                self._async_flush_activations
+            )
+        await future
+
+    @callback
+    def _async_flush_activations(self) -> None:
+        """Activate the scenes turned on since the last flush."""
+        self._activation_handle = None
+        pending = self._pending_activations
+        self._pending_activations = []
+        self.hass.async_create_task(
+            self._async_run_activations(pending), "stateful_scenes activation"
         )
+
+    async def _async_run_activations(
+        self, pending: list[tuple[Scene, asyncio.Future[None]]]
+    ) -> None:
+        """Activate a batch of scenes and resolve the futures of the callers."""
+        scenes = list(dict.fromkeys(scene for scene, _ in pending))
+        try:
+            if len(scenes) == 1:
+                await scenes[0].async_activate()
+            else:
+                self.stats["coalesced_activations"] += len(scenes)
+                await self.async_activate_scenes(scenes)
+        except Exception as err:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(err)
+        else:
+            for _, future in pending:
+                if not future.done():
+                    future.set_result(None)
+        finally:
+            for _, future in pending:
+                if not future.done():
+                    future.cancel()
+
+    async def async_activate_scenes(
+        self, scenes: list[Scene], transition: float | None = None
+    ) -> None:
+        """Activate scenes of the hub with a single scene.apply call.
+
+        The entities of the scenes, with the attributes configured in the
+        scenes file, are merged in order, so later scenes win on entities that
+        are in more than one scene. Entities whose state is None are left to
+        the other scenes. The states of all
+        entities are snapshotted once and shared by the scenes for restoring.
+
+        Args:
+            scenes (list[Scene]): Scenes to activate, in order of priority
+            transition (float | None): Transition time, or None for the
+                transition time of the last scene
+
+        """
+        entities: dict[str, dict[str, Any]] = {}
+        for scene in scenes:
+            for entity_id in scene.entities:
+                # Entities the scene does not care about keep an earlier payload
+                if (payload := scene.activation_payload(entity_id)) is not None:
+                    entities[entity_id] = payload
+
+        # The hub keeps the states of all tracked entities once started
+        snapshot: dict[str, EntitySnapshot | None] | None = None
+        if not self.bootstrapped:
+            snapshot = {}
+            for entity_id in entities:
+                state = self.hass.states.get(entity_id)
+                snapshot[entity_id] = (
+                    EntitySnapshot.from_state(state) if state is not None else None
+                )
+
+        context = Context()
+        for scene in scenes:
+            await scene.async_prepare_merged_activation(context, snapshot)
+
+        if transition is None:
+            transition = scenes[-1].transition_time
+        service_data: dict[str, Any] = {"entities": entities}
+        if transition is not None:
+            service_data["transition"] = transition
+        _LOGGER.debug(
+            "Activating %s scenes with %s entities in one call",
+            len(scenes),
+            len(entities),
+        )
+        self.stats["merged_activations"] += 1
+        if entities:
+            await self.command_scheduler.async_call(
+                "scene", "apply", service_data, context=context
+            )
+        for scene in scenes:
+            scene.async_set_activated()
+
+    @callback
+    def _async_flush_scene_states(self) -> None:
+        """Write the states of the scenes queued for publishing."""
+        self._publish_task = None
+        pending = self._pending_publish
+        self._pending_publish = {}
+        self.stats["state_flushes"] += 1
+        for scene in pending:
+            is_on = scene.is_on
+            if self._published_states.get(scene) == is_on:
+                # Flipped back before the flush
+                self.stats["state_writes_skipped"] += 1
+                continue
+            if scene.schedule_update is None:
+                continue
+            self._published_states[scene] = is_on
+            scene.schedule_update()
+            self.stats["state_writes"] += 1
+            self.async_schedule_save()
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Persist the status and snapshots of the scenes after a delay.
+
+        The delay is not restarted while a save is pending, so under steady
+        traffic the store is still written once per save delay.
+        """
+        if self._state_store is None or self._save_pending:
+            return
+        self._save_pending = True
+        self._state_store.async_delay_save(self._get_persisted_data)
+
+    def _get_persisted_data(self) -> dict[str, Any]:
+        """Return the data of all scenes for the state store."""
+        self._save_pending = False
+        return {
+            "scenes": {scene.id: scene.get_persisted_data() for scene in self.scenes}
+        }
+
+    @staticmethod
+    def is_relevant_change(event: Event[EventStateChangedData]) -> bool:
+        """Return whether a state change can matter to any scene.
+
+        Scenes only compare the state and the checked attributes of the domain
+        of an entity, so updates that change neither, such as the power reading
+        of a light or the position of a media player, cannot change a match
+        result or a restore snapshot. Values are compared exactly, which never
+        drops a change that a scene would consider within tolerance.
+        """
+        old_state = event.data["old_state"]
+        new_state = event.data["new_state"]
+        if old_state is None or new_state is None:
+            return True
+        if old_state.state != new_state.state:
+            return True
+        old_attrs = old_state.attributes
+        new_attrs = new_state.attributes
+        return any(
+            old_attrs.get(attribute) != new_attrs.get(attribute)
+            for attribute in ATTRIBUTES_TO_CHECK.get(new_state.domain, ())
+        )
+
+    @callback
+    def _async_filter_state_change(self, event: Event[EventStateChangedData]) -> None:
+        """Drop irrelevant state changes before they are dispatched.
+
+        The check runs once per event for all scenes containing the entity, and
+        no task is created for the changes that are dropped.
+        """
+        if not self.bootstrapped:
+            return
+        if not self.is_relevant_change(event):
+            self.stats["events_dropped"] += 1
+            return
+        self.hass.async_create_task(
+            self._async_dispatch_state_change(event),
+            "stateful_scenes dispatch",
+            eager_start=True,
+        )
+
+    async def _async_dispatch_state_change(
+        self, event: Event[EventStateChangedData]
+    ) -> None:
+        """Dispatch a state change to the scenes containing the entity."""
+        entity_id = event.data["entity_id"]
+        if entity_id in self._entity_index:
+            self._async_record_stable_state(event)
+        activated = self._scenes_by_entity_id.get(entity_id)
+        if activated is not None and activated in self._subscribed_scenes:
+            await activated.async_handle_activation(event)
+        for scene in self._entity_index.get(entity_id, ()):
+            if scene in self._subscribed_scenes:
+                await scene.async_update_callback(event)
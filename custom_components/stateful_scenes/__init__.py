@@ -2,19 +2,33 @@
 
 from __future__ import annotations
 
+import hashlib
+import logging
 import os
+import time
+from typing import Any
 
-import aiofiles
 import yaml
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.start import async_at_started
+from homeassistant.helpers.typing import ConfigType
 
 from .const import (
+    CONF_COMMAND_CONCURRENCY,
+    CONF_COMMAND_RATE,
+    CONF_DEBOUNCE_TIME,
     CONF_ENABLE_DISCOVERY,
+    CONF_IGNORE_UNAVAILABLE,
     CONF_NUMBER_TOLERANCE,
+    CONF_RESTORE_STATES_ON_DEACTIVATE,
     CONF_SCENE_PATH,
+    CONF_TRANSITION_TIME,
+    DEFAULT_COMMAND_CONCURRENCY,
+    DEFAULT_COMMAND_RATE,
     DOMAIN,
     StatefulScenesYamlInvalid,
     StatefulScenesYamlNotFound,
@@ -22,6 +36,16 @@ from .const import (
 from .discovery import DiscoveryManager
 from .StatefulScenes import Hub, Scene
 from .helpers import async_cleanup_orphaned_entities
+from .scene_cache import async_get_scene_cache
+from .services import async_setup_services
+from .state_store import HubStateStore
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # libyaml is not available
+    from yaml import SafeLoader
+
+_LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [
     Platform.NUMBER,
@@ -29,6 +53,25 @@ PLATFORMS: list[Platform] = [
     Platform.SWITCH,
 ]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+# Hub settings that are applied when the entities of the scenes are created,
+# so a change of any of them needs a full reload of the entry
+HUB_RELOAD_SETTINGS = (
+    CONF_NUMBER_TOLERANCE,
+    CONF_TRANSITION_TIME,
+    CONF_DEBOUNCE_TIME,
+    CONF_RESTORE_STATES_ON_DEACTIVATE,
+    CONF_IGNORE_UNAVAILABLE,
+    CONF_ENABLE_DISCOVERY,
+)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the services of Stateful Scenes."""
+    async_setup_services(hass)
+    return True
+
 
 # https://developers.home-assistant.io/docs/config_entries_index/#setting-up-an-entry
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -43,14 +86,25 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         if entry.data.get(CONF_SCENE_PATH, None) is None:
             raise StatefulScenesYamlNotFound("Scenes file not specified.")
 
-        scene_confs = await load_scenes_file(hass, entry.data[CONF_SCENE_PATH])
+        scene_confs = await async_load_scene_confs(hass, entry.data[CONF_SCENE_PATH])
+        state_store = HubStateStore(hass, entry.entry_id)
+        await state_store.async_load()
 
         hub = Hub(
             hass=hass,
             scene_confs=scene_confs,
             number_tolerance=entry.data[CONF_NUMBER_TOLERANCE],
+            validated=True,
+            command_concurrency=entry.data.get(
+                CONF_COMMAND_CONCURRENCY, DEFAULT_COMMAND_CONCURRENCY
+            ),
+            command_rate=entry.data.get(CONF_COMMAND_RATE, DEFAULT_COMMAND_RATE),
+            state_store=state_store,
         )
+        hub.settings = _hub_settings(entry)
         hass.data[DOMAIN][entry.entry_id] = hub
+        entry.async_on_unload(hub.command_scheduler.async_shutdown)
+        entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
         # Clean up orphaned entities for removed scenes
         valid_scene_ids = {scene.id for scene in hub.scenes}
@@ -74,6 +128,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # Evaluate all scenes in one pass now that their entities have been added
+    if is_hub:
+        entry.async_on_unload(async_at_started(hass, hub.async_bootstrap))
+
     return True
 
 
@@ -109,39 +167,55 @@ async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     for device_id in devices_to_remove:
         dr.async_remove_device(device_id)
 
-
-async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+    # Remove the persisted scene states of a hub
+    await HubStateStore(hass, entry.entry_id).async_remove()
 
 
-async def load_scenes_file(hass: HomeAssistant, scene_path: str) -> list:
-    """Load scenes from yaml file.
+def _hub_settings(entry: ConfigEntry) -> dict[str, Any]:
+    """Return the settings of a hub entry that need a full reload."""
+    return {key: entry.data.get(key) for key in HUB_RELOAD_SETTINGS}
 
-    Args:
-        hass: Home Assistant instance for path resolution
-        scene_path: Path to scenes file (relative to config dir or absolute)
-
-    Returns:
-        List of scene configurations
 
-    Raises:
-        StatefulScenesYamlNotFound: If file path is invalid or file not found
-        StatefulScenesYamlInvalid: If YAML parsing fails or no scenes found
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload config entry.
 
+    Registered as the update listener of hub entries. A hub whose settings in
+    HUB_RELOAD_SETTINGS did not change is updated in place from the scenes
+    file, so only scenes that were added, removed or changed are touched. In
+    all other cases the entry is unloaded and set up again.
+    """
+    hub = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if (
+        not isinstance(hub, Hub)
+        or entry.data.get(CONF_SCENE_PATH) is None
+        or hub.settings != _hub_settings(entry)
+    ):
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    hub.command_scheduler.set_limits(
+        entry.data.get(CONF_COMMAND_CONCURRENCY, DEFAULT_COMMAND_CONCURRENCY),
+        entry.data.get(CONF_COMMAND_RATE, DEFAULT_COMMAND_RATE),
+    )
+    scene_confs = await async_load_scene_confs(hass, entry.data[CONF_SCENE_PATH])
+    await hub.async_update_scenes(scene_confs)
+
+    # Clean up entities of scenes that were removed or changed id
+    valid_scene_ids = {scene.id for scene in hub.scenes}
+    await async_cleanup_orphaned_entities(hass, DOMAIN, entry.entry_id, valid_scene_ids)
+
+
+def _load_scenes_file_sync(
+    resolved_path: str,
+    scene_path: str,
+    known_fingerprint: dict[str, Any] | None = None,
+) -> tuple[dict[str, Any], Any]:
+    """Check, read and parse the scenes file.
+
+    This does blocking I/O and must be run in the executor. The file is not
+    parsed if its fingerprint equals known_fingerprint, in which case None is
+    returned in place of the parsed content.
     """
-    # Validate input
-    if scene_path is None:
-        raise StatefulScenesYamlNotFound("Scenes file not specified.")
-
-    if not scene_path or not scene_path.strip():
-        raise StatefulScenesYamlNotFound("Scenes file path is empty.")
-
-    # Resolve relative paths against config directory
-    # This allows users to use "scenes.yaml" instead of "/config/scenes.yaml"
-    resolved_path = hass.config.path(scene_path)
-
     # Check if file exists
     if not os.path.exists(resolved_path):
         raise StatefulScenesYamlNotFound(
@@ -153,21 +227,136 @@ async def load_scenes_file(hass: HomeAssistant, scene_path: str) -> list:
         raise StatefulScenesYamlNotFound(f"Path {resolved_path} is not a file")
 
     try:
-        async with aiofiles.open(resolved_path, encoding="utf-8") as f:
-            scenes_confs = yaml.load(await f.read(), Loader=yaml.FullLoader)
+        stat = os.stat(resolved_path)
+        with open(resolved_path, "rb") as f:
+            content = f.read()
     except OSError as err:
         raise StatefulScenesYamlInvalid(
             f"Error reading scenes file {resolved_path}: {err}"
         ) from err
+
+    fingerprint = {
+        "mtime": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "hash": hashlib.sha256(content).hexdigest(),
+    }
+    if fingerprint == known_fingerprint:
+        return fingerprint, None
+
+    try:
+        return fingerprint, yaml.load(content, Loader=SafeLoader)
     except yaml.YAMLError as err:
         raise StatefulScenesYamlInvalid(
             f"Invalid YAML in {resolved_path}: {err}"
         ) from err
 
-    if not scenes_confs or not isinstance(scenes_confs, list):
+
+def _resolve_scene_path(hass: HomeAssistant, scene_path: str) -> str:
+    """Validate the scenes file path and resolve it against the config dir."""
+    # Validate input
+    if scene_path is None:
+        raise StatefulScenesYamlNotFound("Scenes file not specified.")
+
+    if not scene_path or not scene_path.strip():
+        raise StatefulScenesYamlNotFound("Scenes file path is empty.")
+
+    # Resolve relative paths against config directory
+    # This allows users to use "scenes.yaml" instead of "/config/scenes.yaml"
+    return hass.config.path(scene_path)
+
+
+async def _async_read_scenes_file(
+    hass: HomeAssistant,
+    resolved_path: str,
+    scene_path: str,
+    known_fingerprint: dict[str, Any] | None = None,
+) -> tuple[dict[str, Any], list | None]:
+    """Read the scenes file in the executor.
+
+    Returns the fingerprint of the file and its scenes, or None in place of the
+    scenes if the fingerprint equals known_fingerprint.
+    """
+    start = time.perf_counter()
+    fingerprint, scenes_confs = await hass.async_add_executor_job(
+        _load_scenes_file_sync, resolved_path, scene_path, known_fingerprint
+    )
+    _LOGGER.debug(
+        "Read %s in %.1f ms in the executor",
+        resolved_path,
+        (time.perf_counter() - start) * 1000,
+    )
+
+    unchanged = scenes_confs is None and fingerprint == known_fingerprint
+    if not unchanged and (not scenes_confs or not isinstance(scenes_confs, list)):
         raise StatefulScenesYamlInvalid(
             f"No scenes found in {resolved_path}. "
             "Ensure the file contains a list of scenes."
         )
 
+    return fingerprint, scenes_confs
+
+
+async def load_scenes_file(hass: HomeAssistant, scene_path: str) -> list:
+    """Load scenes from yaml file.
+
+    Args:
+        hass: Home Assistant instance for path resolution
+        scene_path: Path to scenes file (relative to config dir or absolute)
+
+    Returns:
+        List of scene configurations
+
+    Raises:
+        StatefulScenesYamlNotFound: If file path is invalid or file not found
+        StatefulScenesYamlInvalid: If YAML parsing fails or no scenes found
+
+    """
+    resolved_path = _resolve_scene_path(hass, scene_path)
+    _, scenes_confs = await _async_read_scenes_file(hass, resolved_path, scene_path)
     return scenes_confs
+
+
+async def async_load_scene_confs(hass: HomeAssistant, scene_path: str) -> list:
+    """Load validated and normalized scene configurations.
+
+    The result of parsing and validating the scenes file is cached, so an
+    unchanged file is neither parsed nor validated again, including across
+    restarts. The result can be passed to Hub with validated=True.
+
+    Args:
+        hass: Home Assistant instance for path resolution
+        scene_path: Path to scenes file (relative to config dir or absolute)
+
+    Returns:
+        List of normalized scene configurations
+
+    Raises:
+        StatefulScenesYamlNotFound: If file path is invalid or file not found
+        StatefulScenesYamlInvalid: If the file or one of its scenes is invalid
+
+    """
+    resolved_path = _resolve_scene_path(hass, scene_path)
+    cache = async_get_scene_cache(hass)
+    cached_fingerprint, cached_confs = await cache.async_get(resolved_path)
+
+    fingerprint, scenes_confs = await _async_read_scenes_file(
+        hass, resolved_path, scene_path, cached_fingerprint
+    )
+    if scenes_confs is None:
+        _LOGGER.debug("Using cached scenes for unchanged %s", resolved_path)
+        return cached_confs
+
+    start = time.perf_counter()
+    scene_confs = [
+        Hub.normalize_scene_configuration(scene_conf)
+        for scene_conf in scenes_confs
+        if Hub.validate_scene(scene_conf)
+    ]
+    _LOGGER.debug(
+        "Validated %s scenes from %s in %.1f ms on the event loop",
+        len(scene_confs),
+        resolved_path,
+        (time.perf_counter() - start) * 1000,
+    )
+    await cache.async_set(resolved_path, fingerprint, scene_confs)
+    return scene_confs
@@ -0,0 +1,132 @@
+"""Planning of the service calls that bring entities to a desired state."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any, NamedTuple
+
+# Domains whose turn_off service turns an entity "off"
+TURN_OFF_DOMAINS = frozenset(
+    {"fan", "input_boolean", "light", "media_player", "switch"}
+)
+
+# Domains whose turn_on service turns an entity "on", with the attributes it
+# accepts as service data
+TURN_ON_ATTRIBUTES: dict[str, frozenset[str]] = {
+    "fan": frozenset({"percentage"}),
+    "input_boolean": frozenset(),
+    "light": frozenset({"brightness", "effect", "rgb_color"}),
+    "switch": frozenset(),
+}
+
+# Domains whose services accept a transition
+TRANSITION_DOMAINS = frozenset({"light"})
+
+
+class PlannedCall(NamedTuple):
+    """A service call for one or more entities.
+
+    Entities are targeted with the entity_id key of the service data.
+    """
+
+    domain: str
+    service: str
+    service_data: dict[str, Any]
+
+
+def _freeze(value: Any) -> Any:
+    """Return a hashable version of a service data value."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(val)) for key, val in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(val) for val in value)
+    return value
+
+
+def _domain_service(domain: str, payload: dict[str, Any]) -> str | None:
+    """Return the domain service that applies a payload, if there is one."""
+    state = payload["state"]
+    if state == "off":
+        if domain in TURN_OFF_DOMAINS and len(payload) == 1:
+            return "turn_off"
+        return None
+    if state == "on" and domain in TURN_ON_ATTRIBUTES:
+        accepted = TURN_ON_ATTRIBUTES[domain]
+        if all(key == "state" or key in accepted for key in payload):
+            return "turn_on"
+    return None
+
+
+def plan_apply(
+    entities: dict[str, dict[str, Any]], transition: float | None = None
+) -> list[PlannedCall]:
+    """Plan the calls that apply a scene.apply style payload.
+
+    Entities of the same domain with identical payloads are combined into a
+    single turn_on or turn_off call of their domain, e.g. one light.turn_on
+    for all lights with the same brightness and color. Entities that cannot
+    be expressed as a domain call are applied together with scene.apply.
+
+    Attributes without a value, such as the effect of a light that has none,
+    are left out, as scene.apply does, because domain services reject them.
+    """
+    groups: dict[tuple[str, str, Any], tuple[dict[str, Any], list[str]]] = {}
+    fallback: dict[str, dict[str, Any]] = {}
+    for entity_id, payload in entities.items():
+        payload = {
+            key: val
+            for key, val in payload.items()
+            if val is not None or key == "state"
+        }
+        domain = entity_id.split(".")[0]
+        service = _domain_service(domain, payload)
+        if service is None:
+            fallback[entity_id] = payload
+            continue
+        key = (domain, service, _freeze(payload))
+        if key in groups:
+            groups[key][1].append(entity_id)
+        else:
+            groups[key] = (payload, [entity_id])
+
+    calls: list[PlannedCall] = []
+    for (domain, service, _), (payload, entity_ids) in groups.items():
+        service_data = {"entity_id": entity_ids}
+        service_data.update(
+            (key, val) for key, val in payload.items() if key != "state"
+        )
+        if transition is not None and domain in TRANSITION_DOMAINS:
+            service_data["transition"] = transition
+        calls.append(PlannedCall(domain, service, service_data))
+
+    if fallback:
+        service_data = {"entities": fallback}
+        if transition is not None:
+            service_data["transition"] = transition
+        calls.append(PlannedCall("scene", "apply", service_data))
+    return calls
+
+
+def plan_turn_off(entity_ids: Iterable[str]) -> list[PlannedCall]:
+    """Plan the calls that turn off entities.
+
+    Entities are turned off with one turn_off call per domain. Entities of
+    other domains are turned off together with homeassistant.turn_off, which
+    maps to the domain services that turn them off, e.g. cover.close_cover.
+    No transition is passed, as homeassistant.turn_off never passed one.
+    """
+    by_domain: dict[str, list[str]] = {}
+    fallback: list[str] = []
+    for entity_id in entity_ids:
+        domain = entity_id.split(".")[0]
+        if domain in TURN_OFF_DOMAINS:
+            by_domain.setdefault(domain, []).append(entity_id)
+        else:
+            fallback.append(entity_id)
+
+    calls: list[PlannedCall] = []
+    for domain, domain_entity_ids in by_domain.items():
+        calls.append(PlannedCall(domain, "turn_off", {"entity_id": domain_entity_ids}))
+    if fallback:
+        calls.append(PlannedCall("homeassistant", "turn_off", {"entity_id": fallback}))
+    return calls
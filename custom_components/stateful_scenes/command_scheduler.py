@@ -0,0 +1,218 @@
+"""Rate limited, prioritised scheduler for the service calls of a hub."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections import Counter
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, Context, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import DEFAULT_COMMAND_CONCURRENCY, DEFAULT_COMMAND_RATE
+
+_LOGGER = logging.getLogger(__name__)
+
+# Lower values run first
+PRIORITY_USER = 0
+PRIORITY_RESTORE = 1
+
+
+class _Command:
+    """A queued service call."""
+
+    __slots__ = ("context", "domain", "future", "service", "service_data", "target")
+
+    def __init__(
+        self,
+        domain: str,
+        service: str,
+        service_data: dict[str, Any] | None,
+        target: dict[str, Any] | None,
+        context: Context | None,
+        future: asyncio.Future[None],
+    ) -> None:
+        """Initialize."""
+        self.domain = domain
+        self.service = service
+        self.service_data = service_data
+        self.target = target
+        self.context = context
+        self.future = future
+
+
+class CommandScheduler:
+    """Queue for the service calls that the scenes of a hub issue.
+
+    Calls are issued in order of priority and then in the order they were
+    queued. At most concurrency calls are in flight at once, and if a rate is
+    set, a token bucket holding up to one second of tokens limits the number
+    of calls issued per second. Calls are not blocking, so a call only holds
+    its slot until it has been dispatched. A service that queues calls of its
+    own, such as the switch of a nested stateful scene, cannot deadlock the
+    queue.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        concurrency: int = DEFAULT_COMMAND_CONCURRENCY,
+        rate: float = DEFAULT_COMMAND_RATE,
+        time_func: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize an empty queue.
+
+        Args:
+            hass (HomeAssistant): Home Assistant instance
+            concurrency (int): Maximum number of calls in flight
+            rate (float): Maximum number of calls per second, or 0 for no limit
+            time_func (Callable[[], float]): Monotonic clock in seconds, which
+                tests can replace with a fake clock
+
+        """
+        self._hass = hass
+        self._time = time_func
+        self._queue: list[tuple[int, int, _Command]] = []
+        self._sequence = itertools.count()
+        self._active = 0
+        self._concurrency = 1
+        self._rate = 0.0
+        self._tokens = 0.0
+        self._last_refill = time_func()
+        self._cancel_wakeup: CALLBACK_TYPE | None = None
+        self.stats: Counter[str] = Counter()
+        self.set_limits(concurrency, rate)
+        self._tokens = self._capacity
+
+    def set_limits(self, concurrency: int, rate: float) -> None:
+        """Set the concurrency limit and the number of calls per second."""
+        self._concurrency = max(int(concurrency), 1)
+        self._rate = max(float(rate), 0.0)
+        self._tokens = min(self._tokens, self._capacity)
+        self._async_pump()
+
+    @property
+    def _capacity(self) -> float:
+        """Return the size of the token bucket."""
+        return max(self._rate, 1.0)
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of calls waiting to be issued."""
+        return len(self._queue)
+
+    @property
+    def active(self) -> int:
+        """Return the number of calls in flight."""
+        return self._active
+
+    def get_diagnostics(self) -> dict[str, Any]:
+        """Return the limits, queue depth and counters of the scheduler."""
+        return {
+            "concurrency": self._concurrency,
+            "rate": self._rate,
+            "queue_depth": self.queue_depth,
+            "active": self._active,
+            "stats": dict(self.stats),
+        }
+
+    async def async_call(
+        self,
+        domain: str,
+        service: str,
+        service_data: dict[str, Any] | None = None,
+        *,
+        target: dict[str, Any] | None = None,
+        context: Context | None = None,
+        priority: int = PRIORITY_USER,
+    ) -> None:
+        """Queue a service call and wait until it has been issued."""
+        future: asyncio.Future[None] = self._hass.loop.create_future()
+        command = _Command(domain, service, service_data, target, context, future)
+        heapq.heappush(self._queue, (priority, next(self._sequence), command))
+        self.stats["queued"] += 1
+        self.stats["max_queue_depth"] = max(
+            self.stats["max_queue_depth"], len(self._queue)
+        )
+        self._async_pump()
+        await future
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last refill."""
+        now = self._time()
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._last_refill) * self._rate
+        )
+        self._last_refill = now
+
+    @callback
+    def _async_pump(self) -> None:
+        """Issue queued calls while the limits allow it."""
+        while self._queue and self._active < self._concurrency:
+            if self._rate > 0:
+                self._refill()
+                if self._tokens < 1:
+                    self._async_schedule_wakeup((1 - self._tokens) / self._rate)
+                    return
+                self._tokens -= 1
+            command = heapq.heappop(self._queue)[2]
+            self._active += 1
+            self._hass.async_create_task(
+                self._async_issue(command), "stateful_scenes command", eager_start=False
+            )
+
+    @callback
+    def _async_schedule_wakeup(self, delay: float) -> None:
+        """Pump the queue again once a token is available."""
+        if self._cancel_wakeup is None:
+            self.stats["rate_limited"] += 1
+            self._cancel_wakeup = async_call_later(
+                self._hass, delay, self._async_wakeup
+            )
+
+    @callback
+    def _async_wakeup(self, _now: datetime) -> None:
+        """Handle the wakeup timer."""
+        self._cancel_wakeup = None
+        self._async_pump()
+
+    async def _async_issue(self, command: _Command) -> None:
+        """Dispatch a call and resolve the future of its caller."""
+        try:
+            await self._hass.services.async_call(
+                domain=command.domain,
+                service=command.service,
+                service_data=command.service_data,
+                blocking=False,
+                target=command.target,
+                context=command.context,
+            )
+        except Exception as err:
+            if not command.future.done():
+                command.future.set_exception(err)
+        else:
+            self.stats["issued"] += 1
+            if not command.future.done():
+                command.future.set_result(None)
+        finally:
+            self._active -= 1
+            self._async_pump()
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel the calls that have not been issued yet."""
+        if self._cancel_wakeup is not None:
+            self._cancel_wakeup()
+            self._cancel_wakeup = None
+        queue = self._queue
+        self._queue = []
+        for _, _, command in queue:
+            command.future.cancel()
+        if queue:
+            _LOGGER.debug("Cancelled %s queued commands", len(queue))
@@ -8,9 +8,17 @@ import os
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.helpers import selector
-from . import load_scenes_file
+from . import async_load_scene_confs, async_reload_entry
 
 from .const import (
+    COMMAND_CONCURRENCY_MAX,
+    COMMAND_CONCURRENCY_MIN,
+    COMMAND_CONCURRENCY_STEP,
+    COMMAND_RATE_MAX,
+    COMMAND_RATE_MIN,
+    COMMAND_RATE_STEP,
+    CONF_COMMAND_CONCURRENCY,
+    CONF_COMMAND_RATE,
     CONF_DEBOUNCE_TIME,
     CONF_ENABLE_DISCOVERY,
     CONF_EXTERNAL_SCENE_ACTIVE,
@@ -25,6 +33,8 @@ from .const import (
     DEBOUNCE_MAX,
     DEBOUNCE_MIN,
     DEBOUNCE_STEP,
+    DEFAULT_COMMAND_CONCURRENCY,
+    DEFAULT_COMMAND_RATE,
     DEFAULT_DEBOUNCE_TIME,
     DEFAULT_ENABLE_DISCOVERY,
     DEFAULT_EXTERNAL_SCENE_ACTIVE,
@@ -109,6 +119,24 @@ def _hub_schema(defaults: dict) -> vol.Schema:
             CONF_ENABLE_DISCOVERY,
             default=defaults.get(CONF_ENABLE_DISCOVERY, DEFAULT_ENABLE_DISCOVERY),
         ): selector.BooleanSelector(),
+        vol.Optional(
+            CONF_COMMAND_CONCURRENCY,
+            default=defaults.get(CONF_COMMAND_CONCURRENCY, DEFAULT_COMMAND_CONCURRENCY),
+        ): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=COMMAND_CONCURRENCY_MIN,
+                max=COMMAND_CONCURRENCY_MAX,
+                step=COMMAND_CONCURRENCY_STEP,
+            )
+        ),
+        vol.Optional(
+            CONF_COMMAND_RATE,
+            default=defaults.get(CONF_COMMAND_RATE, DEFAULT_COMMAND_RATE),
+        ): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=COMMAND_RATE_MIN, max=COMMAND_RATE_MAX, step=COMMAND_RATE_STEP
+            )
+        ),
     }
     return vol.Schema(fields)
 
@@ -167,11 +195,14 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Validate hub user input. Returns errors dict (empty on success)."""
         errors = {}
         try:
-            scene_confs = await load_scenes_file(self.hass, user_input[CONF_SCENE_PATH])
+            scene_confs = await async_load_scene_confs(
+                self.hass, user_input[CONF_SCENE_PATH]
+            )
             _ = Hub(
                 hass=self.hass,
                 scene_confs=scene_confs,
                 number_tolerance=user_input[CONF_NUMBER_TOLERANCE],
+                validated=True,
             )
         except StatefulScenesYamlInvalid as err:
             _LOGGER.warning(err)
@@ -407,10 +438,13 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors = await self._async_validate_hub_input(user_input)
             if not errors:
                 user_input["hub"] = True
-                return self.async_update_reload_and_abort(
-                    entry,
-                    data_updates=user_input,
-                )
+                # Changed settings reload the entry through its update listener
+                if not self.hass.config_entries.async_update_entry(
+                    entry, data={**entry.data, **user_input}
+                ):
+                    # Unchanged settings still pick up changes to the scenes file
+                    await async_reload_entry(self.hass, entry)
+                return self.async_abort(reason="reconfigure_successful")
 
         return self.async_show_form(
             step_id="reconfigure_hub",
@@ -15,6 +15,8 @@ CONF_EXTERNAL_SCENE_ACTIVE = "external_scene_active"
 CONF_DEBOUNCE_TIME = "debounce_time"
 CONF_IGNORE_UNAVAILABLE = "ignore_unavailable"
 CONF_ENABLE_DISCOVERY = "enable_discovery"
+CONF_COMMAND_CONCURRENCY = "command_concurrency"
+CONF_COMMAND_RATE = "command_rate"
 
 DEFAULT_SCENE_PATH = "scenes.yaml"
 DEFAULT_NUMBER_TOLERANCE = 1
@@ -22,18 +24,40 @@ DEFAULT_RESTORE_STATES_ON_DEACTIVATE = False
 DEFAULT_TRANSITION_TIME = 1
 DEFAULT_EXTERNAL_SCENE_ACTIVE = False
 DEFAULT_DEBOUNCE_TIME = 0.0
+DEFAULT_COALESCE_WINDOW = 0.0
 DEFAULT_IGNORE_UNAVAILABLE = False
 DEFAULT_ENABLE_DISCOVERY = True
+DEFAULT_COMMAND_CONCURRENCY = 4
+DEFAULT_COMMAND_RATE = 0.0
 DEFAULT_OFF_SCENE_ENTITY_ID: str = "None"
 
 DEBOUNCE_MIN = 0
 DEBOUNCE_MAX = 300
 DEBOUNCE_STEP = 0.1
 
+COALESCE_WINDOW_MIN = 0
+COALESCE_WINDOW_MAX = 10
+COALESCE_WINDOW_STEP = 0.05
+# A burst is evaluated at the latest this many windows after its first event
+COALESCE_MAX_WAIT_FACTOR = 4
+
+# Number of commands per scene whose context is remembered to recognise the
+# state changes they cause
+ISSUED_CONTEXT_HISTORY = 16
+
 TOLERANCE_MIN = 0
 TOLERANCE_MAX = 20
 TOLERANCE_STEP = 1
 
+COMMAND_CONCURRENCY_MIN = 1
+COMMAND_CONCURRENCY_MAX = 50
+COMMAND_CONCURRENCY_STEP = 1
+
+# A command rate of 0 disables rate limiting
+COMMAND_RATE_MIN = 0
+COMMAND_RATE_MAX = 100
+COMMAND_RATE_STEP = 0.5
+
 # Scene configuration
 CONF_SCENE_NAME = "name"
 CONF_SCENE_LEARN = "learn"
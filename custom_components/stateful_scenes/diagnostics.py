@@ -0,0 +1,41 @@
+"""Diagnostics support for Stateful Scenes."""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .StatefulScenes import Hub, Scene
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    diagnostics: dict[str, Any] = {"entry": dict(entry.data)}
+
+    if isinstance(data, Hub):
+        scene_stats: Counter[str] = Counter()
+        for scene in data.scenes:
+            scene_stats.update(scene.stats)
+        diagnostics["hub"] = {
+            "scenes": len(data.scenes),
+            "bootstrapped": data.bootstrapped,
+            "index": data.get_index_stats(),
+            "pending_timers": data.timer_wheel.pending,
+            "command_queue": data.command_scheduler.get_diagnostics(),
+            "stats": dict(data.stats),
+            "scene_stats": dict(scene_stats),
+        }
+    elif isinstance(data, Scene):
+        diagnostics["scene"] = {
+            "entity_id": data.entity_id,
+            "is_on": data.is_on,
+            "stats": dict(data.stats),
+        }
+    return diagnostics
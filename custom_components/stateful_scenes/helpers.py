@@ -65,8 +65,10 @@ def _extract_scene_id_from_unique_id(unique_id: str) -> str | None:
         "_restore_on_deactivate",
         "_ignore_unavailable",
         "_ignore_attributes",
+        "_minimal_activation",
         "_transition_time",
         "_debounce_time",
+        "_coalesce_window",
         "_tolerance",
         "_off_scene",
     ]
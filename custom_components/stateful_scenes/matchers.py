@@ -0,0 +1,150 @@
+"""Compiled matchers for comparing entity states against a scene spec."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.core import State
+
+from .const import ATTRIBUTES_TO_CHECK
+
+ValueMatcher = Callable[[Any], bool]
+
+
+def _is_none(actual: Any) -> bool:
+    """Match only None."""
+    return actual is None
+
+
+def compile_value(value: Any, tolerance: float) -> ValueMatcher:
+    """Compile a desired value into a predicate over actual values.
+
+    The predicate gives the same result as Scene.compare_values(value, actual),
+    but the type dispatch, lowercasing and tolerance bounds of the desired
+    value are resolved once instead of on every comparison.
+    """
+    if value is None:
+        return _is_none
+
+    if isinstance(value, str):
+        lowered = value.lower()
+
+        def _match_str(actual: Any) -> bool:
+            if isinstance(actual, str):
+                return actual.lower() == lowered
+            return actual is not None and value == actual
+
+        return _match_str
+
+    if isinstance(value, dict):
+        items = tuple(
+            (key, compile_value(val, tolerance)) for key, val in value.items()
+        )
+
+        def _match_dict(actual: Any) -> bool:
+            if isinstance(actual, dict):
+                for key, matches in items:
+                    if key not in actual or not matches(actual[key]):
+                        return False
+                return True
+            return actual is not None and value == actual
+
+        return _match_dict
+
+    if isinstance(value, (list, tuple)):
+        elements = tuple(compile_value(val, tolerance) for val in value)
+
+        def _match_sequence(actual: Any) -> bool:
+            if isinstance(actual, (list, tuple)):
+                for matches, val in zip(elements, actual):
+                    if not matches(val):
+                        return False
+                return True
+            return actual is not None and value == actual
+
+        return _match_sequence
+
+    if isinstance(value, (int, float)):
+        low, high = value - tolerance, value + tolerance
+
+        def _match_number(actual: Any) -> bool:
+            if isinstance(actual, (int, float)):
+                return low <= actual <= high
+            return actual is not None and value == actual
+
+        return _match_number
+
+    def _match_equal(actual: Any) -> bool:
+        return actual is not None and value == actual
+
+    return _match_equal
+
+
+class EntityMatcher:
+    """Matcher for the desired state of a single entity in a scene.
+
+    Built once from the entity spec and rebuilt only when the tolerance or the
+    ignore flags of the scene change.
+    """
+
+    __slots__ = (
+        "_attributes",
+        "_dont_care",
+        "_ignore_attributes",
+        "_ignore_unavailable",
+        "_state",
+        "_state_is_off",
+    )
+
+    def __init__(
+        self,
+        entity_id: str,
+        spec: dict[str, Any],
+        tolerance: float,
+        ignore_unavailable: bool = False,
+        ignore_attributes: bool = False,
+    ) -> None:
+        """Compile the spec of an entity."""
+        desired_state = spec["state"]
+        self._dont_care = desired_state is None
+        self._state = compile_value(desired_state, tolerance)
+        self._state_is_off = desired_state == "off"
+        self._ignore_unavailable = ignore_unavailable
+        self._ignore_attributes = ignore_attributes
+
+        attributes = ATTRIBUTES_TO_CHECK.get(entity_id.split(".")[0], ())
+        self._attributes: tuple[tuple[str, ValueMatcher], ...] = (
+            ()
+            if ignore_attributes
+            else tuple(
+                (attribute, compile_value(spec[attribute], tolerance))
+                for attribute in attributes
+                if spec.get(attribute) is not None
+            )
+        )
+
+    def match(self, state: State) -> bool | None:
+        """Return whether the state matches, or None if it is ignored."""
+        if self._ignore_unavailable and state.state == "unavailable":
+            return None
+
+        # A desired state of None is treated as "don't care"
+        if self._dont_care:
+            return None
+
+        if not self._state(state.state):
+            return False
+
+        # If both desired and current states are "off", attributes do not matter
+        if self._state_is_off and state.state == "off":
+            return True
+
+        if self._ignore_attributes:
+            return True
+
+        entity_attrs = state.attributes
+        for attribute, matches in self._attributes:
+            if attribute in entity_attrs and not matches(entity_attrs[attribute]):
+                return False
+        return True
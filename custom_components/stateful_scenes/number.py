@@ -14,6 +14,9 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import StatefulScenes
 from .const import (
+    COALESCE_WINDOW_MAX,
+    COALESCE_WINDOW_MIN,
+    COALESCE_WINDOW_STEP,
     DEBOUNCE_MAX,
     DEBOUNCE_MIN,
     DEBOUNCE_STEP,
@@ -40,25 +43,31 @@ async def async_setup_entry(
         entry,
     )
 
-    entities = []
     if isinstance(data[entry.entry_id], StatefulScenes.Hub):
         hub = data[entry.entry_id]
-        for scene in hub.scenes:
-            entities += [TransitionNumber(scene), DebounceTime(scene), Tolerance(scene)]
+        hub.async_add_platform(_create_scene_entities, add_entities)
 
     elif isinstance(data[entry.entry_id], StatefulScenes.Scene):
         scene = data[entry.entry_id]
-        entities += [TransitionNumber(scene), DebounceTime(scene), Tolerance(scene)]
+        add_entities(_create_scene_entities(scene))
 
     else:
         _LOGGER.error("Invalid entity type for %s", entry.entry_id)
         return False
 
-    add_entities(entities)
-
     return True
 
 
+def _create_scene_entities(scene: StatefulScenes.Scene) -> list[RestoreNumber]:
+    """Create the number entities of a scene."""
+    return [
+        TransitionNumber(scene),
+        DebounceTime(scene),
+        CoalesceWindow(scene),
+        Tolerance(scene),
+    ]
+
+
 class TransitionNumber(RestoreNumber):
     """Number entity to store the transition time."""
 
@@ -68,6 +77,7 @@ class TransitionNumber(RestoreNumber):
     _attr_native_unit_of_measurement = "seconds"
     _attr_name = "Transition Time"
     _attr_entity_category = EntityCategory.CONFIG
+    _attr_should_poll = False
 
     def __init__(self, scene: StatefulScenes.Scene) -> None:
         """Initialize."""
@@ -115,6 +125,11 @@ class TransitionNumber(RestoreNumber):
                     last_number_data.native_value,
                 )
                 self._scene.set_transition_time(last_number_data.native_value)
+        self.async_on_remove(
+            self._scene.async_add_setting_listener(
+                "transition_time", self.async_write_ha_state
+            )
+        )
 
     @property
     def native_value(self) -> float:
@@ -131,6 +146,7 @@ class DebounceTime(RestoreNumber):
     _attr_native_unit_of_measurement = "seconds"
     _attr_name = "Debounce Time"
     _attr_entity_category = EntityCategory.CONFIG
+    _attr_should_poll = False
 
     def __init__(self, scene: StatefulScenes.Scene) -> None:
         """Initialize."""
@@ -176,6 +192,11 @@ class DebounceTime(RestoreNumber):
                     last_number_data.native_value,
                 )
                 self._scene.set_debounce_time(last_number_data.native_value)
+        self.async_on_remove(
+            self._scene.async_add_setting_listener(
+                "debounce_time", self.async_write_ha_state
+            )
+        )
 
     @property
     def native_value(self) -> float:
@@ -183,6 +204,66 @@ class DebounceTime(RestoreNumber):
         return self._scene.debounce_time
 
 
+class CoalesceWindow(RestoreNumber):
+    """Window in which bursts of member updates are evaluated once, at the trailing edge."""
+
+    _attr_native_max_value = COALESCE_WINDOW_MAX
+    _attr_native_min_value = COALESCE_WINDOW_MIN
+    _attr_native_step = COALESCE_WINDOW_STEP
+    _attr_native_unit_of_measurement = "seconds"
+    _attr_name = "Coalesce Window"
+    _attr_entity_category = EntityCategory.CONFIG
+    _attr_should_poll = False
+
+    def __init__(self, scene: StatefulScenes.Scene) -> None:
+        """Initialize."""
+        self._scene = scene
+        self._name = f"{scene.name} Coalesce Window"
+        self._attr_unique_id = f"{scene.id}_coalesce_window"
+
+    @property
+    def name(self) -> str:
+        """Return the display name of this light."""
+        return self._name
+
+    @property
+    def device_info(self) -> DeviceInfo | None:
+        """Return the device info."""
+        return DeviceInfo(
+            identifiers={(self._scene.id,)},
+            name=self._scene.name,
+            manufacturer=DEVICE_INFO_MANUFACTURER,
+        )
+
+    async def async_set_native_value(self, value: float) -> None:
+        """Update the current value."""
+        self._scene.set_coalesce_window(value)
+
+    async def async_added_to_hass(self) -> None:
+        """Restore last state."""
+        await super().async_added_to_hass()
+        if (last_state := await self.async_get_last_state()) and (
+            last_number_data := await self.async_get_last_number_data()
+        ):
+            if last_state.state not in (STATE_UNKNOWN, STATE_UNAVAILABLE):
+                _LOGGER.debug(
+                    "Restoring coalesce window for %s to %s",
+                    self._scene.name,
+                    last_number_data.native_value,
+                )
+                self._scene.set_coalesce_window(last_number_data.native_value)
+        self.async_on_remove(
+            self._scene.async_add_setting_listener(
+                "coalesce_window", self.async_write_ha_state
+            )
+        )
+
+    @property
+    def native_value(self) -> float:
+        """Return the entity value to represent the entity state."""
+        return self._scene.coalesce_window
+
+
 class Tolerance(RestoreNumber):
     """Tolerance to numbers to be considered equal when assessing a state."""
 
@@ -192,6 +273,7 @@ class Tolerance(RestoreNumber):
     _attr_native_unit_of_measurement = "number"
     _attr_name = "Tolerance"
     _attr_entity_category = EntityCategory.CONFIG
+    _attr_should_poll = False
 
     def __init__(self, scene: StatefulScenes.Scene) -> None:
         """Initialize."""
@@ -237,6 +319,11 @@ class Tolerance(RestoreNumber):
                     last_number_data.native_value,
                 )
                 self._scene.set_number_tolerance(last_number_data.native_value)
+        self.async_on_remove(
+            self._scene.async_add_setting_listener(
+                "number_tolerance", self.async_write_ha_state
+            )
+        )
 
     @property
     def native_value(self) -> float:
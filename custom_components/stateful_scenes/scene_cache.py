@@ -0,0 +1,86 @@
+"""Persistent cache of validated scene configurations."""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_KEY = f"{DOMAIN}.scene_cache"
+STORAGE_VERSION = 1
+
+# Format of the cached scene configurations. Entries of another format are
+# parsed again, e.g. after the normalized configuration gained a key.
+CACHE_FORMAT = 2
+
+DATA_SCENE_CACHE = f"{DOMAIN}_scene_cache"
+
+
+class SceneConfigCache:
+    """Validated scene configurations keyed on the scenes file they came from.
+
+    Entries are stored per resolved path together with the fingerprint
+    (mtime, size and content hash) of the file they were parsed from, so an
+    unchanged file does not need to be parsed or validated again. Scene
+    configurations are copied in and out of the cache, so callers that change
+    them do not change the cached entries.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._data: dict[str, Any] | None = None
+        self._load_lock = asyncio.Lock()
+
+    async def _async_load(self) -> dict[str, Any]:
+        """Load the cache from storage once.
+
+        Entries loaded concurrently wait for the first load, so a slow load
+        cannot replace entries that were set in the meantime.
+        """
+        if self._data is None:
+            async with self._load_lock:
+                if self._data is None:
+                    self._data = await self._store.async_load() or {}
+        return self._data
+
+    async def async_get(
+        self, resolved_path: str
+    ) -> tuple[dict[str, Any] | None, list[dict[str, Any]] | None]:
+        """Return the cached fingerprint and scene configurations of a file."""
+        entry = (await self._async_load()).get(resolved_path)
+        if entry is None or entry.get("format") != CACHE_FORMAT:
+            return None, None
+        return copy.deepcopy(entry["fingerprint"]), copy.deepcopy(entry["scenes"])
+
+    async def async_set(
+        self,
+        resolved_path: str,
+        fingerprint: dict[str, Any],
+        scene_confs: list[dict[str, Any]],
+    ) -> None:
+        """Store the scene configurations parsed from a file."""
+        data = await self._async_load()
+        data[resolved_path] = {
+            "format": CACHE_FORMAT,
+            "fingerprint": copy.deepcopy(fingerprint),
+            "scenes": copy.deepcopy(scene_confs),
+        }
+        _LOGGER.debug("Caching %s scenes for %s", len(scene_confs), resolved_path)
+        await self._store.async_save(data)
+
+
+@callback
+def async_get_scene_cache(hass: HomeAssistant) -> SceneConfigCache:
+    """Return the scene configuration cache."""
+    if DATA_SCENE_CACHE not in hass.data:
+        hass.data[DATA_SCENE_CACHE] = SceneConfigCache(hass)
+    return hass.data[DATA_SCENE_CACHE]
@@ -46,19 +46,20 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Stateful Scenes select."""
     data = hass.data[DOMAIN][config_entry.entry_id]
-    entities: list[StatefulSceneOffSelect] = []
 
     if isinstance(data, Hub):
-        entities.extend(StatefulSceneOffSelect(scene, data) for scene in data.scenes)
+        data.async_add_platform(
+            lambda scene: [StatefulSceneOffSelect(scene, data)], async_add_entities
+        )
     elif isinstance(data, Scene):
-        entities.append(StatefulSceneOffSelect(data, None))
-
-    async_add_entities(entities)
+        async_add_entities([StatefulSceneOffSelect(data, None)])
 
 
 class StatefulSceneOffSelect(SelectEntity, RestoreEntity):
     """Representation of a Stateful Scene select entity."""
 
+    _attr_should_poll = False
+
     def __init__(self, scene: Scene, hub: Hub | None) -> None:
         """Initialize the select entity."""
         self._entity_id_map: dict[str, str] = {
@@ -214,9 +215,36 @@ class StatefulSceneOffSelect(SelectEntity, RestoreEntity):
             restore_entity_id = (
                 f"switch.{slugify(f'{self._scene.name} Restore On Deactivate')}"
             )
-        async_track_state_change_event(
-            self.hass, [restore_entity_id], self.async_update_restore_state
+        self.async_on_remove(
+            async_track_state_change_event(
+                self.hass, [restore_entity_id], self.async_update_restore_state
+            )
+        )
+        for setting in ("off_scene", "restore_on_deactivate"):
+            self.async_on_remove(
+                self._scene.async_add_setting_listener(
+                    setting, self._async_handle_setting_change
+                )
+            )
+
+    @callback
+    def _async_handle_setting_change(self) -> None:
+        """Write the state when the off scene or restore setting changes."""
+        off_scene_entity_id = self._scene.off_scene_entity_id
+        if off_scene_entity_id != self._off_scene_entity_id:
+            self._off_scene_entity_id = off_scene_entity_id
+            if off_scene_entity_id is None:
+                self._attr_current_option = DEFAULT_OFF_SCENE_ENTITY_ID
+            elif state := self.hass.states.get(off_scene_entity_id):
+                self._attr_current_option = state.attributes.get(
+                    "friendly_name", off_scene_entity_id
+                )
+            else:
+                self._attr_current_option = off_scene_entity_id
+        self._restore_on_deactivate_state = (
+            "on" if self._scene.restore_on_deactivate else "off"
         )
+        self.async_write_ha_state()
 
     @under_cached_property
     def device_info(self) -> DeviceInfo:
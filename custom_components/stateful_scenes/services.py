@@ -0,0 +1,98 @@
+"""Services of Stateful Scenes."""
+
+from __future__ import annotations
+
+import logging
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv, entity_registry as er
+
+from .const import DOMAIN
+from .StatefulScenes import Hub, Scene
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_ACTIVATE_MANY = "activate_many"
+
+ATTR_SCENES = "scenes"
+ATTR_TRANSITION = "transition"
+
+ACTIVATE_MANY_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_SCENES): cv.entity_ids,
+        vol.Optional(ATTR_TRANSITION): vol.All(vol.Coerce(float), vol.Range(min=0)),
+    }
+)
+
+
+@callback
+def async_find_scene(hass: HomeAssistant, entity_id: str) -> Scene | None:
+    """Return the scene of a Home Assistant scene or a Stateful Scene switch."""
+    entries = hass.data.get(DOMAIN, {})
+    for data in entries.values():
+        if isinstance(data, Hub):
+            if (scene := data.get_scene(entity_id)) is not None:
+                return scene
+        elif isinstance(data, Scene) and data.entity_id == entity_id:
+            return data
+
+    entity = er.async_get(hass).async_get(entity_id)
+    if (
+        entity is None
+        or entity.platform != DOMAIN
+        or not entity.unique_id.startswith("stateful_")
+    ):
+        return None
+    data = entries.get(entity.config_entry_id)
+    if isinstance(data, Hub):
+        return data.get_scene_by_id(entity.unique_id.removeprefix("stateful_"))
+    if isinstance(data, Scene):
+        return data
+    return None
+
+
+async def async_activate_many(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Activate several scenes at once.
+
+    The scenes of each hub are merged into a single scene.apply call, in which
+    later scenes win on shared entities. Scenes of external scene entries are
+    turned on one after another.
+    """
+    scenes: list[Scene] = []
+    for entity_id in call.data[ATTR_SCENES]:
+        scene = async_find_scene(hass, entity_id)
+        if scene is None:
+            raise ServiceValidationError(f"{entity_id} is not a Stateful Scene")
+        if scene not in scenes:
+            scenes.append(scene)
+
+    by_hub: dict[Hub, list[Scene]] = {}
+    for scene in scenes:
+        if scene.hub is None:
+            await scene.async_turn_on()
+            scene.async_publish_state()
+        else:
+            by_hub.setdefault(scene.hub, []).append(scene)
+
+    transition = call.data.get(ATTR_TRANSITION)
+    for hub, hub_scenes in by_hub.items():
+        _LOGGER.debug("Activating %s scenes of a hub", len(hub_scenes))
+        await hub.async_activate_scenes(hub_scenes, transition)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the services of Stateful Scenes."""
+
+    async def _async_handle_activate_many(call: ServiceCall) -> None:
+        await async_activate_many(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_ACTIVATE_MANY,
+        _async_handle_activate_many,
+        schema=ACTIVATE_MANY_SCHEMA,
+    )
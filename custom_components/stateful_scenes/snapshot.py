@@ -0,0 +1,99 @@
+"""Compact snapshots of entity states for restoring scenes."""
+
+from __future__ import annotations
+
+import sys
+from typing import Any
+
+from homeassistant.core import State
+
+from .const import ATTRIBUTES_TO_CHECK
+
+# Checked attributes per domain in a fixed order
+_CHECKED: dict[str, tuple[str, ...]] = {
+    domain: tuple(sorted(attributes))
+    for domain, attributes in ATTRIBUTES_TO_CHECK.items()
+}
+
+# Attribute names shared by all snapshots with the same attributes present
+_KEYS: dict[tuple[str, ...], tuple[str, ...]] = {}
+
+
+class EntitySnapshot:
+    """The part of an entity state that is needed to restore it.
+
+    Unlike a State, a snapshot only holds the state string and the values of
+    the checked attributes of its domain, without the other attributes, the
+    context and the timestamps. The attribute names are shared between
+    snapshots.
+    """
+
+    __slots__ = ("_keys", "_values", "domain", "state")
+
+    def __init__(
+        self,
+        domain: str,
+        state: str,
+        keys: tuple[str, ...] = (),
+        values: tuple[Any, ...] = (),
+    ) -> None:
+        """Initialize."""
+        self.domain = sys.intern(domain)
+        self.state = state
+        self._keys = _KEYS.setdefault(keys, keys)
+        self._values = values
+
+    @classmethod
+    def from_state(cls, state: State) -> EntitySnapshot:
+        """Take a snapshot of a state."""
+        checked = _CHECKED.get(state.domain)
+        if not checked:
+            return cls(state.domain, state.state)
+        entity_attrs = state.attributes
+        keys = tuple(attribute for attribute in checked if attribute in entity_attrs)
+        return cls(
+            state.domain,
+            state.state,
+            keys,
+            tuple(entity_attrs[attribute] for attribute in keys),
+        )
+
+    @property
+    def attributes(self) -> dict[str, Any]:
+        """Return the checked attributes of the entity."""
+        return dict(zip(self._keys, self._values))
+
+    def __eq__(self, other: object) -> bool:
+        """Return whether two snapshots hold the same state."""
+        if not isinstance(other, EntitySnapshot):
+            return NotImplemented
+        return (
+            self.domain == other.domain
+            and self.state == other.state
+            and self._keys == other._keys
+            and self._values == other._values
+        )
+
+    def __repr__(self) -> str:
+        """Return the representation of the snapshot."""
+        return f"<EntitySnapshot {self.domain}={self.state} {self.attributes}>"
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the snapshot as a JSON serializable dict."""
+        return {
+            "domain": self.domain,
+            "state": self.state,
+            "attributes": self.attributes,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> EntitySnapshot:
+        """Return the snapshot stored with as_dict."""
+        attributes = data.get("attributes", {})
+        keys = tuple(sorted(attributes))
+        return cls(
+            data["domain"],
+            data["state"],
+            keys,
+            tuple(attributes[key] for key in keys),
+        )
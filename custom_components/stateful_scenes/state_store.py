@@ -0,0 +1,49 @@
+"""Persisted scene status and restore snapshots of a hub."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+STORAGE_VERSION = 1
+
+# Seconds to wait for more changes before writing the store
+SAVE_DELAY = 10
+
+
+class HubStateStore:
+    """Store for the last published status and restore snapshots of scenes.
+
+    The store is read once when the hub is set up. Writes are debounced, so a
+    burst of activations results in a single write.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store of a hub entry."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.state.{entry_id}"
+        )
+        self._scenes: dict[str, dict[str, Any]] = {}
+
+    async def async_load(self) -> None:
+        """Load the persisted data of the scenes."""
+        data = await self._store.async_load() or {}
+        self._scenes = data.get("scenes", {})
+
+    def get_scene_data(self, scene_id: str) -> dict[str, Any] | None:
+        """Return the persisted data of a scene."""
+        return self._scenes.get(scene_id)
+
+    @callback
+    def async_delay_save(self, data_func: Callable[[], dict[str, Any]]) -> None:
+        """Write the data returned by data_func after the save delay."""
+        self._store.async_delay_save(data_func, SAVE_DELAY)
+
+    async def async_remove(self) -> None:
+        """Remove the store."""
+        await self._store.async_remove()
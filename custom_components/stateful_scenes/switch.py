@@ -12,7 +12,7 @@ from homeassistant.components.switch import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import STATE_ON, EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 
 # Import the device class from the component that you want to support
 import homeassistant.helpers.config_validation as cv
@@ -71,35 +71,32 @@ async def async_setup_entry(
         data,
         entry,
     )
-    entities = []
     if isinstance(data[entry.entry_id], StatefulScenes.Hub):
         hub = data[entry.entry_id]
-        for scene in hub.scenes:
-            entities += [
-                StatefulSceneSwitch(scene),
-                RestoreOnDeactivate(scene),
-                IgnoreUnavailable(scene),
-                IgnoreAttributes(scene),
-            ]
+        hub.async_add_platform(_create_scene_entities, async_add_entities)
 
     elif isinstance(data[entry.entry_id], StatefulScenes.Scene):
         scene = data[entry.entry_id]
-        entities += [
-            StatefulSceneSwitch(scene),
-            RestoreOnDeactivate(scene),
-            IgnoreUnavailable(scene),
-            IgnoreAttributes(scene),
-        ]
+        async_add_entities(_create_scene_entities(scene))
 
     else:
         _LOGGER.error("Invalid entity type for %s", entry.entry_id)
         return False
 
-    async_add_entities(entities)
-
     return True
 
 
+def _create_scene_entities(scene: StatefulScenes.Scene) -> list[SwitchEntity]:
+    """Create the switch entities of a scene."""
+    return [
+        StatefulSceneSwitch(scene),
+        RestoreOnDeactivate(scene),
+        IgnoreUnavailable(scene),
+        IgnoreAttributes(scene),
+        MinimalActivation(scene),
+    ]
+
+
 class StatefulSceneSwitch(SwitchEntity):
     """Representation of an Awesome Light."""
 
@@ -113,7 +110,6 @@ class StatefulSceneSwitch(SwitchEntity):
         self._scene = scene
         self._is_on = None
         self._name = "Stateful Scene"
-        self._icon = scene.icon
         self._attr_unique_id = f"stateful_{scene.id}"
 
         # Initialize callback functions but don't register yet - will do in async_added_to_hass
@@ -129,12 +125,15 @@ class StatefulSceneSwitch(SwitchEntity):
         # Register callback after entity is added to hass
         await self.async_register_callback()
 
-        async def async_validate_scene_state(_now=None):
-            await self._scene.async_check_all_states()
+        # Scenes owned by a hub are evaluated by the hub once it has started
+        if self._scene.hub is None:
+            await self._scene.async_initialize()
             self._is_on = self._scene.is_on
             self.async_write_ha_state()
 
-        await async_validate_scene_state()
+    async def async_will_remove_from_hass(self) -> None:
+        """Unregister callbacks when the entity is removed."""
+        await self.async_unregister_callback()
 
     @property
     def is_on(self) -> bool:
@@ -149,7 +148,7 @@ class StatefulSceneSwitch(SwitchEntity):
     @property
     def icon(self) -> str | None:
         """Return the icon of this light."""
-        return self._icon
+        return self._scene.icon
 
     @property
     def device_info(self) -> DeviceInfo | None:
@@ -165,21 +164,13 @@ class StatefulSceneSwitch(SwitchEntity):
         """Instruct the light to turn on."""
         await self._scene.async_turn_on()
         self._is_on = self._scene.is_on
-        self.async_schedule_update_ha_state()
+        self._scene.async_publish_state()
 
     async def async_turn_off(self, **kwargs) -> None:
         """Instruct the light to turn off."""
         await self._scene.async_turn_off()
         self._is_on = self._scene.is_on
-        self.async_schedule_update_ha_state()
-
-    async def async_update(self) -> None:
-        """Fetch new state data for this light.
-
-        This is the only method that should fetch new data for Home Assistant.
-        """
-        await self._scene.async_check_all_states()
-        self._is_on = self._scene.is_on
+        self._scene.async_publish_state()
 
     async def async_register_callback(self) -> None:
         """Register callback to update hass when state changes."""
@@ -195,7 +186,7 @@ class RestoreOnDeactivate(SwitchEntity, RestoreEntity):
 
     _attr_name = "Restore On Deactivate"
     _attr_entity_category = EntityCategory.CONFIG
-    _attr_should_poll = True
+    _attr_should_poll = False
     _attr_assumed_state = False
 
     def __init__(self, scene: StatefulScenes.Scene) -> None:
@@ -205,7 +196,6 @@ class RestoreOnDeactivate(SwitchEntity, RestoreEntity):
         self._attr_unique_id = f"{scene.id}_restore_on_deactivate"
         self._scene.set_restore_on_deactivate(scene.restore_on_deactivate)
         self._is_on = scene.restore_on_deactivate
-        self._is_on = None
 
     @property
     def name(self) -> str:
@@ -234,27 +224,31 @@ class RestoreOnDeactivate(SwitchEntity, RestoreEntity):
         brightness control.
         """
         self._scene.set_restore_on_deactivate(True)
-        self._is_on = self._scene.restore_on_deactivate
 
     async def async_turn_off(self, **kwargs) -> None:
         """Instruct the light to turn off."""
         self._scene.set_restore_on_deactivate(False)
-        self._is_on = self._scene.restore_on_deactivate
-
-    async def async_update(self) -> None:
-        """Fetch new state data for this light.
 
-        This is the only method that should fetch new data for Home Assistant.
-        """
+    @callback
+    def _async_handle_setting_change(self) -> None:
+        """Write the state when the scene setting changes."""
         self._is_on = self._scene.restore_on_deactivate
+        self.async_write_ha_state()
 
     async def async_added_to_hass(self):
         """Handle entity which will be added."""
-        state = await self.async_get_last_state()
-        if not state:
-            return
-        self._scene.set_restore_on_deactivate(state.state == STATE_ON)
-        self._is_on = state.state == STATE_ON
+        if state := await self.async_get_last_state():
+            self._scene.set_restore_on_deactivate(state.state == STATE_ON)
+            self._is_on = state.state == STATE_ON
+        else:
+            # Without a last state, start from the setting of the scene
+            self._is_on = self._scene.restore_on_deactivate
+            self.async_write_ha_state()
+        self.async_on_remove(
+            self._scene.async_add_setting_listener(
+                "restore_on_deactivate", self._async_handle_setting_change
+            )
+        )
 
 
 class IgnoreUnavailable(SwitchEntity, RestoreEntity):
@@ -262,7 +256,7 @@ class IgnoreUnavailable(SwitchEntity, RestoreEntity):
 
     _attr_name = "Ignore unavailable entities"
     _attr_entity_category = EntityCategory.CONFIG
-    _attr_should_poll = True
+    _attr_should_poll = False
     _attr_assumed_state = False
 
     def __init__(self, scene: StatefulScenes.Scene) -> None:
@@ -300,27 +294,27 @@ class IgnoreUnavailable(SwitchEntity, RestoreEntity):
         brightness control.
         """
         self._scene.set_ignore_unavailable(True)
-        self._is_on = self._scene.restore_on_deactivate
 
     async def async_turn_off(self, **kwargs) -> None:
         """Instruct the light to turn off."""
         self._scene.set_ignore_unavailable(False)
-        self._is_on = self._scene.restore_on_deactivate
 
-    async def async_update(self) -> None:
-        """Fetch new state data for this light.
-
-        This is the only method that should fetch new data for Home Assistant.
-        """
+    @callback
+    def _async_handle_setting_change(self) -> None:
+        """Write the state when the scene setting changes."""
         self._is_on = self._scene.ignore_unavailable
+        self.async_write_ha_state()
 
     async def async_added_to_hass(self):
         """Handle entity which will be added."""
-        state = await self.async_get_last_state()
-        if not state:
-            return
-        self._scene.set_ignore_unavailable(state.state == STATE_ON)
-        self._is_on = state.state == STATE_ON
+        if state := await self.async_get_last_state():
+            self._scene.set_ignore_unavailable(state.state == STATE_ON)
+            self._is_on = state.state == STATE_ON
+        self.async_on_remove(
+            self._scene.async_add_setting_listener(
+                "ignore_unavailable", self._async_handle_setting_change
+            )
+        )
 
 
 class IgnoreAttributes(SwitchEntity, RestoreEntity):
@@ -328,7 +322,7 @@ class IgnoreAttributes(SwitchEntity, RestoreEntity):
 
     _attr_name = "Ignore attributes of entities"
     _attr_entity_category = EntityCategory.CONFIG
-    _attr_should_poll = True
+    _attr_should_poll = False
     _attr_assumed_state = False
 
     def __init__(self, scene: StatefulScenes.Scene) -> None:
@@ -366,24 +360,85 @@ class IgnoreAttributes(SwitchEntity, RestoreEntity):
         brightness control.
         """
         self._scene.set_ignore_attributes(True)
-        self._is_on = self._scene.ignore_attributes
 
     async def async_turn_off(self, **kwargs) -> None:
         """Instruct the light to turn off."""
         self._scene.set_ignore_attributes(False)
+
+    @callback
+    def _async_handle_setting_change(self) -> None:
+        """Write the state when the scene setting changes."""
         self._is_on = self._scene.ignore_attributes
+        self.async_write_ha_state()
 
-    async def async_update(self) -> None:
-        """Fetch new state data for this light.
+    async def async_added_to_hass(self):
+        """Handle entity which will be added."""
+        if state := await self.async_get_last_state():
+            self._scene.set_ignore_attributes(state.state == STATE_ON)
+            self._is_on = state.state == STATE_ON
+        self.async_on_remove(
+            self._scene.async_add_setting_listener(
+                "ignore_attributes", self._async_handle_setting_change
+            )
+        )
 
-        This is the only method that should fetch new data for Home Assistant.
-        """
-        self._is_on = self._scene.ignore_attributes
+
+class MinimalActivation(SwitchEntity, RestoreEntity):
+    """Switch entity to only command entities that differ from the scene."""
+
+    _attr_name = "Minimal activation"
+    _attr_entity_category = EntityCategory.CONFIG
+    _attr_should_poll = False
+    _attr_assumed_state = False
+
+    def __init__(self, scene: StatefulScenes.Scene) -> None:
+        """Initialize."""
+        self._scene = scene
+        self._name = f"{scene.name} Minimal Activation"
+        self._attr_unique_id = f"{scene.id}_minimal_activation"
+        self._is_on = scene.minimal_activation
+
+    @property
+    def name(self) -> str:
+        """Return the display name of this switch."""
+        return self._name
+
+    @property
+    def device_info(self) -> DeviceInfo | None:
+        """Return the device info."""
+        return DeviceInfo(
+            identifiers={(self._scene.id,)},
+            name=self._scene.name,
+            manufacturer=DEVICE_INFO_MANUFACTURER,
+            suggested_area=self._scene.area_id,
+        )
+
+    @property
+    def is_on(self) -> bool:
+        """Return true if minimal activation is enabled."""
+        return self._is_on
+
+    async def async_turn_on(self, **kwargs) -> None:
+        """Enable minimal activation."""
+        self._scene.set_minimal_activation(True)
+
+    async def async_turn_off(self, **kwargs) -> None:
+        """Disable minimal activation."""
+        self._scene.set_minimal_activation(False)
+
+    @callback
+    def _async_handle_setting_change(self) -> None:
+        """Write the state when the scene setting changes."""
+        self._is_on = self._scene.minimal_activation
+        self.async_write_ha_state()
 
     async def async_added_to_hass(self):
         """Handle entity which will be added."""
-        state = await self.async_get_last_state()
-        if not state:
-            return
-        self._scene.set_ignore_attributes(state.state == STATE_ON)
-        self._is_on = state.state == STATE_ON
+        if state := await self.async_get_last_state():
+            self._scene.set_minimal_activation(state.state == STATE_ON)
+            self._is_on = state.state == STATE_ON
+        self.async_on_remove(
+            self._scene.async_add_setting_listener(
+                "minimal_activation", self._async_handle_setting_change
+            )
+        )
@@ -0,0 +1,116 @@
+"""Tests for the outgoing command planner."""
+
+from __future__ import annotations
+
+from custom_components.stateful_scenes.command_planner import (
+    PlannedCall,
+    plan_apply,
+    plan_turn_off,
+)
+
+
+def test_identical_payloads_share_a_domain_call():
+    """Test lights with the same target payload are combined into one call."""
+    calls = plan_apply(
+        {
+            "light.a": {"state": "on", "brightness": 100, "rgb_color": [255, 0, 0]},
+            "light.b": {"state": "on", "brightness": 100, "rgb_color": [255, 0, 0]},
+            "light.c": {"state": "on", "brightness": 50},
+            "light.d": {"state": "off"},
+            "switch.e": {"state": "off"},
+            "switch.f": {"state": "off"},
+        },
+        transition=2,
+    )
+
+    assert calls == [
+        PlannedCall(
+            "light",
+            "turn_on",
+            {
+                "entity_id": ["light.a", "light.b"],
+                "brightness": 100,
+                "rgb_color": [255, 0, 0],
+                "transition": 2,
+            },
+        ),
+        PlannedCall(
+            "light",
+            "turn_on",
+            {"entity_id": ["light.c"], "brightness": 50, "transition": 2},
+        ),
+        PlannedCall("light", "turn_off", {"entity_id": ["light.d"], "transition": 2}),
+        PlannedCall("switch", "turn_off", {"entity_id": ["switch.e", "switch.f"]}),
+    ]
+
+
+def test_other_payloads_fall_back_to_scene_apply():
+    """Test payloads without a matching domain service use one scene.apply."""
+    calls = plan_apply(
+        {
+            "cover.blinds": {"state": "open", "current_position": 75},
+            "media_player.tv": {"state": "playing", "source": "HDMI 1"},
+            "fan.ceiling": {"state": "on", "direction": "forward"},
+            "light.a": {"state": "on"},
+        }
+    )
+
+    assert calls == [
+        PlannedCall("light", "turn_on", {"entity_id": ["light.a"]}),
+        PlannedCall(
+            "scene",
+            "apply",
+            {
+                "entities": {
+                    "cover.blinds": {"state": "open", "current_position": 75},
+                    "media_player.tv": {"state": "playing", "source": "HDMI 1"},
+                    "fan.ceiling": {"state": "on", "direction": "forward"},
+                }
+            },
+        ),
+    ]
+
+
+def test_attributes_without_value_are_left_out():
+    """Test None attributes from snapshots are not sent to domain services."""
+    calls = plan_apply(
+        {
+            "light.a": {
+                "state": "on",
+                "brightness": 200,
+                "effect": None,
+                "rgb_color": [255, 7, 0],
+            },
+            "fan.b": {"state": "on", "percentage": None},
+        }
+    )
+
+    assert calls == [
+        PlannedCall(
+            "light",
+            "turn_on",
+            {"entity_id": ["light.a"], "brightness": 200, "rgb_color": [255, 7, 0]},
+        ),
+        PlannedCall("fan", "turn_on", {"entity_id": ["fan.b"]}),
+    ]
+
+
+def test_empty_payload_plans_no_calls():
+    """Test nothing is planned for an empty payload."""
+    assert plan_apply({}, transition=1) == []
+    assert plan_turn_off([]) == []
+
+
+def test_turn_off_groups_by_domain():
+    """Test entities are turned off with one call per domain."""
+    calls = plan_turn_off(
+        ["light.a", "cover.blinds", "light.b", "switch.c", "climate.d"]
+    )
+
+    assert calls == [
+        PlannedCall("light", "turn_off", {"entity_id": ["light.a", "light.b"]}),
+        PlannedCall("switch", "turn_off", {"entity_id": ["switch.c"]}),
+        PlannedCall(
+            "homeassistant", "turn_off", {"entity_id": ["cover.blinds", "climate.d"]}
+        ),
+    ]
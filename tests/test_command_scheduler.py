@@ -0,0 +1,163 @@
+"""Tests for the hub command scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.stateful_scenes.command_scheduler import (
+    PRIORITY_RESTORE,
+    PRIORITY_USER,
+    CommandScheduler,
+)
+
+
+def _register_services(hass: HomeAssistant, release: asyncio.Event) -> list[str]:
+    """Register a service that waits for release and one that records calls."""
+    issued: list[str] = []
+
+    async def _async_block(call: ServiceCall) -> None:
+        issued.append(call.data["name"])
+        await release.wait()
+
+    async def _async_record(call: ServiceCall) -> None:
+        issued.append(call.data["name"])
+
+    hass.services.async_register("test", "block", _async_block)
+    hass.services.async_register("test", "record", _async_record)
+    return issued
+
+
+async def test_user_commands_outrank_restores(hass: HomeAssistant):
+    """Test queued user commands are issued before queued restores."""
+    issued = _register_services(hass, asyncio.Event())
+    scheduler = CommandScheduler(hass, concurrency=1)
+
+    hass.async_create_task(scheduler.async_call("test", "record", {"name": "first"}))
+    hass.async_create_task(
+        scheduler.async_call(
+            "test", "record", {"name": "restore"}, priority=PRIORITY_RESTORE
+        )
+    )
+    hass.async_create_task(
+        scheduler.async_call("test", "record", {"name": "user"}, priority=PRIORITY_USER)
+    )
+
+    assert scheduler.active == 1
+    assert scheduler.queue_depth == 2
+
+    await hass.async_block_till_done()
+
+    assert issued == ["first", "user", "restore"]
+    assert scheduler.queue_depth == 0
+    assert scheduler.stats["issued"] == 3
+    assert scheduler.stats["max_queue_depth"] == 2
+
+
+async def test_concurrency_limit(hass: HomeAssistant):
+    """Test no more than the concurrency limit of calls are in flight."""
+    issued = _register_services(hass, asyncio.Event())
+    scheduler = CommandScheduler(hass, concurrency=2)
+
+    for name in ("a", "b", "c"):
+        hass.async_create_task(scheduler.async_call("test", "record", {"name": name}))
+
+    assert scheduler.active == 2
+    assert scheduler.get_diagnostics()["queue_depth"] == 1
+
+    await hass.async_block_till_done()
+    assert issued == ["a", "b", "c"]
+    assert scheduler.active == 0
+
+
+async def test_slot_is_freed_once_dispatched(hass: HomeAssistant):
+    """Test a call does not hold its slot while its service runs."""
+    release = asyncio.Event()
+    issued = _register_services(hass, release)
+    scheduler = CommandScheduler(hass, concurrency=1)
+
+    await scheduler.async_call("test", "block", {"name": "slow"})
+    await scheduler.async_call("test", "record", {"name": "fast"})
+
+    assert issued == ["slow", "fast"]
+    assert scheduler.active == 0
+
+    release.set()
+    await hass.async_block_till_done()
+
+
+async def test_nested_scene_with_single_slot(hass: HomeAssistant):
+    """Test a service that queues calls of its own does not deadlock.
+
+    This is what the switch of a stateful scene that is a member of another
+    stateful scene does when the hub has a concurrency of one.
+    """
+    issued = _register_services(hass, asyncio.Event())
+    scheduler = CommandScheduler(hass, concurrency=1)
+
+    async def _async_nested(call: ServiceCall) -> None:
+        issued.append(call.data["name"])
+        await scheduler.async_call("test", "record", {"name": "inner"})
+
+    hass.services.async_register("test", "nested", _async_nested)
+
+    async with asyncio.timeout(5):
+        await scheduler.async_call("test", "nested", {"name": "outer"})
+        await hass.async_block_till_done()
+
+    assert issued == ["outer", "inner"]
+    assert scheduler.queue_depth == 0
+    assert scheduler.active == 0
+
+
+async def test_rate_limit(hass: HomeAssistant):
+    """Test calls beyond the token budget wait for new tokens."""
+    now = [0.0]
+    issued = _register_services(hass, asyncio.Event())
+    scheduler = CommandScheduler(hass, concurrency=10, rate=2, time_func=lambda: now[0])
+
+    # The rate limited call only completes once the time has changed, so the
+    # calls are not tracked by async_block_till_done
+    calls = [
+        asyncio.ensure_future(scheduler.async_call("test", "record", {"name": name}))
+        for name in ("a", "b", "c")
+    ]
+    await asyncio.sleep(0)
+    await hass.async_block_till_done()
+
+    assert issued == ["a", "b"]
+    assert scheduler.queue_depth == 1
+    assert scheduler.stats["rate_limited"] == 1
+
+    now[0] += 0.5
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+    assert issued == ["a", "b", "c"]
+    assert scheduler.queue_depth == 0
+    async with asyncio.timeout(5):
+        await asyncio.gather(*calls)
+
+
+async def test_shutdown_cancels_queued_calls(hass: HomeAssistant):
+    """Test calls that have not been issued are cancelled on shutdown."""
+    release = asyncio.Event()
+    issued = _register_services(hass, release)
+    scheduler = CommandScheduler(hass, concurrency=1)
+
+    hass.async_create_task(scheduler.async_call("test", "block", {"name": "a"}))
+    queued = hass.async_create_task(
+        scheduler.async_call("test", "record", {"name": "b"})
+    )
+    assert scheduler.queue_depth == 1
+
+    scheduler.async_shutdown()
+    release.set()
+    await hass.async_block_till_done()
+
+    assert issued == ["a"]
+    assert queued.cancelled()
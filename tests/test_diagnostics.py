@@ -0,0 +1,46 @@
+"""Tests for Stateful Scenes diagnostics."""
+
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.stateful_scenes.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+
+
+async def test_hub_diagnostics(
+    hass: HomeAssistant,
+    mock_config_entry_hub: MockConfigEntry,
+    mock_scene_entities,
+    mock_light_entities,
+):
+    """Test hub diagnostics include the command queue depth."""
+    await hass.config_entries.async_setup(mock_config_entry_hub.entry_id)
+    await hass.async_block_till_done()
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, mock_config_entry_hub)
+
+    hub = diagnostics["hub"]
+    assert hub["scenes"] == 2
+    assert hub["command_queue"]["queue_depth"] == 0
+    assert hub["command_queue"]["concurrency"] >= 1
+    assert hub["index"]["entities"] == 3
+
+
+async def test_scene_diagnostics(
+    hass: HomeAssistant,
+    mock_config_entry_external: MockConfigEntry,
+    mock_light_entities,
+):
+    """Test diagnostics of a single scene entry."""
+    await hass.config_entries.async_setup(mock_config_entry_external.entry_id)
+    await hass.async_block_till_done()
+
+    diagnostics = await async_get_config_entry_diagnostics(
+        hass, mock_config_entry_external
+    )
+
+    assert "hub" not in diagnostics
+    assert "stats" in diagnostics["scene"]
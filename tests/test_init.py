@@ -2,22 +2,35 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
 import os
+import threading
+from unittest.mock import patch
 
 import pytest
+import yaml
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry, entity_registry
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.stateful_scenes import (
+    async_load_scene_confs,
+    async_reload_entry,
     async_remove_entry,
     load_scenes_file,
 )
 from custom_components.stateful_scenes.const import (
+    CONF_COMMAND_RATE,
+    CONF_TRANSITION_TIME,
     DOMAIN,
     StatefulScenesYamlInvalid,
     StatefulScenesYamlNotFound,
 )
+from custom_components.stateful_scenes.scene_cache import (
+    DATA_SCENE_CACHE,
+    SceneConfigCache,
+)
 from custom_components.stateful_scenes.StatefulScenes import Hub, Scene
 
 
@@ -38,6 +51,19 @@ async def test_async_setup_entry_hub(
     assert hub.scenes[1].name == "Test Scene 2"
 
 
+async def test_async_setup_entry_hub_single_startup_evaluation(
+    hass: HomeAssistant, mock_config_entry_hub: MockConfigEntry, mock_scene_entities
+):
+    """Test each hub scene is evaluated exactly once at startup."""
+    await hass.config_entries.async_setup(mock_config_entry_hub.entry_id)
+    await hass.async_block_till_done()
+
+    hub = hass.data[DOMAIN][mock_config_entry_hub.entry_id]
+    assert hub.bootstrapped
+    assert [scene.stats["full_evaluations"] for scene in hub.scenes] == [1, 1]
+    assert hub.stats["bootstrap_evaluations"] == len(hub.scenes)
+
+
 async def test_async_setup_entry_external_scene(
     hass: HomeAssistant,
     mock_config_entry_external: MockConfigEntry,
@@ -73,6 +99,98 @@ async def test_async_unload_entry(
     assert mock_config_entry_hub.entry_id not in hass.data[DOMAIN]
 
 
+async def test_async_reload_entry_diffs_scenes(
+    hass: HomeAssistant,
+    mock_config_entry_hub: MockConfigEntry,
+    mock_scene_entities,
+    mock_scenes_yaml,
+):
+    """Test a reload only touches scenes that were added, removed or changed."""
+    await hass.config_entries.async_setup(mock_config_entry_hub.entry_id)
+    await hass.async_block_till_done()
+
+    hub = hass.data[DOMAIN][mock_config_entry_hub.entry_id]
+    scene_2 = hub.scenes[1]
+    scene_2_entities = list(hub._scene_entities[scene_2])
+
+    hass.states.async_set(
+        "scene.test_scene_3", "scening", {"friendly_name": "Test Scene 3", "id": "1003"}
+    )
+    with open(mock_scenes_yaml, "w") as f:
+        f.write(
+            "- id: '1002'\n"
+            "  name: Test Scene 2\n"
+            "  entities:\n"
+            "    light.living_room:\n"
+            "      state: 'on'\n"
+            "      brightness: 64\n"
+            "    cover.blinds:\n"
+            "      state: 'open'\n"
+            "      current_position: 75\n"
+            "- id: '1003'\n"
+            "  name: Test Scene 3\n"
+            "  entities:\n"
+            "    light.kitchen:\n"
+            "      state: 'on'\n"
+        )
+
+    await async_reload_entry(hass, mock_config_entry_hub)
+    await hass.async_block_till_done()
+
+    assert hass.data[DOMAIN][mock_config_entry_hub.entry_id] is hub
+    assert [scene.name for scene in hub.scenes] == ["Test Scene 2", "Test Scene 3"]
+
+    # The changed scene is patched in place and keeps its entities
+    assert hub.scenes[0] is scene_2
+    assert scene_2.entities["light.living_room"]["brightness"] == 64
+    assert hub._scene_entities[scene_2] == scene_2_entities
+    assert hub.get_scene("scene.test_scene_1") is None
+    assert hub.get_scene("scene.test_scene_3") is hub.scenes[1]
+    assert hub.index_size == 3
+
+    er = entity_registry.async_get(hass)
+    assert er.async_get_entity_id("switch", DOMAIN, "stateful_1001") is None
+    assert er.async_get_entity_id("switch", DOMAIN, "stateful_1002") is not None
+    assert er.async_get_entity_id("switch", DOMAIN, "stateful_1003") is not None
+
+
+async def test_entry_update_keeps_hub(
+    hass: HomeAssistant, mock_config_entry_hub: MockConfigEntry, mock_scene_entities
+):
+    """Test an update that only changes command limits keeps the hub."""
+    await hass.config_entries.async_setup(mock_config_entry_hub.entry_id)
+    await hass.async_block_till_done()
+    hub = hass.data[DOMAIN][mock_config_entry_hub.entry_id]
+
+    hass.config_entries.async_update_entry(
+        mock_config_entry_hub,
+        data={**mock_config_entry_hub.data, CONF_COMMAND_RATE: 5.0},
+    )
+    await hass.async_block_till_done()
+
+    assert hass.data[DOMAIN][mock_config_entry_hub.entry_id] is hub
+    assert hub.command_scheduler.get_diagnostics()["rate"] == 5.0
+
+
+async def test_entry_update_of_hub_setting_reloads(
+    hass: HomeAssistant, mock_config_entry_hub: MockConfigEntry, mock_scene_entities
+):
+    """Test an update of a setting the scenes are created with reloads."""
+    await hass.config_entries.async_setup(mock_config_entry_hub.entry_id)
+    await hass.async_block_till_done()
+    hub = hass.data[DOMAIN][mock_config_entry_hub.entry_id]
+
+    hass.config_entries.async_update_entry(
+        mock_config_entry_hub,
+        data={**mock_config_entry_hub.data, CONF_TRANSITION_TIME: 3.0},
+    )
+    await hass.async_block_till_done()
+
+    new_hub = hass.data[DOMAIN][mock_config_entry_hub.entry_id]
+    assert new_hub is not hub
+    assert new_hub.settings[CONF_TRANSITION_TIME] == 3.0
+
+
 async def test_load_scenes_file_success(hass: HomeAssistant, mock_scenes_yaml):
     """Test loading a valid scenes file."""
     scenes = await load_scenes_file(hass, "scenes.yaml")
@@ -130,6 +248,123 @@ async def test_load_scenes_file_not_a_list(hass: HomeAssistant):
         await load_scenes_file(hass, "notlist.yaml")
 
 
+async def test_load_scenes_file_large_off_event_loop(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+):
+    """Test a large scenes file is parsed in the executor."""
+    path = os.path.join(hass.config.config_dir, "large_scenes.yaml")
+    with open(path, "w") as f:
+        for i in range(5000):
+            f.write(
+                f"- id: '{i}'\n"
+                f"  name: Scene {i}\n"
+                "  entities:\n"
+                f"    light.light_{i % 300}:\n"
+                "      state: 'on'\n"
+                f"      brightness: {i % 256}\n"
+                "      rgb_color: [255, 120, 0]\n"
+                f"    cover.cover_{i % 50}:\n"
+                "      state: open\n"
+                "      current_position: 75\n"
+            )
+
+    parse_threads = []
+    original_load = yaml.load
+
+    def _record_thread(*args, **kwargs):
+        parse_threads.append(threading.get_ident())
+        return original_load(*args, **kwargs)
+
+    caplog.set_level(logging.DEBUG, logger="custom_components.stateful_scenes")
+    with patch("custom_components.stateful_scenes.yaml.load", _record_thread):
+        scenes = await load_scenes_file(hass, "large_scenes.yaml")
+
+    assert len(scenes) == 5000
+    assert scenes[4999]["entities"]["light.light_199"]["brightness"] == 4999 % 256
+    assert parse_threads
+    assert threading.get_ident() not in parse_threads
+    assert "in the executor" in caplog.text
+
+
+async def test_load_scene_confs_logs_event_loop_time(
+    hass: HomeAssistant, mock_scenes_yaml, caplog: pytest.LogCaptureFixture
+):
+    """Test the validation on the event loop is timed."""
+    caplog.set_level(logging.DEBUG, logger="custom_components.stateful_scenes")
+    await async_load_scene_confs(hass, "scenes.yaml")
+
+    assert "Validated 2 scenes" in caplog.text
+    assert "on the event loop" in caplog.text
+
+
+async def test_load_scene_confs_cached(hass: HomeAssistant, mock_scenes_yaml):
+    """Test an unchanged scenes file is not parsed again."""
+    scene_confs = await async_load_scene_confs(hass, "scenes.yaml")
+    assert [conf["name"] for conf in scene_confs] == ["Test Scene 1", "Test Scene 2"]
+
+    with patch(
+        "custom_components.stateful_scenes.yaml.load",
+        side_effect=AssertionError("scenes file parsed again"),
+    ):
+        assert await async_load_scene_confs(hass, "scenes.yaml") == scene_confs
+
+    # The cache survives a restart through its store
+    hass.data.pop(DATA_SCENE_CACHE)
+    with patch(
+        "custom_components.stateful_scenes.yaml.load",
+        side_effect=AssertionError("scenes file parsed again"),
+    ):
+        assert await async_load_scene_confs(hass, "scenes.yaml") == scene_confs
+
+
+async def test_load_scene_confs_cached_copies(hass: HomeAssistant, mock_scenes_yaml):
+    """Test changing loaded scene configurations does not change the cache."""
+    scene_confs = await async_load_scene_confs(hass, "scenes.yaml")
+    scene_confs[0]["name"] = "Changed"
+    scene_confs.pop()
+
+    scene_confs = await async_load_scene_confs(hass, "scenes.yaml")
+    assert [conf["name"] for conf in scene_confs] == ["Test Scene 1", "Test Scene 2"]
+
+
+async def test_scene_cache_loads_store_once(hass: HomeAssistant):
+    """Test concurrent reads of the scene cache load its store once."""
+    cache = SceneConfigCache(hass)
+    loads = 0
+
+    async def _async_load():
+        nonlocal loads
+        loads += 1
+        await asyncio.sleep(0)
+        return {}
+
+    with patch.object(cache._store, "async_load", side_effect=_async_load):
+        results = await asyncio.gather(
+            cache.async_get("a.yaml"), cache.async_get("b.yaml")
+        )
+
+    assert results == [(None, None), (None, None)]
+    assert loads == 1
+
+
+async def test_load_scene_confs_changed_file(hass: HomeAssistant, mock_scenes_yaml):
+    """Test a changed scenes file is parsed and validated again."""
+    await async_load_scene_confs(hass, "scenes.yaml")
+
+    with open(mock_scenes_yaml, "w") as f:
+        f.write(
+            "- id: '3'\n"
+            "  name: Changed Scene\n"
+            "  entities:\n"
+            "    light.kitchen:\n"
+            "      state: 'on'\n"
+        )
+
+    scene_confs = await async_load_scene_confs(hass, "scenes.yaml")
+    assert [conf["name"] for conf in scene_confs] == ["Changed Scene"]
+    assert scene_confs[0]["id"] == "3"
+
+
 async def test_async_remove_entry_cleans_up_entities_and_devices(
     hass: HomeAssistant,
     mock_config_entry_external: MockConfigEntry,
@@ -0,0 +1,90 @@
+"""Tests for compiled entity matchers."""
+
+from __future__ import annotations
+
+import pytest
+from homeassistant.core import HomeAssistant, State
+
+from custom_components.stateful_scenes.matchers import EntityMatcher, compile_value
+from custom_components.stateful_scenes.StatefulScenes import Scene
+
+from .const import SCENE_CONF_MINIMAL
+
+VALUE_CASES = [
+    ("on", "ON"),
+    ("on", "off"),
+    ("on", 1),
+    (100, 101),
+    (100, 102),
+    (100.0, 100.5),
+    (True, False),
+    ([255, 0, 0], (255, 0, 1)),
+    ([255, 0, 0], [255, 0, 5]),
+    ({"a": 1}, {"a": 1, "b": 2}),
+    ({"a": 1}, {"b": 1}),
+    ({"a": "on"}, {"a": "off"}),
+    (None, None),
+    (None, "on"),
+    ("on", None),
+    (5, "5"),
+]
+
+
+@pytest.mark.parametrize(("desired", "actual"), VALUE_CASES)
+async def test_compile_value_matches_compare_values(
+    hass: HomeAssistant, desired, actual
+):
+    """Test compiled values agree with Scene.compare_values."""
+    scene = Scene(hass, SCENE_CONF_MINIMAL)
+    matches = compile_value(desired, scene.number_tolerance)
+    assert matches(actual) is scene.compare_values(desired, actual)
+
+
+async def test_entity_matcher_state_and_attributes():
+    """Test state and attribute matching of a light."""
+    matcher = EntityMatcher(
+        "light.test", {"state": "on", "brightness": 255, "rgb_color": [255, 0, 0]}, 1
+    )
+    assert matcher.match(
+        State("light.test", "on", {"brightness": 254, "rgb_color": (255, 0, 0)})
+    )
+    assert not matcher.match(State("light.test", "on", {"brightness": 100}))
+    assert not matcher.match(State("light.test", "off", {}))
+    # Attributes missing from the state are not checked
+    assert matcher.match(State("light.test", "on", {}))
+
+
+async def test_entity_matcher_off_ignores_attributes():
+    """Test attributes are not checked when both states are off."""
+    matcher = EntityMatcher("light.test", {"state": "off", "brightness": 255}, 1)
+    assert matcher.match(State("light.test", "off", {"brightness": 0}))
+
+
+async def test_entity_matcher_flags():
+    """Test the ignore flags and don't care states."""
+    spec = {"state": "on", "brightness": 255}
+    unavailable = State("light.test", "unavailable", {})
+    dim = State("light.test", "on", {"brightness": 10})
+
+    assert EntityMatcher("light.test", spec, 1).match(unavailable) is False
+    assert (
+        EntityMatcher("light.test", spec, 1, ignore_unavailable=True).match(unavailable)
+        is None
+    )
+    assert EntityMatcher("light.test", spec, 1, ignore_attributes=True).match(dim)
+    assert EntityMatcher("light.test", {"state": None}, 1).match(dim) is None
+
+
+async def test_scene_rebuilds_matchers_on_tolerance_change(hass: HomeAssistant):
+    """Test the scene recompiles its matchers when the tolerance changes."""
+    conf = {
+        **SCENE_CONF_MINIMAL,
+        "entities": {"light.test_light": {"state": "on", "brightness": 100}},
+    }
+    scene = Scene(hass, conf)
+    hass.states.async_set("light.test_light", "on", {"brightness": 103})
+    state = hass.states.get("light.test_light")
+
+    assert await scene.async_check_state("light.test_light", state) is False
+    scene.set_number_tolerance(5)
+    assert await scene.async_check_state("light.test_light", state) is True
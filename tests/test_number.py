@@ -70,6 +70,33 @@ async def test_debounce_number_set_value(
         assert scene.debounce_time == 2.5
 
 
+async def test_coalesce_window_number_set_value(
+    hass: HomeAssistant,
+    mock_config_entry_external: MockConfigEntry,
+    mock_light_entities,
+):
+    """Test setting the coalesce window via number entity."""
+    await hass.config_entries.async_setup(mock_config_entry_external.entry_id)
+    await hass.async_block_till_done()
+
+    coalesce_numbers = [
+        eid for eid in hass.states.async_entity_ids("number") if "coalesce" in eid
+    ]
+    assert coalesce_numbers
+
+    await hass.services.async_call(
+        "number",
+        "set_value",
+        {"entity_id": coalesce_numbers[0], "value": 0.5},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+
+    scene = hass.data[DOMAIN][mock_config_entry_external.entry_id]
+    assert scene.coalesce_window == 0.5
+    assert hass.states.get(coalesce_numbers[0]).state == "0.5"
+
+
 async def test_tolerance_number_set_value(
     hass: HomeAssistant,
     mock_config_entry_external: MockConfigEntry,
@@ -77,6 +77,30 @@ async def test_select_change_off_scene(
         assert DEFAULT_OFF_SCENE_ENTITY_ID in options
 
 
+async def test_select_follows_scene_settings(
+    hass: HomeAssistant,
+    mock_config_entry_hub: MockConfigEntry,
+    mock_scene_entities,
+):
+    """Test the select writes its state when the scene settings change."""
+    await hass.config_entries.async_setup(mock_config_entry_hub.entry_id)
+    await hass.async_block_till_done()
+
+    entity_id = er.async_get(hass).async_get_entity_id(
+        "select", DOMAIN, "1001_off_scene"
+    )
+    scene = hass.data[DOMAIN][mock_config_entry_hub.entry_id].scenes[0]
+
+    scene.set_restore_on_deactivate(False)
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state != "unavailable"
+
+    scene.set_off_scene("scene.test_scene_2")
+    await hass.async_block_till_done()
+    state = hass.states.get(entity_id)
+    assert state.attributes["off_scene_entity_id"] == "scene.test_scene_2"
+
+
 async def test_select_available_with_special_chars_in_name(
     hass: HomeAssistant,
     mock_light_entities,
@@ -0,0 +1,183 @@
+"""Tests for the services of Stateful Scenes."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.stateful_scenes.const import DOMAIN
+from custom_components.stateful_scenes.services import SERVICE_ACTIVATE_MANY
+from custom_components.stateful_scenes.StatefulScenes import Hub
+
+from .const import SCENE_YAML_RAW
+
+
+def _scene_calls(service_calls: list[ServiceCall]) -> list[ServiceCall]:
+    """Return the calls of the scene domain."""
+    return [call for call in service_calls if call.domain == "scene"]
+
+
+async def test_activate_scenes_merges_payloads(
+    hass: HomeAssistant,
+    service_calls: list[ServiceCall],
+    mock_scene_entities,
+    mock_light_entities,
+):
+    """Test later scenes win on shared entities in a single scene.apply."""
+    hub = Hub(hass, SCENE_YAML_RAW, number_tolerance=1)
+    scene_1, scene_2 = hub.scenes
+
+    await hub.async_activate_scenes([scene_1, scene_2], transition=2)
+    await hass.async_block_till_done()
+
+    calls = _scene_calls(service_calls)
+    assert len(calls) == 1
+    assert calls[0].service == "apply"
+    assert calls[0].data["transition"] == 2
+    assert calls[0].data["entities"] == {
+        "light.living_room": {"state": "on", "brightness": 128},
+        "light.bedroom": {"state": "off"},
+        "cover.blinds": {"state": "open", "current_position": 75},
+    }
+    assert scene_1.is_on
+    assert scene_2.is_on
+    assert hub.stats["merged_activations"] == 1
+
+    # Both scenes restore from the same snapshot
+    assert (
+        scene_1.restore_states["light.living_room"]
+        is scene_2.restore_states["light.living_room"]
+    )
+    assert scene_1.is_own_context(calls[0].context)
+    assert scene_2.is_own_context(calls[0].context)
+
+
+async def test_activate_scenes_keeps_attributes_and_skips_dont_care(
+    hass: HomeAssistant, service_calls: list[ServiceCall]
+):
+    """Test unchecked attributes are applied and None states are left out."""
+    scene_confs = [
+        {
+            "id": "evening",
+            "name": "Evening",
+            "entities": {
+                "light.living_room": {"state": "on", "brightness": 100},
+                "light.hallway": {"state": "on", "color_temp_kelvin": 2700},
+            },
+        },
+        {
+            "id": "reading",
+            "name": "Reading",
+            "entities": {
+                "light.living_room": {"state": None},
+                "light.desk": {
+                    "state": "on",
+                    "brightness": 255,
+                    "color_temp_kelvin": 4000,
+                },
+            },
+        },
+    ]
+    hub = Hub(hass, scene_confs, number_tolerance=1)
+
+    await hub.async_activate_scenes(hub.scenes)
+    await hass.async_block_till_done()
+
+    calls = _scene_calls(service_calls)
+    assert len(calls) == 1
+    assert calls[0].data["entities"] == {
+        "light.living_room": {"state": "on", "brightness": 100},
+        "light.hallway": {"state": "on", "color_temp_kelvin": 2700},
+        "light.desk": {"state": "on", "brightness": 255, "color_temp_kelvin": 4000},
+    }
+
+
+async def test_turn_on_in_same_iteration_is_coalesced(
+    hass: HomeAssistant,
+    service_calls: list[ServiceCall],
+    mock_scene_entities,
+    mock_light_entities,
+):
+    """Test scenes turned on together are activated with one call."""
+    hub = Hub(hass, SCENE_YAML_RAW, number_tolerance=1)
+    scene_1, scene_2 = hub.scenes
+
+    await asyncio.gather(scene_1.async_turn_on(), scene_2.async_turn_on())
+    await hass.async_block_till_done()
+
+    calls = _scene_calls(service_calls)
+    assert [(call.service, len(call.data["entities"])) for call in calls] == [
+        ("apply", 3)
+    ]
+    assert hub.stats["coalesced_activations"] == 2
+
+
+async def test_turn_on_alone_activates_scene(
+    hass: HomeAssistant,
+    service_calls: list[ServiceCall],
+    mock_scene_entities,
+    mock_light_entities,
+):
+    """Test a scene turned on by itself turns on its scene entity."""
+    hub = Hub(hass, SCENE_YAML_RAW, number_tolerance=1)
+
+    await hub.scenes[0].async_turn_on()
+    await hass.async_block_till_done()
+
+    calls = _scene_calls(service_calls)
+    assert len(calls) == 1
+    assert calls[0].service == "turn_on"
+    assert hub.stats["coalesced_activations"] == 0
+
+
+async def test_activate_many_service(
+    hass: HomeAssistant,
+    service_calls: list[ServiceCall],
+    mock_config_entry_hub: MockConfigEntry,
+    mock_scene_entities,
+    mock_light_entities,
+):
+    """Test the service activates the listed scenes and switches in order."""
+    await hass.config_entries.async_setup(mock_config_entry_hub.entry_id)
+    await hass.async_block_till_done()
+    hub = hass.data[DOMAIN][mock_config_entry_hub.entry_id]
+    switch_1 = er.async_get(hass).async_get_entity_id("switch", DOMAIN, "stateful_1001")
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_ACTIVATE_MANY,
+        {"scenes": ["scene.test_scene_2", switch_1]},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+
+    calls = _scene_calls(service_calls)
+    assert len(calls) == 1
+    assert calls[0].data["entities"]["light.living_room"] == {
+        "state": "on",
+        "brightness": 255,
+    }
+    assert all(scene.is_on for scene in hub.scenes)
+
+
+async def test_activate_many_unknown_scene(
+    hass: HomeAssistant,
+    mock_config_entry_hub: MockConfigEntry,
+    mock_scene_entities,
+):
+    """Test the service rejects entities that are not Stateful Scenes."""
+    await hass.config_entries.async_setup(mock_config_entry_hub.entry_id)
+    await hass.async_block_till_done()
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_ACTIVATE_MANY,
+            {"scenes": ["scene.does_not_exist"]},
+            blocking=True,
+        )
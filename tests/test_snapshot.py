@@ -0,0 +1,119 @@
+"""Tests for compact entity snapshots."""
+
+from __future__ import annotations
+
+import gc
+import tracemalloc
+from collections.abc import Callable
+
+from homeassistant.core import HomeAssistant, State
+
+from custom_components.stateful_scenes.snapshot import EntitySnapshot
+from custom_components.stateful_scenes.StatefulScenes import Scene
+
+from .const import SCENE_CONF_FULL
+
+ENTITIES_PER_SCENE = 40
+
+
+def _light_state(index: int) -> State:
+    """Return a light state with the attributes a real light reports."""
+    return State(
+        f"light.light_{index}",
+        "on",
+        {
+            "brightness": 200,
+            "rgb_color": (255, index % 256, 0),
+            "effect": None,
+            "color_mode": "rgb",
+            "supported_color_modes": ["color_temp", "rgb"],
+            "effect_list": ["colorloop", "random", "none"],
+            "min_mireds": 153,
+            "max_mireds": 500,
+            "friendly_name": f"Light {index}",
+            "supported_features": 44,
+        },
+    )
+
+
+def _traced_size(build: Callable[[], list]) -> int:
+    """Return the memory retained by the result of build."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        retained = build()
+        gc.collect()
+        size = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    del retained
+    return size
+
+
+def test_snapshot_keeps_checked_attributes():
+    """Test only the state and the checked attributes are kept."""
+    snapshot = EntitySnapshot.from_state(_light_state(1))
+
+    assert snapshot.domain == "light"
+    assert snapshot.state == "on"
+    assert snapshot.attributes == {
+        "brightness": 200,
+        "rgb_color": (255, 1, 0),
+        "effect": None,
+    }
+    assert not hasattr(snapshot, "__dict__")
+    assert snapshot == EntitySnapshot.from_state(_light_state(1))
+    assert snapshot != EntitySnapshot.from_state(_light_state(2))
+
+
+def test_snapshot_of_unchecked_domain():
+    """Test domains without checked attributes only keep their state."""
+    snapshot = EntitySnapshot.from_state(State("switch.plug", "on", {"power": 5}))
+
+    assert snapshot.state == "on"
+    assert snapshot.attributes == {}
+
+
+def test_snapshot_footprint_per_scene():
+    """Test the snapshots of a scene take a fraction of the memory of States."""
+    full = _traced_size(
+        lambda: [_light_state(index) for index in range(ENTITIES_PER_SCENE)]
+    )
+    compact = _traced_size(
+        lambda: [
+            EntitySnapshot.from_state(_light_state(index))
+            for index in range(ENTITIES_PER_SCENE)
+        ]
+    )
+
+    assert compact * 4 < full, f"{compact} bytes per scene, {full} with States"
+    assert compact / ENTITIES_PER_SCENE < 400
+
+
+async def test_scene_stores_snapshots(hass: HomeAssistant, mock_light_entities):
+    """Test a scene stores snapshots instead of States."""
+    scene = Scene(hass, SCENE_CONF_FULL)
+
+    await scene.async_store_entity_state("light.living_room")
+    await scene.async_store_entity_state("light.bedroom")
+
+    snapshot = scene.restore_states["light.living_room"]
+    assert isinstance(snapshot, EntitySnapshot)
+    assert snapshot.attributes == {"brightness": 255}
+    assert scene.restore_states["light.bedroom"].state == "off"
+    assert scene.restore_states["cover.blinds"] is None
+
+
+def test_snapshot_dict_round_trip():
+    """Test a snapshot survives serialization for the state store."""
+    snapshot = EntitySnapshot.from_state(_light_state(7))
+
+    restored = EntitySnapshot.from_dict(snapshot.as_dict())
+
+    assert restored == snapshot
+    assert restored.attributes == {
+        "brightness": 200,
+        "effect": None,
+        "rgb_color": (255, 7, 0),
+    }
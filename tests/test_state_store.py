@@ -0,0 +1,125 @@
+"""Tests for the persisted scene status and restore snapshots."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.stateful_scenes.state_store import (
+    SAVE_DELAY,
+    STORAGE_VERSION,
+    HubStateStore,
+)
+from custom_components.stateful_scenes.StatefulScenes import Hub
+
+from .const import SCENE_YAML_RAW
+
+STORAGE_KEY = "stateful_scenes.state.test_entry"
+
+
+async def test_hub_starts_from_persisted_data(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    service_calls: list[ServiceCall],
+    mock_light_entities,
+):
+    """Test scenes start with their persisted status and restore snapshots."""
+    hass_storage[STORAGE_KEY] = {
+        "version": STORAGE_VERSION,
+        "key": STORAGE_KEY,
+        "data": {
+            "scenes": {
+                "1001": {
+                    "is_on": True,
+                    "snapshots": {
+                        "light.living_room": {
+                            "domain": "light",
+                            "state": "on",
+                            "attributes": {"brightness": 100},
+                        },
+                    },
+                },
+            },
+        },
+    }
+    state_store = HubStateStore(hass, "test_entry")
+    await state_store.async_load()
+
+    hub = Hub(hass, SCENE_YAML_RAW, number_tolerance=1, state_store=state_store)
+    scene_1, scene_2 = hub.scenes
+
+    assert scene_1.is_on is True
+    assert scene_2.is_on is False
+    # Snapshots are only decoded when the scene restores
+    assert scene_1.restore_states["light.living_room"] is None
+
+    await scene_1.async_restore()
+    await hass.async_block_till_done()
+
+    assert len(service_calls) == 1
+    assert service_calls[0].domain == "light"
+    assert service_calls[0].service == "turn_on"
+    assert service_calls[0].data["entity_id"] == ["light.living_room"]
+    assert service_calls[0].data["brightness"] == 100
+
+
+async def test_hub_saves_after_delay(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_scene_entities,
+    mock_light_entities,
+):
+    """Test changes are written together once the save delay has passed."""
+    state_store = HubStateStore(hass, "test_entry")
+    await state_store.async_load()
+    hub = Hub(hass, SCENE_YAML_RAW, number_tolerance=1, state_store=state_store)
+    scene_1, scene_2 = hub.scenes
+
+    await scene_1.async_snapshot_entities()
+    await scene_2.async_snapshot_entities()
+    assert STORAGE_KEY not in hass_storage
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=SAVE_DELAY))
+    await hass.async_block_till_done()
+
+    scenes = hass_storage[STORAGE_KEY]["data"]["scenes"]
+    assert scenes["1001"] == {
+        "is_on": False,
+        "snapshots": {
+            "light.living_room": {
+                "domain": "light",
+                "state": "on",
+                "attributes": {"brightness": 255},
+            },
+            "light.bedroom": {"domain": "light", "state": "off", "attributes": {}},
+        },
+    }
+    assert list(scenes["1002"]["snapshots"]) == ["light.living_room"]
+
+
+async def test_steady_changes_do_not_postpone_save(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_scene_entities,
+    mock_light_entities,
+):
+    """Test the save delay is not restarted by changes while a save is pending."""
+    state_store = HubStateStore(hass, "test_entry")
+    await state_store.async_load()
+    hub = Hub(hass, SCENE_YAML_RAW, number_tolerance=1, state_store=state_store)
+    now = dt_util.utcnow()
+
+    hub.async_schedule_save()
+    async_fire_time_changed(hass, now + timedelta(seconds=SAVE_DELAY - 1))
+    await hass.async_block_till_done()
+    hub.async_schedule_save()
+    assert STORAGE_KEY not in hass_storage
+
+    async_fire_time_changed(hass, now + timedelta(seconds=SAVE_DELAY))
+    await hass.async_block_till_done()
+
+    assert STORAGE_KEY in hass_storage
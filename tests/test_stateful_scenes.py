@@ -2,16 +2,20 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import Context, Event, HomeAssistant, ServiceCall
+from homeassistant.helpers import area_registry as ar, entity_registry as er
+from homeassistant.helpers.event import async_call_later
 
 from custom_components.stateful_scenes.const import StatefulScenesYamlInvalid
 from custom_components.stateful_scenes.StatefulScenes import (
     Hub,
     Scene,
     SceneEvaluationTimer,
+    SceneTimerWheel,
 )
 
 from .const import (
@@ -209,6 +213,208 @@ class TestSceneStateChecking:
         assert result is True
 
 
+# --- Incremental evaluation tests ---
+
+
+class TestIncrementalEvaluation:
+    """Tests for incremental scene evaluation."""
+
+    def _make_scene(self, hass: HomeAssistant) -> Scene:
+        """Create a two-entity scene matching mock_light_entities."""
+        conf = SCENE_CONF_FULL.copy()
+        conf["entities"] = {
+            "light.living_room": {"state": "on", "brightness": 255},
+            "light.bedroom": {"state": "off"},
+        }
+        return Scene(hass, conf)
+
+    async def test_event_rechecks_only_changed_entity(
+        self, hass: HomeAssistant, mock_light_entities
+    ):
+        """Test an evaluation for one entity only re-checks that entity."""
+        scene = self._make_scene(hass)
+        await scene.async_check_all_states()
+        assert scene.is_on is True
+
+        hass.states.async_set("light.bedroom", "on", {})
+        with patch.object(
+            scene, "async_check_state", wraps=scene.async_check_state
+        ) as mock_check:
+            await scene.async_evaluate_scene_state("light.bedroom")
+
+        mock_check.assert_called_once()
+        assert mock_check.call_args.args[0] == "light.bedroom"
+        assert scene.is_on is False
+
+        hass.states.async_set("light.bedroom", "off", {})
+        await scene.async_evaluate_scene_state("light.bedroom")
+        assert scene.is_on is True
+
+    async def test_settings_change_triggers_full_recompute(
+        self, hass: HomeAssistant, mock_light_entities
+    ):
+        """Test changing a comparison setting re-checks every entity."""
+        scene = self._make_scene(hass)
+        await scene.async_check_all_states()
+
+        scene.set_ignore_attributes(True)
+        with patch.object(
+            scene, "async_check_state", wraps=scene.async_check_state
+        ) as mock_check:
+            await scene.async_evaluate_scene_state("light.bedroom")
+
+        assert mock_check.call_count == 2
+
+    async def test_all_ignored_is_off(self, hass: HomeAssistant):
+        """Test a scene whose entities are all ignored is off."""
+        scene = Scene(hass, SCENE_CONF_MINIMAL)
+        scene.set_ignore_unavailable(True)
+        hass.states.async_set("light.test_light", "unavailable", {})
+        await scene.async_check_all_states()
+        assert scene.states["light.test_light"] is None
+        assert scene.is_on is False
+
+
+class TestCoalesceWindow:
+    """Tests for trailing-edge coalescing of member updates."""
+
+    async def _set_brightness(
+        self, hass: HomeAssistant, scene: Scene, brightness: int
+    ) -> None:
+        """Change the living room brightness and pass the event to the scene."""
+        old_state = hass.states.get("light.living_room")
+        hass.states.async_set("light.living_room", "on", {"brightness": brightness})
+        await scene.async_update_callback(
+            Event(
+                "state_changed",
+                {
+                    "entity_id": "light.living_room",
+                    "old_state": old_state,
+                    "new_state": hass.states.get("light.living_room"),
+                },
+            )
+        )
+
+    async def _make_scene(self, hass: HomeAssistant, clock: FakeClock) -> Scene:
+        """Create an evaluated scene with a one second window on a fake clock."""
+        conf = SCENE_CONF_FULL.copy()
+        conf["entities"] = {
+            "light.living_room": {"state": "on", "brightness": 255},
+            "light.bedroom": {"state": "off"},
+        }
+        scene = Scene(hass, conf)
+        scene._timer_wheel = SceneTimerWheel(hass, time_func=clock)
+        await scene.async_check_all_states()
+        scene.set_coalesce_window(1.0)
+        return scene
+
+    async def test_burst_is_evaluated_once_at_trailing_edge(
+        self, hass: HomeAssistant, mock_light_entities
+    ):
+        """Test a burst of updates collapses into one evaluation."""
+        clock = FakeClock()
+        scene = await self._make_scene(hass, clock)
+
+        for brightness in (50, 100, 150):
+            await self._set_brightness(hass, scene, brightness)
+            clock.advance(0.5)
+            await scene._timer_wheel.async_fire_expired()
+
+        assert scene.stats["events"] == 3
+        assert scene.stats["evaluations"] == 0
+        assert scene.is_on is True
+
+        clock.advance(1.0)
+        await scene._timer_wheel.async_fire_expired()
+        assert scene.stats["evaluations"] == 1
+        assert scene.stats["coalesced_evaluations"] == 1
+        assert scene.is_on is False
+
+    async def test_burst_delay_is_bounded(
+        self, hass: HomeAssistant, mock_light_entities
+    ):
+        """Test a continuous stream of updates is evaluated after the max wait."""
+        clock = FakeClock()
+        scene = await self._make_scene(hass, clock)
+
+        for i in range(10):
+            await self._set_brightness(hass, scene, 10 * (i + 1))
+            clock.advance(0.5)
+            await scene._timer_wheel.async_fire_expired()
+            if clock.now < 4.0:
+                assert scene.stats["evaluations"] == 0
+
+        assert scene.stats["evaluations"] == 1
+        await scene.async_shutdown()
+        assert scene._timer_wheel.pending == 0
+
+
+class TestOwnContext:
+    """Tests for recognising state changes caused by the scene itself."""
+
+    async def test_commands_use_own_context(
+        self, hass: HomeAssistant, service_calls: list[ServiceCall], mock_light_entities
+    ):
+        """Test the context of issued commands and their children is recognised."""
+        hass.states.async_set("scene.minimal", "scening", {"id": "minimal_1"})
+        scene = Scene(hass, SCENE_CONF_MINIMAL)
+
+        await scene.async_turn_on()
+
+        context = service_calls[-1].context
+        assert scene.is_own_context(context)
+        assert scene.is_own_context(Context(parent_id=context.id))
+        assert not scene.is_own_context(Context())
+        assert not scene.is_own_context(None)
+
+    async def test_own_changes_are_not_evaluated_one_by_one(
+        self, hass: HomeAssistant, mock_light_entities
+    ):
+        """Test own changes are evaluated once and keep the restore snapshot."""
+        clock = FakeClock()
+        conf = SCENE_CONF_FULL.copy()
+        conf["entities"] = {
+            "light.living_room": {"state": "on", "brightness": 100},
+            "light.bedroom": {"state": "off"},
+        }
+        scene = Scene(hass, conf)
+        scene._timer_wheel = SceneTimerWheel(hass, time_func=clock)
+        await scene.async_check_all_states()
+        await scene.async_store_entity_state("light.living_room")
+        snapshot = scene.restore_states["light.living_room"]
+        context = scene._async_new_context()
+
+        for brightness in (200, 150, 100):
+            old_state = hass.states.get("light.living_room")
+            hass.states.async_set(
+                "light.living_room",
+                "on",
+                {"brightness": brightness},
+                context=Context(parent_id=context.id),
+            )
+            new_state = hass.states.get("light.living_room")
+            await scene.async_update_callback(
+                Event(
+                    "state_changed",
+                    {
+                        "entity_id": "light.living_room",
+                        "old_state": old_state,
+                        "new_state": new_state,
+                    },
+                    context=new_state.context,
+                )
+            )
+
+        assert scene.stats["activation_progress"] == 3
+        assert scene.stats["evaluations"] == 0
+        assert scene.restore_states["light.living_room"] is snapshot
+
+        await scene._timer_wheel.async_fire_expired()
+        assert scene.stats["evaluations"] == 1
+        assert scene.stats["full_evaluations"] == 1
+        assert scene.is_on is True
+
+
 # --- Scene turn on/off tests ---
 
 
@@ -236,10 +442,73 @@ class TestSceneTurnOnOff:
         ]
         assert len(scene_calls) == 1
 
+    async def test_turn_on_minimal_commands_mismatched_entities(
+        self, hass: HomeAssistant, service_calls: list[ServiceCall], mock_light_entities
+    ):
+        """Test minimal activation only applies the entities that differ."""
+        conf = SCENE_CONF_FULL.copy()
+        conf["entities"] = {
+            "light.living_room": {"state": "on", "brightness": 255},
+            "light.bedroom": {"state": "on", "brightness": 100, "rgb_color": None},
+        }
+        scene = Scene(hass, conf)
+        scene.set_minimal_activation(True)
+
+        await scene.async_turn_on()
+
+        assert scene.is_on is True
+        assert [(c.domain, c.service) for c in service_calls] == [("scene", "apply")]
+        assert service_calls[0].data["entities"] == {
+            "light.bedroom": {"state": "on", "brightness": 100}
+        }
+        assert scene.is_own_context(service_calls[0].context)
+        assert scene.stats["commands_saved"] == 1
+
+    async def test_turn_on_minimal_applies_full_configuration(
+        self, hass: HomeAssistant, service_calls: list[ServiceCall], mock_light_entities
+    ):
+        """Test minimal activation applies attributes that are not checked."""
+        conf = SCENE_CONF_FULL.copy()
+        conf["entities"] = {
+            "light.living_room": {"state": "on", "brightness": 255},
+            "light.bedroom": {"state": "on", "brightness": 100},
+        }
+        conf["apply_entities"] = {
+            "light.living_room": {"state": "on", "brightness": 255},
+            "light.bedroom": {"state": "on", "brightness": 100, "color_temp": 300},
+        }
+        scene = Scene(hass, conf)
+        scene.set_minimal_activation(True)
+
+        await scene.async_turn_on()
+
+        assert [(c.domain, c.service) for c in service_calls] == [("scene", "apply")]
+        assert service_calls[0].data["entities"] == {
+            "light.bedroom": {"state": "on", "brightness": 100, "color_temp": 300}
+        }
+
+    async def test_turn_on_minimal_skips_matching_scene(
+        self, hass: HomeAssistant, service_calls: list[ServiceCall], mock_light_entities
+    ):
+        """Test minimal activation sends nothing when every entity matches."""
+        conf = SCENE_CONF_FULL.copy()
+        conf["entities"] = {
+            "light.living_room": {"state": "on", "brightness": 255},
+            "light.bedroom": {"state": "off"},
+        }
+        scene = Scene(hass, conf)
+        scene.set_minimal_activation(True)
+
+        await scene.async_turn_on()
+
+        assert scene.is_on is True
+        assert service_calls == []
+        assert scene.stats["commands_saved"] == 2
+
     async def test_turn_off_restore(
         self, hass: HomeAssistant, service_calls: list[ServiceCall], mock_light_entities
     ):
-        """Test turning off with restore calls scene.apply."""
+        """Test turning off with restore applies the snapshot."""
         hass.states.async_set("light.test_light", "on", {"friendly_name": "Test"})
         scene = Scene(hass, SCENE_CONF_MINIMAL)
         scene.set_restore_on_deactivate(True)
@@ -247,16 +516,67 @@ class TestSceneTurnOnOff:
 
         # Store some entity state
         await scene.async_store_entity_state("light.test_light")
+        hass.states.async_set("light.test_light", "off", {"friendly_name": "Test"})
         service_calls.clear()
 
         await scene.async_turn_off()
 
         assert scene.is_on is False
-        # Should call scene.apply to restore
-        scene_apply_calls = [
-            c for c in service_calls if c.domain == "scene" and c.service == "apply"
+        # Should turn the light back on to restore
+        restore_calls = [
+            c for c in service_calls if c.domain == "light" and c.service == "turn_on"
+        ]
+        assert len(restore_calls) == 1
+
+    async def test_restore_applies_only_changes(
+        self, hass: HomeAssistant, service_calls: list[ServiceCall]
+    ):
+        """Test restoring leaves out entities and attributes that already match."""
+        conf = SCENE_CONF_FULL.copy()
+        conf["entities"] = {
+            "light.living_room": {"state": "on", "brightness": 255},
+            "light.bedroom": {"state": "on", "brightness": 255},
+            "light.hallway": {"state": "on", "brightness": 255},
+        }
+        hass.states.async_set(
+            "light.living_room", "on", {"brightness": 100, "rgb_color": (1, 2, 3)}
+        )
+        hass.states.async_set("light.bedroom", "off")
+        hass.states.async_set("light.hallway", "on", {"brightness": 50})
+        scene = Scene(hass, conf)
+        for entity_id in conf["entities"]:
+            await scene.async_store_entity_state(entity_id)
+
+        hass.states.async_set(
+            "light.living_room", "on", {"brightness": 255, "rgb_color": (1, 2, 3)}
+        )
+        hass.states.async_set("light.bedroom", "on", {"brightness": 255})
+        hass.states.async_set("light.hallway", "on", {"brightness": 51})
+
+        await scene.async_restore()
+
+        assert [(c.domain, c.service) for c in service_calls] == [
+            ("light", "turn_on"),
+            ("light", "turn_off"),
         ]
-        assert len(scene_apply_calls) == 1
+        assert service_calls[0].data["brightness"] == 100
+        assert service_calls[0].data["entity_id"] == ["light.living_room"]
+        assert service_calls[1].data["entity_id"] == ["light.bedroom"]
+        assert scene.stats["service_calls"] == 2
+        assert scene.stats["restore_payload_full"] == 6
+        assert scene.stats["restore_payload_diff"] == 3
+
+    async def test_restore_skips_call_without_changes(
+        self, hass: HomeAssistant, service_calls: list[ServiceCall]
+    ):
+        """Test nothing is applied when every entity matches its snapshot."""
+        hass.states.async_set("light.test_light", "on", {"brightness": 10})
+        scene = Scene(hass, SCENE_CONF_MINIMAL)
+        await scene.async_store_entity_state("light.test_light")
+
+        await scene.async_restore()
+
+        assert service_calls == []
 
     async def test_turn_off_with_off_scene(
         self, hass: HomeAssistant, service_calls: list[ServiceCall]
@@ -279,22 +599,23 @@ class TestSceneTurnOnOff:
     async def test_turn_off_entities(
         self, hass: HomeAssistant, service_calls: list[ServiceCall]
     ):
-        """Test turning off without restore calls homeassistant.turn_off."""
+        """Test turning off without restore turns off the entities per domain."""
         hass.states.async_set("light.test_light", "on", {})
         scene = Scene(hass, SCENE_CONF_MINIMAL)
         scene.set_restore_on_deactivate(False)
+        scene.set_transition_time(2)
         scene._is_on = True
         service_calls.clear()
 
         await scene.async_turn_off()
 
         assert scene.is_on is False
-        ha_calls = [
-            c
-            for c in service_calls
-            if c.domain == "homeassistant" and c.service == "turn_off"
+        off_calls = [
+            c for c in service_calls if c.domain == "light" and c.service == "turn_off"
         ]
-        assert len(ha_calls) == 1
+        assert len(off_calls) == 1
+        assert off_calls[0].data["entity_id"] == ["light.test_light"]
+        assert "transition" not in off_calls[0].data
 
     async def test_turn_off_when_already_off(
         self, hass: HomeAssistant, service_calls: list[ServiceCall]
@@ -463,6 +784,156 @@ class TestSceneEvaluationTimer:
         assert timer.debounce_time == 0.5
 
 
+class FakeClock:
+    """Monotonic clock that only moves when advanced."""
+
+    def __init__(self) -> None:
+        """Start the clock at zero."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        """Move the clock forward."""
+        self.now += seconds
+
+
+class TestSceneTimerWheel:
+    """Tests for SceneTimerWheel driven by a fake clock."""
+
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        """Return a fake clock."""
+        return FakeClock()
+
+    @pytest.fixture
+    def wheel(self, hass: HomeAssistant, clock: FakeClock) -> SceneTimerWheel:
+        """Return a wheel running on the fake clock."""
+        return SceneTimerWheel(hass, time_func=clock)
+
+    async def test_fires_expired_in_deadline_order(
+        self, wheel: SceneTimerWheel, clock: FakeClock
+    ):
+        """Test expired timers fire in one batch, earliest deadline first."""
+        fired = []
+
+        def _action(name):
+            async def _fire(_now):
+                fired.append(name)
+
+            return _fire
+
+        wheel.async_schedule(2.0, _action("second"))
+        wheel.async_schedule(1.0, _action("first"))
+        wheel.async_schedule(5.0, _action("third"))
+
+        clock.advance(1.5)
+        await wheel.async_fire_expired()
+        assert fired == ["first"]
+
+        clock.advance(1.0)
+        await wheel.async_fire_expired()
+        assert fired == ["first", "second"]
+        assert wheel.pending == 1
+
+        clock.advance(10.0)
+        await wheel.async_fire_expired()
+        assert fired == ["first", "second", "third"]
+        assert wheel.pending == 0
+
+    async def test_failing_timer_does_not_stop_batch(
+        self,
+        wheel: SceneTimerWheel,
+        clock: FakeClock,
+        caplog: pytest.LogCaptureFixture,
+    ):
+        """Test an action that raises does not skip the rest of the batch."""
+        failing = AsyncMock(side_effect=RuntimeError("boom"))
+        action = AsyncMock()
+        wheel.async_schedule(1.0, failing)
+        wheel.async_schedule(1.5, action)
+
+        clock.advance(2.0)
+        await wheel.async_fire_expired()
+
+        failing.assert_awaited_once()
+        action.assert_awaited_once()
+        assert "Error running a scene evaluation timer" in caplog.text
+
+    async def test_cancelled_timer_does_not_fire(
+        self, wheel: SceneTimerWheel, clock: FakeClock
+    ):
+        """Test a cancelled timer is skipped."""
+        action = AsyncMock()
+        cancel = wheel.async_schedule(1.0, action)
+        cancel()
+        cancel()
+        assert wheel.pending == 0
+
+        clock.advance(2.0)
+        await wheel.async_fire_expired()
+        action.assert_not_called()
+
+    async def test_single_loop_timer_for_many_scenes(
+        self, hass: HomeAssistant, wheel: SceneTimerWheel, clock: FakeClock
+    ):
+        """Test many scene timers share a single loop timer."""
+        timers = [SceneEvaluationTimer(hass, 1.0, 0.5, wheel) for _ in range(60)]
+        callbacks = [AsyncMock() for _ in timers]
+
+        with patch(
+            "custom_components.stateful_scenes.StatefulScenes.async_call_later",
+            wraps=async_call_later,
+        ) as mock_call_later:
+            for timer, callback in zip(timers, callbacks):
+                await timer.async_start(callback)
+
+        assert mock_call_later.call_count == 1
+        assert wheel.pending == 60
+        assert all(timer.is_active() for timer in timers)
+
+        clock.advance(1.5)
+        await wheel.async_fire_expired()
+        assert all(callback.await_count == 1 for callback in callbacks)
+        assert wheel.pending == 0
+
+    async def test_restart_cancels_previous_timer(
+        self, hass: HomeAssistant, wheel: SceneTimerWheel, clock: FakeClock
+    ):
+        """Test restarting a timer replaces its pending deadline."""
+        timer = SceneEvaluationTimer(hass, 1.0, 0.0, wheel)
+        first = AsyncMock()
+        second = AsyncMock()
+
+        await timer.async_start(first)
+        clock.advance(0.5)
+        await timer.async_start(second)
+        assert wheel.pending == 1
+
+        clock.advance(0.75)
+        await wheel.async_fire_expired()
+        first.assert_not_called()
+        second.assert_not_called()
+
+        clock.advance(0.25)
+        await wheel.async_fire_expired()
+        first.assert_not_called()
+        second.assert_awaited_once()
+
+    async def test_loop_timer_fires(self, hass: HomeAssistant):
+        """Test the loop timer dispatches timers on the real clock."""
+        wheel = SceneTimerWheel(hass)
+        action = AsyncMock()
+        wheel.async_schedule(0, action)
+
+        await asyncio.sleep(0.01)
+        await hass.async_block_till_done()
+        action.assert_awaited_once()
+        assert wheel.pending == 0
+
+
 # --- Hub tests ---
 
 
@@ -546,12 +1017,358 @@ class TestHub:
         scenes = hub.get_available_scenes()
         assert len(scenes) == 2
 
+    async def test_hub_get_scene(self, hass: HomeAssistant, mock_scene_entities):
+        """Test get_scene looks scenes up by entity_id."""
+        hub = Hub(hass, SCENE_YAML_RAW, number_tolerance=1)
+        assert hub.get_scene("scene.test_scene_1") is hub.scenes[0]
+        assert hub.get_scene("scene.test_scene_2") is hub.scenes[1]
+        assert hub.get_scene("scene.unknown") is None
+
+    async def test_hub_resolves_entity_ids_without_scanning(
+        self, hass: HomeAssistant, mock_scene_entities
+    ):
+        """Test scene entity_ids are resolved from the hub index."""
+        with patch(
+            "custom_components.stateful_scenes.StatefulScenes.get_entity_id_from_id"
+        ) as mock_scan:
+            hub = Hub(hass, SCENE_YAML_RAW, number_tolerance=1)
+
+        mock_scan.assert_not_called()
+        assert hub.get_scene_entity_id("1001") == "scene.test_scene_1"
+        assert hub.scenes[1].entity_id == "scene.test_scene_2"
+        assert hub.get_scene_entity_id("9999") is None
+
+    async def test_hub_resolves_icon_and_area(self, hass: HomeAssistant):
+        """Test icon and area are resolved once per scene during construction."""
+        area = ar.async_get(hass).async_create("Living Room")
+        entry = er.async_get(hass).async_get_or_create(
+            "scene", "homeassistant", "1001", suggested_object_id="test_scene_1"
+        )
+        er.async_get(hass).async_update_entity(entry.entity_id, area_id=area.id)
+        hass.states.async_set(
+            entry.entity_id, "scening", {"id": "1001", "icon": "mdi:sofa"}
+        )
+
+        with patch(
+            "custom_components.stateful_scenes.StatefulScenes.area_name"
+        ) as mock_area_name:
+            hub = Hub(hass, SCENE_YAML_RAW, number_tolerance=1)
+
+        mock_area_name.assert_not_called()
+        assert hub.scenes[0].entity_id == entry.entity_id
+        assert hub.scenes[0].icon == "mdi:sofa"
+        assert hub.scenes[0].area_id == "Living Room"
+        assert hub.scenes[1].area_id is None
+        assert not hasattr(hub, "scene_confs")
+
     async def test_hub_number_tolerance(self, hass: HomeAssistant, mock_scene_entities):
         """Test hub passes number tolerance to scenes."""
         hub = Hub(hass, SCENE_YAML_RAW, number_tolerance=5)
         assert hub.scenes[0].number_tolerance == 5
 
 
+# --- Hub entity index tests ---
+
+
+class TestHubEntityIndex:
+    """Tests for the Hub inverted entity index and shared dispatcher."""
+
+    async def test_index_stats(self, hass: HomeAssistant, mock_scene_entities):
+        """Test index size and fan-out statistics."""
+        hub = Hub(hass, SCENE_YAML_RAW, number_tolerance=1)
+
+        assert hub.index_size == 3
+        stats = hub.get_index_stats()
+        assert stats["entities"] == 3
+        assert stats["slots"] == 4
+        assert stats["max_fanout"] == 2
+        assert stats["mean_fanout"] == pytest.approx(4 / 3)
+
+    async def test_index_skips_dont_care_entities(self, hass: HomeAssistant):
+        """Test entities with a None desired state are not indexed."""
+        scene_confs = [
+            {
+                "id": "dont_care_1",
+                "name": "Don't Care Scene",
+                "entities": {
+                    "light.test": {"state": "on"},
+                    "light.dont_care": {"state": None},
+                },
+            },
+        ]
+        hub = Hub(hass, scene_confs, number_tolerance=1)
+
+        assert hub.index_size == 1
+        assert hub.get_index_stats()["slots"] == 1
+
+    async def test_dispatch_routes_to_containing_scenes(
+        self, hass: HomeAssistant, mock_scene_entities
+    ):
+        """Test a state change is only routed to scenes containing the entity."""
+        hub = Hub(hass, SCENE_YAML_RAW, number_tolerance=1)
+        scene_1, scene_2 = hub.scenes
+        scene_1.async_update_callback = AsyncMock()
+        scene_2.async_update_callback = AsyncMock()
+        unsub_1 = hub.async_subscribe_scene(scene_1)
+        unsub_2 = hub.async_subscribe_scene(scene_2)
+        await hub.async_bootstrap()
+
+        hass.states.async_set("cover.blinds", "closed")
+        await hass.async_block_till_done()
+
+        scene_1.async_update_callback.assert_not_called()
+        scene_2.async_update_callback.assert_called_once()
+
+        hass.states.async_set("light.living_room", "off")
+        await hass.async_block_till_done()
+
+        assert scene_1.async_update_callback.call_count == 1
+        assert scene_2.async_update_callback.call_count == 2
+
+        unsub_1()
+        unsub_2()
+        hass.states.async_set("light.living_room", "on")
+        await hass.async_block_till_done()
+
+        assert scene_1.async_update_callback.call_count == 1
+        assert scene_2.async_update_callback.call_count == 2
+
+    async def test_dispatch_drops_unchecked_attribute_updates(
+        self, hass: HomeAssistant, mock_scene_entities, mock_light_entities
+    ):
+        """Test updates of attributes no scene checks do not reach the scenes."""
+        hub = Hub(hass, SCENE_YAML_RAW, number_tolerance=1)
+        scene_1, scene_2 = hub.scenes
+        scene_1.async_update_callback = AsyncMock()
+        scene_2.async_update_callback = AsyncMock()
+        unsub_1 = hub.async_subscribe_scene(scene_1)
+        unsub_2 = hub.async_subscribe_scene(scene_2)
+        await hub.async_bootstrap()
+        stable_states = hub._stable_states
+        hub.async_snapshot_states(scene_1)
+
+        hass.states.async_set(
+            "light.living_room", "on", {"brightness": 255, "color_temp": 370}
+        )
+        await hass.async_block_till_done()
+
+        scene_1.async_update_callback.assert_not_called()
+        scene_2.async_update_callback.assert_not_called()
+        assert hub.stats["events_dropped"] == 1
+        # The shared snapshots are not copied for a dropped update
+        assert hub._stable_states is stable_states
+
+        hass.states.async_set(
+            "light.living_room", "on", {"brightness": 128, "color_temp": 370}
+        )
+        await hass.async_block_till_done()
+
+        scene_1.async_update_callback.assert_called_once()
+        scene_2.async_update_callback.assert_called_once()
+        assert hub.stats["events_dropped"] == 1
+
+        unsub_1()
+        unsub_2()
+
+
+class TestHubSceneActivation:
+    """Tests for detecting activations of the Home Assistant scene entities."""
+
+    async def test_activation_marks_scene_on(
+        self, hass: HomeAssistant, mock_scene_entities, mock_light_entities
+    ):
+        """Test an external activation turns the scene on and suspends evaluation."""
+        hub = Hub(hass, SCENE_YAML_RAW, number_tolerance=1)
+        scene_1, scene_2 = hub.scenes
+        scene_2.set_transition_time(1.0)
+        unsub_1 = hub.async_subscribe_scene(scene_1)
+        unsub_2 = hub.async_subscribe_scene(scene_2)
+        await hub.async_bootstrap()
+        assert scene_2.is_on is False
+
+        hass.states.async_set("scene.test_scene_2", "2026-01-01T00:00:00+00:00")
+        await hass.async_block_till_done()
+
+        assert scene_2.is_on is True
+        assert scene_2.stats["activations"] == 1
+        assert scene_2._scene_evaluation_timer.is_active()
+        assert (
+            scene_2.restore_states["light.living_room"].attributes["brightness"] == 255
+        )
+        assert scene_1.stats["activations"] == 0
+
+        hass.states.async_set("light.living_room", "on", {"brightness": 128})
+        await hass.async_block_till_done()
+        assert scene_2.stats["evaluations"] == 0
+        assert "light.living_room" in scene_2._dirty_entities
+
+        await scene_2.async_shutdown()
+        unsub_1()
+        unsub_2()
+
+    async def test_unavailable_scene_is_not_an_activation(
+        self, hass: HomeAssistant, mock_scene_entities
+    ):
+        """Test a scene entity becoming unavailable is ignored."""
+        hub = Hub(hass, SCENE_YAML_RAW, number_tolerance=1)
+        scene_1 = hub.scenes[0]
+        unsub = hub.async_subscribe_scene(scene_1)
+        await hub.async_bootstrap()
+
+        hass.states.async_set("scene.test_scene_1", "unavailable")
+        await hass.async_block_till_done()
+
+        assert scene_1.stats["activations"] == 0
+        assert scene_1.is_on is False
+        unsub()
+
+
+class TestHubStableStates:
+    """Tests for the restore snapshots shared through the hub."""
+
+    async def test_activation_snapshot_is_shared_until_change(
+        self,
+        hass: HomeAssistant,
+        service_calls: list[ServiceCall],
+        mock_scene_entities,
+        mock_light_entities,
+    ):
+        """Test activation references the hub snapshots and changes copy them."""
+        hub = Hub(hass, SCENE_YAML_RAW, number_tolerance=1)
+        scene_1, scene_2 = hub.scenes
+        unsub_1 = hub.async_subscribe_scene(scene_1)
+        unsub_2 = hub.async_subscribe_scene(scene_2)
+        await hub.async_bootstrap()
+
+        with patch.object(scene_2, "async_store_entity_state") as mock_store:
+            await scene_2.async_turn_on()
+        mock_store.assert_not_called()
+
+        stable_states = hub._stable_states
+        assert scene_2.restore_states.maps[-1] is stable_states
+        assert scene_2.restore_states["light.living_room"].attributes == {
+            "brightness": 255
+        }
+
+        hass.states.async_set("light.living_room", "on", {"brightness": 128})
+        await hass.async_block_till_done()
+
+        assert hub._stable_states is not stable_states
+        assert hub._stable_states["light.living_room"].attributes == {"brightness": 128}
+        assert scene_2.restore_states["light.living_room"].attributes == {
+            "brightness": 255
+        }
+        assert hub.stats["stable_state_copies"] == 1
+
+        unsub_1()
+        unsub_2()
+
+    async def test_unavailable_states_are_not_recorded(
+        self, hass: HomeAssistant, mock_scene_entities, mock_light_entities
+    ):
+        """Test an entity going unavailable keeps its last restorable state."""
+        hub = Hub(hass, SCENE_YAML_RAW, number_tolerance=1)
+        unsub = hub.async_subscribe_scene(hub.scenes[0])
+        await hub.async_bootstrap()
+
+        hass.states.async_set("light.living_room", "unavailable")
+        await hass.async_block_till_done()
+
+        assert hub._stable_states["light.living_room"].state == "on"
+        unsub()
+
+
+class TestHubBootstrap:
+    """Tests for the hub startup evaluation."""
+
+    async def test_bootstrap_evaluates_each_scene_once(
+        self, hass: HomeAssistant, mock_scene_entities, mock_light_entities
+    ):
+        """Test the bootstrap evaluates every scene exactly once."""
+        hub = Hub(hass, SCENE_YAML_RAW, number_tolerance=1)
+        await hass.async_block_till_done()
+        assert all(scene.stats["full_evaluations"] == 0 for scene in hub.scenes)
+
+        await hub.async_bootstrap()
+        await hub.async_bootstrap()
+
+        assert [scene.stats["full_evaluations"] for scene in hub.scenes] == [1, 1]
+        assert hub.stats["bootstrap_evaluations"] == 2
+        assert hub.scenes[0].is_on is True
+
+    async def test_state_changes_before_bootstrap_are_skipped(
+        self, hass: HomeAssistant, mock_scene_entities
+    ):
+        """Test state changes are not dispatched before the bootstrap."""
+        hub = Hub(hass, SCENE_YAML_RAW, number_tolerance=1)
+        scene_1 = hub.scenes[0]
+        scene_1.async_update_callback = AsyncMock()
+        unsub = hub.async_subscribe_scene(scene_1)
+
+        hass.states.async_set("light.living_room", "off")
+        await hass.async_block_till_done()
+        scene_1.async_update_callback.assert_not_called()
+
+        await hub.async_bootstrap()
+        hass.states.async_set("light.living_room", "on")
+        await hass.async_block_till_done()
+        scene_1.async_update_callback.assert_called_once()
+        unsub()
+
+
+class TestHubStatePublisher:
+    """Tests for the hub batching and de-duplicating switch state writes."""
+
+    async def test_writes_are_flushed_together(
+        self, hass: HomeAssistant, mock_scene_entities
+    ):
+        """Test writes queued in the same iteration are flushed at once."""
+        hub = Hub(hass, SCENE_YAML_RAW, number_tolerance=1)
+        scene_1, scene_2 = hub.scenes
+        scene_1.schedule_update = MagicMock()
+        scene_2.schedule_update = MagicMock()
+
+        scene_1._is_on = True
+        scene_1.async_publish_state()
+        scene_2.async_publish_state()
+        scene_1.schedule_update.assert_not_called()
+
+        await asyncio.sleep(0)
+        scene_1.schedule_update.assert_called_once()
+        scene_2.schedule_update.assert_called_once()
+        assert hub.stats["state_flushes"] == 1
+        assert hub.stats["state_writes"] == 2
+
+    async def test_unchanged_state_is_not_written(
+        self, hass: HomeAssistant, mock_scene_entities
+    ):
+        """Test a scene whose is_on did not change is not written again."""
+        hub = Hub(hass, SCENE_YAML_RAW, number_tolerance=1)
+        scene = hub.scenes[0]
+        scene.schedule_update = MagicMock()
+        scene.async_publish_state()
+        await asyncio.sleep(0)
+        assert scene.schedule_update.call_count == 1
+
+        scene.async_publish_state()
+        await asyncio.sleep(0)
+        assert scene.schedule_update.call_count == 1
+        assert hub.stats["state_writes_skipped"] == 1
+
+        # A flip that is undone before the flush is not written either
+        scene._is_on = True
+        scene.async_publish_state()
+        scene._is_on = False
+        scene.async_publish_state()
+        await asyncio.sleep(0)
+        assert scene.schedule_update.call_count == 1
+
+        scene._is_on = True
+        scene.async_publish_state()
+        await asyncio.sleep(0)
+        assert scene.schedule_update.call_count == 2
+
+
 # --- Scene learn_scene_states tests ---
 
 
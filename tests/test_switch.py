@@ -5,6 +5,8 @@ from __future__ import annotations
 from unittest.mock import AsyncMock, patch
 
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry
+from homeassistant.helpers.entity_platform import async_get_platforms
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.stateful_scenes.const import DOMAIN
@@ -21,10 +23,11 @@ async def test_switch_setup_hub(
     await hass.config_entries.async_setup(mock_config_entry_hub.entry_id)
     await hass.async_block_till_done()
 
-    # Each scene creates: StatefulSceneSwitch, RestoreOnDeactivate, IgnoreUnavailable, IgnoreAttributes
-    # With 2 scenes, that's 8 switch entities
+    # Each scene creates: StatefulSceneSwitch, RestoreOnDeactivate, IgnoreUnavailable,
+    # IgnoreAttributes, MinimalActivation
+    # With 2 scenes, that's 10 switch entities
     states = hass.states.async_entity_ids("switch")
-    assert len(states) >= 8
+    assert len(states) >= 10
 
 
 async def test_switch_setup_external(
@@ -36,9 +39,10 @@ async def test_switch_setup_external(
     await hass.config_entries.async_setup(mock_config_entry_external.entry_id)
     await hass.async_block_till_done()
 
-    # External scene creates: StatefulSceneSwitch, RestoreOnDeactivate, IgnoreUnavailable, IgnoreAttributes
+    # External scene creates: StatefulSceneSwitch, RestoreOnDeactivate, IgnoreUnavailable,
+    # IgnoreAttributes, MinimalActivation
     states = hass.states.async_entity_ids("switch")
-    assert len(states) >= 4
+    assert len(states) >= 5
 
 
 async def test_switch_turn_on(
@@ -146,6 +150,23 @@ async def test_restore_on_deactivate_switch(
         assert scene.restore_on_deactivate is False
 
 
+async def test_restore_on_deactivate_switch_initial_state(
+    hass: HomeAssistant,
+    mock_config_entry_hub: MockConfigEntry,
+    mock_scene_entities,
+):
+    """Test a new RestoreOnDeactivate switch reports the scene setting."""
+    await hass.config_entries.async_setup(mock_config_entry_hub.entry_id)
+    await hass.async_block_till_done()
+
+    er = entity_registry.async_get(hass)
+    restore = er.async_get_entity_id("switch", DOMAIN, "1001_restore_on_deactivate")
+    scene = hass.data[DOMAIN][mock_config_entry_hub.entry_id].scenes[0]
+
+    expected = "on" if scene.restore_on_deactivate else "off"
+    assert hass.states.get(restore).state == expected
+
+
 async def test_ignore_unavailable_switch(
     hass: HomeAssistant,
     mock_config_entry_external: MockConfigEntry,
@@ -196,3 +217,134 @@ async def test_ignore_attributes_switch(
 
         scene = hass.data[DOMAIN][mock_config_entry_external.entry_id]
         assert scene.ignore_attributes is True
+
+
+async def test_minimal_activation_switch(
+    hass: HomeAssistant,
+    mock_config_entry_external: MockConfigEntry,
+    mock_light_entities,
+):
+    """Test MinimalActivation switch toggles scene property."""
+    await hass.config_entries.async_setup(mock_config_entry_external.entry_id)
+    await hass.async_block_till_done()
+
+    minimal_switches = [
+        eid
+        for eid in hass.states.async_entity_ids("switch")
+        if "minimal_activation" in eid
+    ]
+    assert minimal_switches
+
+    await hass.services.async_call(
+        "switch", "turn_on", {"entity_id": minimal_switches[0]}, blocking=True
+    )
+    await hass.async_block_till_done()
+
+    scene = hass.data[DOMAIN][mock_config_entry_external.entry_id]
+    assert scene.minimal_activation is True
+    assert hass.states.get(minimal_switches[0]).state == "on"
+
+
+async def test_hub_entities_are_not_polled(
+    hass: HomeAssistant,
+    mock_config_entry_hub: MockConfigEntry,
+    mock_scene_entities,
+):
+    """Test no polling timers are registered for a hub."""
+    await hass.config_entries.async_setup(mock_config_entry_hub.entry_id)
+    await hass.async_block_till_done()
+
+    platforms = async_get_platforms(hass, DOMAIN)
+    assert platforms
+    for platform in platforms:
+        assert platform.entities
+        assert not any(entity.should_poll for entity in platform.entities.values())
+        assert platform._async_polling_timer is None
+
+
+async def test_comparison_setting_change_reevaluates_scene(
+    hass: HomeAssistant,
+    mock_config_entry_hub: MockConfigEntry,
+    mock_scene_entities,
+):
+    """Test changing the tolerance recomputes and publishes the scene."""
+    hass.states.async_set("light.living_room", "on", {"brightness": 250})
+    hass.states.async_set("light.bedroom", "off")
+    await hass.config_entries.async_setup(mock_config_entry_hub.entry_id)
+    await hass.async_block_till_done()
+
+    er = entity_registry.async_get(hass)
+    stateful = er.async_get_entity_id("switch", DOMAIN, "stateful_1001")
+    scene = hass.data[DOMAIN][mock_config_entry_hub.entry_id].scenes[0]
+    assert hass.states.get(stateful).state == "off"
+
+    scene.set_number_tolerance(10)
+    await hass.async_block_till_done()
+    assert hass.states.get(stateful).state == "on"
+
+    scene.set_ignore_attributes(True)
+    scene.set_number_tolerance(1)
+    await hass.async_block_till_done()
+    assert hass.states.get(stateful).state == "on"
+
+    scene.set_ignore_attributes(False)
+    await hass.async_block_till_done()
+    assert hass.states.get(stateful).state == "off"
+
+
+async def test_config_entities_push_scene_settings(
+    hass: HomeAssistant,
+    mock_config_entry_hub: MockConfigEntry,
+    mock_scene_entities,
+):
+    """Test config entities write their state when a scene setting changes."""
+    await hass.config_entries.async_setup(mock_config_entry_hub.entry_id)
+    await hass.async_block_till_done()
+
+    er = entity_registry.async_get(hass)
+    ignore_unavailable = er.async_get_entity_id(
+        "switch", DOMAIN, "1001_ignore_unavailable"
+    )
+    transition_time = er.async_get_entity_id("number", DOMAIN, "1001_transition_time")
+    scene = hass.data[DOMAIN][mock_config_entry_hub.entry_id].scenes[0]
+
+    scene.set_ignore_unavailable(True)
+    scene.set_transition_time(2.5)
+    await hass.async_block_till_done()
+
+    assert hass.states.get(ignore_unavailable).state == "on"
+    assert hass.states.get(transition_time).state == "2.5"
+
+    # Setting an off scene disables restoring on deactivation
+    restore = er.async_get_entity_id("switch", DOMAIN, "1001_restore_on_deactivate")
+    scene.set_off_scene("scene.test_scene_2")
+    await hass.async_block_till_done()
+    assert hass.states.get(restore).state == "off"
+
+
+async def test_member_state_change_evaluated_once(
+    hass: HomeAssistant,
+    mock_config_entry_hub: MockConfigEntry,
+    mock_scene_entities,
+    mock_light_entities,
+):
+    """Test each member state change is evaluated exactly once."""
+    await hass.config_entries.async_setup(mock_config_entry_hub.entry_id)
+    await hass.async_block_till_done()
+
+    scene = hass.data[DOMAIN][mock_config_entry_hub.entry_id].scenes[0]
+    switch_entity_id = entity_registry.async_get(hass).async_get_entity_id(
+        "switch", DOMAIN, "stateful_1001"
+    )
+    assert hass.states.get(switch_entity_id).state == "on"
+    assert scene.stats["full_evaluations"] == 1
+
+    hass.states.async_set("light.bedroom", "on")
+    await hass.async_block_till_done()
+    hass.states.async_set("light.bedroom", "off")
+    await hass.async_block_till_done()
+
+    assert scene.stats["events"] == 2
+    assert scene.stats["evaluations"] == 2
+    assert scene.stats["full_evaluations"] == 1
+    assert hass.states.get(switch_entity_id).state == "on"